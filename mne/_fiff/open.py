@@ -2,6 +2,10 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
 from gzip import GzipFile
 from io import SEEK_SET, BytesIO
 from pathlib import Path
@@ -9,7 +13,15 @@ from pathlib import Path
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_fname,
+    _file_like,
+    _validate_type,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -162,6 +174,14 @@ def _fiff_open(fname, fid, preload):
     if tag.kind != FIFF.FIFF_DIR_POINTER:
         raise ValueError(f"{prefix} have a directory pointer")
 
+    #   Try the on-disk cache first (if enabled)
+    cache_fname = _get_tree_cache_fname(fname, fid)
+    if cache_fname is not None:
+        out = _read_tree_cache(cache_fname)
+        if out is not None:
+            fid.seek(0)
+            return (fid,) + out
+
     #   Read or create the directory tree
     logger.debug(f"    Creating tag directory for {fname}...")
 
@@ -192,6 +212,8 @@ def _fiff_open(fname, fid, preload):
             directory.append(tag)
 
     tree, _ = make_dir_tree(fid, directory, indent=1)
+    if cache_fname is not None:
+        _write_tree_cache(cache_fname, tree, directory)
 
     logger.debug("[done]")
 
@@ -201,6 +223,232 @@ def _fiff_open(fname, fid, preload):
     return fid, tree, directory
 
 
+###############################################################################
+# On-disk cache of tag directories and trees
+
+_tree_cache_stats = dict(hits=0, misses=0)
+_TREE_CACHE_SUFFIX = "-fiff-tree.npz"
+_ID_KEYS = ("version", "machid", "secs", "usecs")
+
+
+# MNE_FIFF_CACHE_DIR resolved for the reader running in this thread (if any)
+_tree_cache_scope = threading.local()
+
+
+def _get_tree_cache_dir():
+    cache_dir = get_config("MNE_FIFF_CACHE_DIR")
+    return None if cache_dir is None else Path(cache_dir).expanduser()
+
+
+@contextmanager
+def _fiff_cache_dir_scope():
+    """Resolve the cache directory once for all FIF files opened in the context.
+
+    Readers that open several files (or the same file several times) use this
+    so that the configuration is not read from disk for every fiff_open.
+    """
+    if hasattr(_tree_cache_scope, "cache_dir"):  # nested, already resolved
+        yield
+        return
+    _tree_cache_scope.cache_dir = _get_tree_cache_dir()
+    try:
+        yield
+    finally:
+        del _tree_cache_scope.cache_dir
+
+
+def _get_tree_cache_fname(fname, fid):
+    """Get the cache filename for a FIF file, or None if caching is disabled."""
+    try:
+        cache_dir = _tree_cache_scope.cache_dir
+    except AttributeError:
+        cache_dir = _get_tree_cache_dir()
+    if cache_dir is None or not isinstance(fname, Path):
+        return None
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    # The size and mtime catch most modifications, the header hash (including
+    # the file ID with its creation time) catches files replaced by others
+    fid.seek(0)
+    header = hashlib.sha1(fid.read(4096)).hexdigest()
+    key = f"{fname.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{header}"
+    key = hashlib.sha1(key.encode()).hexdigest()
+    return cache_dir / f"{key}{_TREE_CACHE_SUFFIX}"
+
+
+def _id_to_row(id_):
+    if id_ is None:
+        return [0] * 6
+    return [1, id_["version"], *id_["machid"], id_["secs"], id_["usecs"]]
+
+
+def _row_to_id(row):
+    if not row[0]:
+        return None
+    return dict(
+        version=int(row[1]),
+        machid=np.array(row[2:4], dtype=">i4"),
+        secs=int(row[4]),
+        usecs=int(row[5]),
+    )
+
+
+def _write_tree_cache(cache_fname, tree, directory):
+    """Write the directory and tree to the cache as plain arrays."""
+    _tree_cache_stats["misses"] += 1
+    index = {id(ent): ii for ii, ent in enumerate(directory)}
+    nodes = list()  # (block, parent, id, parent_id, entry indices), depth first
+
+    def _flatten(node, parent):
+        for key in ("id", "parent_id"):
+            if node[key] is not None and (
+                not isinstance(node[key], dict) or set(node[key]) != set(_ID_KEYS)
+            ):
+                raise ValueError(f"Cannot cache {key} {node[key]}")
+        ents = [index[id(ent)] for ent in node["directory"] or []]
+        nodes.append((node["block"], parent, node["id"], node["parent_id"], ents))
+        this = len(nodes) - 1
+        for child in node["children"]:
+            _flatten(child, this)
+
+    try:
+        _flatten(tree, -1)
+    except (KeyError, ValueError):  # something unusual, don't cache it
+        logger.debug("    Could not cache tree for unusual FIF file")
+        return
+    arrays = dict(
+        directory=np.array(
+            [[ent.kind, ent.type, ent.size, ent.next, ent.pos] for ent in directory],
+            np.int64,
+        ).reshape(-1, 5),
+        block=np.array([node[0] for node in nodes], np.int64),
+        parent=np.array([node[1] for node in nodes], np.int64),
+        id=np.array([_id_to_row(node[2]) for node in nodes], np.int64),
+        parent_id=np.array([_id_to_row(node[3]) for node in nodes], np.int64),
+        ents=np.array(sum((node[4] for node in nodes), []), np.int64),
+        n_ents=np.array([len(node[4]) for node in nodes], np.int64),
+    )
+    tmp_fname = cache_fname.with_name(f"{cache_fname.name}.{os.getpid()}.tmp")
+    try:
+        cache_fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(fid, **arrays)
+        os.replace(tmp_fname, cache_fname)
+    except OSError as exc:
+        warn(f"Could not write FIF cache file {cache_fname}: {exc}")
+        tmp_fname.unlink(missing_ok=True)
+    else:
+        logger.debug(f"    Wrote FIF tree cache {cache_fname}")
+
+
+def _read_tree_cache(cache_fname):
+    """Read the tree and directory from the cache, returning None on failure."""
+    try:
+        with np.load(cache_fname, allow_pickle=False) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+        directory = [Tag(*row) for row in arrays["directory"].tolist()]
+        nodes = list()
+        offsets = np.concatenate([[0], np.cumsum(arrays["n_ents"])])
+        for ni, (block, parent) in enumerate(zip(arrays["block"], arrays["parent"])):
+            ents = [
+                directory[ei] for ei in arrays["ents"][offsets[ni] : offsets[ni + 1]]
+            ]
+            node = dict(
+                block=int(block),
+                id=_row_to_id(arrays["id"][ni]),
+                parent_id=_row_to_id(arrays["parent_id"][ni]),
+                nent=len(ents),
+                nchild=0,
+                directory=ents if len(ents) else None,
+                children=[],
+            )
+            if parent >= 0:
+                nodes[parent]["children"].append(node)
+                nodes[parent]["nchild"] += 1
+            nodes.append(node)
+        tree = nodes[0]
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # corrupted, from an old version, etc.
+        logger.debug(f"    Ignoring unreadable FIF cache {cache_fname}: {exc}")
+        return None
+    _tree_cache_stats["hits"] += 1
+    logger.debug(f"    Read FIF tree cache {cache_fname}")
+    return tree, directory
+
+
+def get_fiff_cache_info():
+    """Get information about the on-disk cache of FIF file structures.
+
+    When the ``MNE_FIFF_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), the tag directory and block tree of each FIF file
+    that is opened are stored in that directory, keyed by the file path, size,
+    modification time, and a hash of the file header. Reopening the file then
+    skips scanning the file for its tags, which is particularly slow for files
+    without a tag directory (e.g., split files).
+
+    Returns
+    -------
+    info : dict
+        A dictionary with keys:
+
+        ``cache_dir``
+            The cache directory (:class:`~pathlib.Path`), or None if caching
+            is disabled.
+        ``n_files``
+            The number of cached FIF files.
+        ``size``
+            The total size of the cache in bytes.
+        ``hits``, ``misses``
+            The number of files opened in this session whose structure was
+            read from the cache and written to it, respectively.
+
+    See Also
+    --------
+    clear_fiff_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    cache_dir = _get_tree_cache_dir()
+    fnames = list()
+    if cache_dir is not None and cache_dir.is_dir():
+        fnames = list(cache_dir.glob(f"*{_TREE_CACHE_SUFFIX}"))
+    return dict(
+        cache_dir=cache_dir,
+        n_files=len(fnames),
+        size=sum(fname.stat().st_size for fname in fnames),
+        **_tree_cache_stats,
+    )
+
+
+@verbose
+def clear_fiff_cache(*, verbose=None):
+    """Remove all entries from the on-disk cache of FIF file structures.
+
+    Parameters
+    ----------
+    %(verbose)s
+
+    See Also
+    --------
+    get_fiff_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    info = get_fiff_cache_info()
+    if info["cache_dir"] is not None and info["n_files"]:
+        logger.info(f"Removing {info['n_files']} file(s) from {info['cache_dir']}")
+        for fname in info["cache_dir"].glob(f"*{_TREE_CACHE_SUFFIX}"):
+            fname.unlink(missing_ok=True)
+    _tree_cache_stats.update(hits=0, misses=0)
+
+
 @verbose
 def show_fiff(
     fname,
@@ -0,0 +1,103 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from mne import create_info
+from mne._fiff.open import fiff_open
+from mne.io import RawArray, clear_fiff_cache, get_fiff_cache_info, read_raw_fif
+from mne.utils import catch_logging
+
+
+def _assert_tree_equal(tree, tree_want):
+    for key in ("block", "nent", "nchild"):
+        assert tree[key] == tree_want[key], key
+    for key in ("id", "parent_id"):
+        if tree_want[key] is None:
+            assert tree[key] is None
+        else:
+            assert set(tree[key]) == set(tree_want[key])
+            for k, v in tree_want[key].items():
+                assert_array_equal(tree[key][k], v)
+    if tree_want["directory"] is None:
+        assert tree["directory"] is None
+    else:
+        assert tree["directory"] == tree_want["directory"]
+    assert len(tree["children"]) == len(tree_want["children"])
+    for child, child_want in zip(tree["children"], tree_want["children"]):
+        _assert_tree_equal(child, child_want)
+
+
+def test_fiff_cache(tmp_path, monkeypatch):
+    """Test the on-disk cache of FIF directories and trees."""
+    cache_dir = tmp_path / "cache"
+    fname = tmp_path / "test_raw.fif"
+    info = create_info(10, 1000.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((10, 100000))
+    RawArray(data, info).save(fname, split_size="2MB", buffer_size_sec=0.1)
+    fnames = sorted(tmp_path.glob("test_raw*.fif"))
+    assert len(fnames) > 1
+    # disabled by default
+    monkeypatch.delenv("MNE_FIFF_CACHE_DIR", raising=False)
+    monkeypatch.setattr("mne._fiff.open.get_config", lambda key: None)
+    assert get_fiff_cache_info()["cache_dir"] is None
+    wants = list()
+    for this_fname in fnames:
+        fid, tree, directory = fiff_open(this_fname)
+        fid.close()
+        wants.append((tree, directory))
+    assert get_fiff_cache_info()["misses"] == 0
+    raw_want = read_raw_fif(fname).get_data()
+
+    # enabled
+    monkeypatch.setattr(
+        "mne._fiff.open.get_config",
+        lambda key: str(cache_dir) if key == "MNE_FIFF_CACHE_DIR" else None,
+    )
+    clear_fiff_cache()
+    for _ in range(2):
+        for this_fname, (tree_want, directory_want) in zip(fnames, wants):
+            fid, tree, directory = fiff_open(this_fname)
+            fid.close()
+            assert directory == directory_want
+            _assert_tree_equal(tree, tree_want)
+    cache_info = get_fiff_cache_info()
+    assert cache_info["cache_dir"] == cache_dir
+    assert cache_info["n_files"] == len(fnames)
+    assert cache_info["size"] > 0
+    assert cache_info["misses"] == len(fnames)
+    assert cache_info["hits"] == len(fnames)
+    assert_array_equal(read_raw_fif(fname).get_data(), raw_want)
+    # the configuration is read once per reader, not once per opened file
+    keys = list()
+
+    def get_config(key):
+        keys.append(key)
+        return str(cache_dir)
+
+    hits = get_fiff_cache_info()["hits"]
+    monkeypatch.setattr("mne._fiff.open.get_config", get_config)
+    read_raw_fif(fname)
+    assert keys == ["MNE_FIFF_CACHE_DIR"]
+    assert get_fiff_cache_info()["hits"] - hits == len(fnames)
+
+    # modifying the file invalidates its entry
+    RawArray(data[:, :1000], info).save(fname, fmt="double", overwrite=True)
+    read_raw_fif(fname)
+    assert get_fiff_cache_info()["n_files"] == len(fnames) + 1
+    # corrupted cache files are ignored
+    for cache_fname in cache_dir.iterdir():
+        cache_fname.write_bytes(b"foo")
+    with catch_logging(verbose="debug") as log:
+        assert_array_equal(read_raw_fif(fname).get_data(), data[:, :1000])
+    assert "Ignoring unreadable FIF cache" in log.getvalue()
+    with catch_logging(verbose=True) as log:
+        clear_fiff_cache()
+    assert "Removing" in log.getvalue()
+    cache_info = get_fiff_cache_info()
+    assert cache_info["n_files"] == cache_info["hits"] == cache_info["misses"] == 0
+    with pytest.raises(TypeError, match="positional"):
+        clear_fiff_cache(False)
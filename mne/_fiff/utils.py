@@ -224,6 +224,29 @@ def _read_segments_file(
     # Read up to 100 MB of data at a time, block_size is in data samples
     block_size = ((int(100e6) // n_bytes) // n_channels) * n_channels
     block_size = min(data_left, block_size)
+    # Fast path: only decode the requested channels from a memory map
+    mm = _flat_memmap(raw.filenames[fi])
+    if mm is not None and data_offset + data_left * n_bytes <= mm.size:
+        view = np.ndarray(
+            (stop - start, n_channels), dtype=dtype, buffer=mm, offset=data_offset
+        )
+        for sample_start in range(0, stop - start, block_size // n_channels):
+            sample_stop = min(sample_start + block_size // n_channels, stop - start)
+            stim_ch = None
+            if trigger_ch is not None:
+                stim_ch = np.atleast_2d(
+                    trigger_ch[start:stop][sample_start:sample_stop]
+                )
+            _mult_cal_memmap(
+                data[:, sample_start:sample_stop],
+                view[sample_start:sample_stop].T,
+                idx,
+                cals,
+                mult,
+                stim_ch,
+            )
+        return
+    del mm
     with open(raw.filenames[fi], "rb", buffering=0) as fid:
         fid.seek(data_offset)
         # extract data in chunks
@@ -245,6 +268,44 @@ def _read_segments_file(
             _mult_cal_one(data_view, block, idx, cals, mult)
 
 
+def _flat_memmap(fname):
+    """Memory-map a flat binary file for reading, returning None if not possible."""
+    if not isinstance(fname, str | Path):
+        return None  # file-like
+    try:
+        return np.memmap(fname, dtype=np.uint8, mode="r")
+    except (OSError, ValueError):  # e.g., empty file or no mmap support
+        return None
+
+
+def _mult_cal_memmap(data_view, view, idx, cals, mult, stim_ch=None):
+    """Like _mult_cal_one, but only decode the rows of view that are needed.
+
+    ``view`` is a (n_channels, n_times) view of memory-mapped data, and
+    ``stim_ch`` (if not None) holds additional trailing rows that are not
+    part of the file. Only the bytes of the requested channels are accessed
+    (though for interleaved data the OS reads whole pages).
+    """
+    n_file = view.shape[0]
+    rows = np.arange(n_file + (0 if stim_ch is None else len(stim_ch)))[idx]
+    in_file = rows < n_file
+    if mult is None:
+        out = data_view
+    else:
+        out = np.empty((len(rows), data_view.shape[1]), data_view.dtype)
+    if isinstance(idx, slice) and in_file.all():
+        out[:] = view[idx]  # cast straight from the file dtype into the output
+    elif in_file.all():
+        out[:] = view[rows]
+    else:
+        out[in_file] = view[rows[in_file]]
+        out[~in_file] = stim_ch[rows[~in_file] - n_file]
+    if mult is None:
+        out *= cals
+    else:
+        data_view[:] = mult @ out
+
+
 def read_str(fid, count=1):
     """Read string from a binary file in a python version compatible way."""
     dtype = np.dtype(f">S{count}")
@@ -2,9 +2,13 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
 from scipy.signal import get_window
 
+from .parallel import _check_n_jobs
 from .utils import _ensure_int, _validate_type, logger, verbose
 
 ###############################################################################
@@ -231,7 +235,9 @@ class _COLA:
     ----------
     process : callable
         A function that takes a chunk of input data with shape
-        ``(n_channels, n_samples)`` and processes it.
+        ``(n_channels, n_samples)`` and processes it. It can also return
+        a callable taking no arguments that computes the outputs, in which
+        case that callable is what gets run in parallel when ``n_jobs > 1``.
     store : ndarray | list of ndarray | _Storer
         The output data in which to store the results.
     n_total : int
@@ -244,6 +250,10 @@ class _COLA:
         The window to use. Default is "hann".
     tol : float
         The tolerance for COLA checking.
+    n_jobs : int
+        The number of threads to use to process windows. ``process`` itself
+        is always called in window order from the calling thread, and at most
+        ``n_jobs`` windows are in flight at once.
 
     Notes
     -----
@@ -278,6 +288,7 @@ class _COLA:
         tol=1e-10,
         *,
         name="COLA",
+        n_jobs=1,
         verbose=None,
     ):
         n_samples = _ensure_int(n_samples, "n_samples")
@@ -305,6 +316,9 @@ class _COLA:
         self._idx = 0
         self._in_buffers = self._out_buffers = None
         self.name = name
+        self._n_jobs = _check_n_jobs(n_jobs)
+        self._pool = None
+        self._pending = deque()
 
         # Create our window boundaries
         window_name = window if isinstance(window, str) else "custom"
@@ -384,17 +398,7 @@ class _COLA:
         while self._idx < len(self.starts) and self._in_offset >= self.stops[self._idx]:
             start, stop = self.starts[self._idx], self.stops[self._idx]
             this_len = stop - start
-            this_window = self._window.copy()
-            if self._idx == len(self.starts) - 1:
-                this_window = np.pad(
-                    self._window, (0, this_len - len(this_window)), "constant"
-                )
-                for offset in range(self._step, len(this_window), self._step):
-                    n_use = len(this_window) - offset
-                    this_window[offset:] += self._window[:n_use]
-            if self._idx == 0:
-                for offset in range(self._n_samples - self._step, 0, -self._step):
-                    this_window[:offset] += self._window[-offset:]
+            this_window = self._get_window(self._idx)
             this_proc = [in_[..., :this_len].copy() for in_ in self._in_buffers]
             logger.debug(
                 f"    * {self.name}[:] Processing {start}:{stop} "
@@ -404,33 +408,78 @@ class _COLA:
                 proc.shape[-1] == this_len == this_window.size for proc in this_proc
             ):
                 raise RuntimeError("internal indexing error")
-            start = self._store.idx
-            stop = self._store.idx + this_len
+            # Windows that are still in flight have not been stored yet
+            start = self._store.idx + sum(p[-1] for p in self._pending)
+            stop = start + this_len
             outs = self._process(*this_proc, start=start, stop=stop, **kwargs)
-            if self._out_buffers is None:
-                max_len = np.max(self.stops - self.starts)
-                self._out_buffers = [
-                    np.zeros(o.shape[:-1] + (max_len,), o.dtype) for o in outs
-                ]
-            for oi, out in enumerate(outs):
-                out *= this_window
-                self._out_buffers[oi][..., : stop - start] += out
+            if callable(outs):
+                if self._n_jobs == 1:
+                    outs = outs()
+                else:
+                    if self._pool is None:
+                        self._pool = ThreadPoolExecutor(max_workers=self._n_jobs)
+                    outs = self._pool.submit(outs)
             self._idx += 1
             if self._idx < len(self.starts):
                 next_start = self.starts[self._idx]
             else:
                 next_start = self.stops[-1]
             delta = next_start - self.starts[self._idx - 1]
-            logger.debug(
-                f"    + {self.name}[:] Shifting input and output buffers by "
-                f"{delta} samples (storing {start}:{stop})"
-            )
             for di in range(len(self._in_buffers)):
                 self._in_buffers[di] = self._in_buffers[di][..., delta:]
-            self._store(*[o[..., :delta] for o in self._out_buffers])
-            for ob in self._out_buffers:
-                ob[..., :-delta] = ob[..., delta:]
-                ob[..., -delta:] = 0.0
+            self._pending.append((outs, this_window, start, stop, delta))
+            # Finish windows in order, keeping at most n_jobs in flight
+            n_keep = self._n_jobs - 1 if self._idx < len(self.starts) else 0
+            try:
+                while len(self._pending) > n_keep:
+                    self._finish()
+            except BaseException:
+                self._shutdown()
+                raise
+        if self._idx == len(self.starts):
+            self._shutdown()
+
+    def _get_window(self, idx):
+        """Get the window applied to the output of window number idx."""
+        this_window = self._window.copy()
+        if idx == len(self.starts) - 1:
+            this_len = self.stops[idx] - self.starts[idx]
+            this_window = np.pad(
+                self._window, (0, this_len - len(this_window)), "constant"
+            )
+            for offset in range(self._step, len(this_window), self._step):
+                n_use = len(this_window) - offset
+                this_window[offset:] += self._window[:n_use]
+        if idx == 0:
+            for offset in range(self._n_samples - self._step, 0, -self._step):
+                this_window[:offset] += self._window[-offset:]
+        return this_window
+
+    def _finish(self):
+        outs, this_window, start, stop, delta = self._pending.popleft()
+        if isinstance(outs, Future):
+            outs = outs.result()
+        if self._out_buffers is None:
+            max_len = np.max(self.stops - self.starts)
+            self._out_buffers = [
+                np.zeros(o.shape[:-1] + (max_len,), o.dtype) for o in outs
+            ]
+        for oi, out in enumerate(outs):
+            out *= this_window
+            self._out_buffers[oi][..., : stop - start] += out
+        logger.debug(
+            f"    + {self.name}[:] Shifting input and output buffers by "
+            f"{delta} samples (storing {start}:{stop})"
+        )
+        self._store(*[o[..., :delta] for o in self._out_buffers])
+        for ob in self._out_buffers:
+            ob[..., :-delta] = ob[..., delta:]
+            ob[..., -delta:] = 0.0
+
+    def _shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
 
 
 def _check_cola(win, nperseg, step, window_name, tol=1e-10):
@@ -11,11 +11,13 @@ import os
 import os.path as op
 import shutil
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import partial
 from pathlib import Path
 
 import numpy as np
+from scipy import linalg, sparse
 from scipy.optimize import fmin_cobyla
 
 from ._fiff._digitization import _dig_kind_dict, _dig_kind_ints, _dig_kind_rev
@@ -34,6 +36,7 @@ from ._fiff.write import (
     write_string,
 )
 from .fixes import _compare_version, _safe_svd
+from .parallel import _check_n_jobs
 from .surface import (
     _complete_sphere_surf,
     _compute_nearest,
@@ -120,31 +123,35 @@ class ConductorModel(dict):
 def _calc_beta(rk, rk_norm, rk1, rk1_norm):
     """Compute coefficients for calculating the magic vector omega."""
     rkk1 = rk1[0] - rk[0]
-    size = np.linalg.norm(rkk1)
-    rkk1 /= size
-    num = rk_norm + np.dot(rk, rkk1)
-    den = rk1_norm + np.dot(rk1, rkk1)
+    size = np.linalg.norm(rkk1, axis=-1)
+    rkk1 /= size[..., np.newaxis]
+    num = rk_norm + np.einsum("...j,...j->...", rk, rkk1)
+    den = rk1_norm + np.einsum("...j,...j->...", rk1, rkk1)
     res = np.log(num / den) / size
     return res
 
 
 def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
-    """Compute the linear potential matrix element computations."""
-    omega = np.zeros((len(fros), 3))
+    """Compute the linear potential matrix element computations.
+
+    ``tri_rr``, ``tri_nn``, and ``tri_area`` can have a leading dimension of
+    triangles, in which case the output has shape ``(n_fros, n_tri, 3)``.
+    """
+    fros = fros.reshape((len(fros),) + (1,) * (tri_nn.ndim - 1) + (3,))
 
     # we replicate a little bit of the _get_solids code here for speed
     # (we need some of the intermediate values later)
-    v1 = tri_rr[np.newaxis, 0, :] - fros
-    v2 = tri_rr[np.newaxis, 1, :] - fros
-    v3 = tri_rr[np.newaxis, 2, :] - fros
+    v1 = tri_rr[..., 0, :] - fros
+    v2 = tri_rr[..., 1, :] - fros
+    v3 = tri_rr[..., 2, :] - fros
     triples = _fast_cross_nd_sum(v1, v2, v3)
-    l1 = np.linalg.norm(v1, axis=1)
-    l2 = np.linalg.norm(v2, axis=1)
-    l3 = np.linalg.norm(v3, axis=1)
+    l1 = np.linalg.norm(v1, axis=-1)
+    l2 = np.linalg.norm(v2, axis=-1)
+    l3 = np.linalg.norm(v3, axis=-1)
     ss = l1 * l2 * l3
-    ss += np.einsum("ij,ij,i->i", v1, v2, l3)
-    ss += np.einsum("ij,ij,i->i", v1, v3, l2)
-    ss += np.einsum("ij,ij,i->i", v2, v3, l1)
+    ss += np.einsum("...j,...j,...->...", v1, v2, l3)
+    ss += np.einsum("...j,...j,...->...", v1, v3, l2)
+    ss += np.einsum("...j,...j,...->...", v2, v3, l1)
     solids = np.arctan2(triples, ss)
 
     # We *could* subselect the good points from v1, v2, v3, triples, solids,
@@ -159,9 +166,9 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
 
     # Calculate the magic vector vec_omega
     beta = [
-        _calc_beta(v1, l1, v2, l2)[:, np.newaxis],
-        _calc_beta(v2, l2, v3, l3)[:, np.newaxis],
-        _calc_beta(v3, l3, v1, l1)[:, np.newaxis],
+        _calc_beta(v1, l1, v2, l2)[..., np.newaxis],
+        _calc_beta(v2, l2, v3, l3)[..., np.newaxis],
+        _calc_beta(v3, l3, v1, l1)[..., np.newaxis],
     ]
     vec_omega = (beta[2] - beta[0]) * v1
     vec_omega += (beta[0] - beta[1]) * v2
@@ -171,13 +178,15 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
     n2 = 1.0 / (area2 * area2)
     # leave omega = 0 otherwise
     # Put it all together...
+    omega = np.empty(v1.shape)
     yys = [v1, v2, v3]
     idx = [0, 1, 2, 0, 2]
     for k in range(3):
         diff = yys[idx[k - 1]] - yys[idx[k + 1]]
         zdots = _fast_cross_nd_sum(yys[idx[k + 1]], yys[idx[k - 1]], tri_nn)
-        omega[:, k] = -n2 * (
-            area2 * zdots * 2.0 * solids - triples * (diff * vec_omega).sum(axis=-1)
+        omega[..., k] = -n2 * (
+            area2 * zdots * 2.0 * solids
+            - triples * np.einsum("...j,...j->...", diff, vec_omega)
         )
     # omit the bad points from the solution
     omega[bad_mask] = 0.0
@@ -208,52 +217,71 @@ def _correct_auto_elements(surf, mat):
     return
 
 
-def _fwd_bem_lin_pot_coeff(surfs):
+def _fwd_bem_lin_pot_coeff(surfs, n_jobs=1):
     """Calculate the coefficients for linear collocation approach."""
     # taken from fwd_bem_linear_collocation.c
     nps = [surf["np"] for surf in surfs]
     np_tot = sum(nps)
     coeff = np.zeros((np_tot, np_tot))
     offsets = np.cumsum(np.concatenate(([0], nps)))
-    for si_1, surf1 in enumerate(surfs):
-        rr_ord = np.arange(nps[si_1])
-        for si_2, surf2 in enumerate(surfs):
-            logger.info(
-                f"        {_bem_surf_name[surf1['id']]} ({nps[si_1]:d}) -> "
-                f"{_bem_surf_name[surf2['id']]} ({nps[si_2]}) ..."
-            )
-            tri_rr = surf2["rr"][surf2["tris"]]
-            tri_nn = surf2["tri_nn"]
-            tri_area = surf2["tri_area"]
-            submat = coeff[
-                offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
-            ]  # view
-            for k in range(surf2["ntri"]):
-                tri = surf2["tris"][k]
-                if si_1 == si_2:
-                    skip_idx = (
-                        (rr_ord == tri[0]) | (rr_ord == tri[1]) | (rr_ord == tri[2])
-                    )
-                else:
-                    skip_idx = list()
-                # No contribution from a triangle that
-                # this vertex belongs to
-                # if sidx1 == sidx2 and (tri == j).any():
-                #     continue
-                # Otherwise do the hard job
-                coeffs = _lin_pot_coeff(
-                    fros=surf1["rr"],
-                    tri_rr=tri_rr[k],
-                    tri_nn=tri_nn[k],
-                    tri_area=tri_area[k],
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        for si_1, surf1 in enumerate(surfs):
+            for si_2, surf2 in enumerate(surfs):
+                logger.info(
+                    f"        {_bem_surf_name[surf1['id']]} ({nps[si_1]:d}) -> "
+                    f"{_bem_surf_name[surf2['id']]} ({nps[si_2]}) ..."
                 )
-                coeffs[skip_idx] = 0.0
-                submat[:, tri] -= coeffs
-            if si_1 == si_2:
-                _correct_auto_elements(surf1, submat)
+                submat = coeff[
+                    offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
+                ]  # view
+                # Evaluate tiles of triangles (against all vertices) at once,
+                # ~200 bytes of temporaries per (vertex, triangle) pair, so use
+                # ~10 MB per tile (larger tiles are not faster)
+                n_tile = max(int(10e6 // (200 * nps[si_1])), 1)
+                tiles = np.array_split(
+                    np.arange(surf2["ntri"]),
+                    max(int(np.ceil(surf2["ntri"] / n_tile)), 1),
+                )
+                fun = partial(
+                    _lin_pot_coeff_tile,
+                    surf1=surf1,
+                    surf2=surf2,
+                    same=si_1 == si_2,
+                )
+                # only n_jobs tiles at a time so that the results do not pile up
+                for ti in range(0, len(tiles), n_jobs):
+                    these_tiles = tiles[ti : ti + n_jobs]
+                    for tile, coeffs in zip(these_tiles, pool.map(fun, these_tiles)):
+                        # Accumulate in this thread, summing the three vertices
+                        # of each triangle into the columns they belong to
+                        tris = surf2["tris"][tile]
+                        cols, inv = np.unique(tris, return_inverse=True)
+                        scatter = sparse.csr_array(
+                            (np.ones(tris.size), (np.arange(tris.size), inv.ravel())),
+                            shape=(tris.size, len(cols)),
+                        )
+                        coeffs = coeffs.reshape(len(coeffs), -1)
+                        submat[:, cols] -= (scatter.T @ coeffs.T).T
+                if si_1 == si_2:
+                    _correct_auto_elements(surf1, submat)
     return coeff
 
 
+def _lin_pot_coeff_tile(tile, *, surf1, surf2, same):
+    coeffs = _lin_pot_coeff(
+        fros=surf1["rr"],
+        tri_rr=surf2["rr"][surf2["tris"][tile]],
+        tri_nn=surf2["tri_nn"][tile],
+        tri_area=surf2["tri_area"][tile],
+    )
+    # No contribution from a triangle that this vertex belongs to
+    if same:
+        tile_ord = np.arange(len(tile))
+        for k in range(3):
+            coeffs[surf2["tris"][tile, k], tile_ord] = 0.0
+    return coeffs
+
+
 def _fwd_bem_multi_solution(solids, gamma, nps):
     """Do multi surface solution.
 
@@ -274,9 +302,13 @@ def _fwd_bem_multi_solution(solids, gamma, nps):
             mult = pi2 if gamma is None else pi2 * gamma[si_1, si_2]
             slice_j = slice(offsets[si_1], offsets[si_1 + 1])
             slice_k = slice(offsets[si_2], offsets[si_2 + 1])
-            solids[slice_j, slice_k] = defl - solids[slice_j, slice_k] * mult
-    solids += np.eye(n_tot)
-    return np.linalg.inv(solids)
+            sub = solids[slice_j, slice_k]  # view
+            sub *= -mult
+            sub += defl
+    solids.flat[:: n_tot + 1] += 1.0
+    # Invert in place: the transpose of our C-contiguous matrix is
+    # Fortran-contiguous, so LAPACK can overwrite it, and inv(A.T).T == inv(A)
+    return linalg.inv(solids.T, overwrite_a=True, check_finite=False).T
 
 
 def _fwd_bem_homog_solution(solids, nps):
@@ -322,28 +354,33 @@ def _check_complete_surface(surf, copy=False, incomplete="raise", extra=""):
     return surf
 
 
-def _fwd_bem_linear_collocation_solution(bem):
+def _fwd_bem_linear_collocation_solution(bem, n_jobs=1):
     """Compute the linear collocation potential solution."""
     # first, add surface geometries
     logger.info("Computing the linear collocation solution...")
     logger.info("    Matrix coefficients...")
-    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"])
+    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"], n_jobs=n_jobs)
     bem["nsol"] = len(coeff)
-    logger.info("    Inverting the coefficient matrix...")
     nps = [surf["np"] for surf in bem["surfs"]]
-    bem["solution"] = _fwd_bem_multi_solution(coeff, bem["gamma"], nps)
+    ip_mult = None
     if len(bem["surfs"]) == 3:
         ip_mult = bem["sigma"][1] / bem["sigma"][2]
         if ip_mult <= FWD.BEM_IP_APPROACH_LIMIT:
-            logger.info("IP approach required...")
-            logger.info("    Matrix coefficients (homog)...")
-            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]])
-            logger.info("    Inverting the coefficient matrix (homog)...")
-            ip_solution = _fwd_bem_homog_solution(coeff, [bem["surfs"][-1]["np"]])
-            logger.info(
-                "    Modify the original solution to incorporate IP approach..."
-            )
-            _fwd_bem_ip_modify_solution(bem["solution"], ip_solution, ip_mult, nps)
+            # The homogeneous coefficients of the inner skull are the same as
+            # its diagonal block, so keep them before inverting in place
+            ip_coeff = coeff[-nps[-1] :, -nps[-1] :].copy()
+        else:
+            ip_mult = None
+    logger.info("    Inverting the coefficient matrix...")
+    bem["solution"] = _fwd_bem_multi_solution(coeff, bem["gamma"], nps)
+    del coeff
+    if ip_mult is not None:
+        logger.info("IP approach required...")
+        logger.info("    Inverting the coefficient matrix (homog)...")
+        ip_solution = _fwd_bem_homog_solution(ip_coeff, [nps[-1]])
+        del ip_coeff
+        logger.info("    Modify the original solution to incorporate IP approach...")
+        _fwd_bem_ip_modify_solution(bem["solution"], ip_solution, ip_mult, nps)
     bem["bem_method"] = FIFF.FIFFV_BEM_APPROX_LINEAR
     bem["solver"] = "mne"
 
@@ -395,7 +432,7 @@ def _fwd_bem_openmeeg_solution(bem):
 
 
 @verbose
-def make_bem_solution(surfs, *, solver="mne", verbose=None):
+def make_bem_solution(surfs, *, solver="mne", n_jobs=None, verbose=None):
     """Create a BEM solution using the linear collocation approach.
 
     Parameters
@@ -407,6 +444,11 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         `OpenMEEG <https://openmeeg.github.io>`__ package.
 
         .. versionadded:: 1.2
+    %(n_jobs)s
+        Threads are used to compute the coefficient matrix when
+        ``solver='mne'``.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -428,6 +470,7 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
     """
     _validate_type(solver, str, "solver")
     _check_option("method", solver.lower(), ("mne", "openmeeg"))
+    n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
     bem = _ensure_bem_surfaces(surfs)
     _add_gamma_multipliers(bem)
     if len(bem["surfs"]) == 3:
@@ -443,7 +486,7 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         _fwd_bem_openmeeg_solution(bem)
     else:
         assert solver.lower() == "mne"
-        _fwd_bem_linear_collocation_solution(bem)
+        _fwd_bem_linear_collocation_solution(bem, n_jobs=n_jobs)
     logger.info("Solution ready.")
     logger.info("BEM geometry computations complete.")
     return bem
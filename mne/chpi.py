@@ -24,6 +24,7 @@ import itertools
 from functools import partial
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.linalg import orth
 from scipy.optimize import fmin_cobyla
 from scipy.spatial.distance import cdist
@@ -849,6 +850,87 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
     )
 
 
+def _get_chpi_batches(starts, n_window, max_samples):
+    """Split sorted window starts into batches for _fit_chpi_amplitudes_batch.
+
+    Each batch reads the span from its first to its last window and then
+    copies out the windows, so this keeps the sum of the two (in samples per
+    channel) within max_samples, with at least one window per batch.
+    """
+    # the cost of the batch [bi, stop) is reads[stop - 1] - reads[bi] + 2 * n_window
+    reads = starts + np.arange(len(starts)) * n_window
+    batches = list()
+    bi = 0
+    while bi < len(starts):
+        stop = np.searchsorted(reads, reads[bi] + max_samples - 2 * n_window, "right")
+        stop = max(stop, bi + 1)
+        batches.append(np.arange(bi, stop))
+        bi = stop
+    return batches
+
+
+def _fit_chpi_amplitudes_batch(raw, starts, hpi, snr=False):
+    """Fit amplitudes (or SNRs) for full-length windows starting at starts.
+
+    This is equivalent to calling :func:`_fit_chpi_amplitudes` for each
+    window, but solves the GLM for all windows at once.
+
+    Returns
+    -------
+    out : ndarray, shape (n_windows, n_freqs, ...)
+        The stacked outputs of :func:`_fast_fit` (or :func:`_fast_fit_snr`),
+        NaN for windows that should be skipped.
+    """
+    n_window, n_freqs = hpi["n_window"], len(hpi["freqs"])
+    time_sl = slice(starts[0], starts[-1] + n_window)
+    offsets = starts - starts[0]
+    with use_log_level(False):
+        this_data = raw[hpi["meg_picks"], time_sl][0]
+    if not snr:  # projecting commutes with windowing, so do it just once
+        this_data = hpi["proj_op"] @ this_data
+    # (n_windows, n_channels, n_window)
+    this_data = sliding_window_view(this_data, n_window, axis=1)[:, offsets]
+    this_data = this_data.transpose(1, 0, 2)
+    if snr:
+        model, inv_model = hpi["model"], hpi["inv_model"]
+        coefs = this_data @ inv_model.T
+        # average sin & cos terms (special property of sinusoids: power=A²/2)
+        hpi_power = (
+            coefs[..., :n_freqs] ** 2 + coefs[..., n_freqs : 2 * n_freqs] ** 2
+        ) / 2
+        resid_var = np.var(this_data - coefs @ model.T, axis=-1)
+        out = list()
+        for picks in (hpi["mag_subpicks"], hpi["grad_subpicks"]):
+            if len(picks):
+                avg_power = hpi_power[:, picks].mean(axis=1)
+                avg_resid = np.repeat(
+                    resid_var[:, picks].mean(axis=1)[:, np.newaxis], n_freqs, axis=1
+                )
+                snr_ = 10 * np.log10(avg_power / avg_resid)
+                out.append(np.stack((snr_, avg_power, avg_resid), axis=-1))
+        out = np.concatenate(out, axis=-1)
+    else:
+        X = this_data @ hpi["inv_model_reord"][: 2 * n_freqs].T
+        X = X.transpose(0, 2, 1).reshape(len(starts), n_freqs, 2, -1)
+        # use SVD across all sensors to estimate the sinusoid phase, keeping
+        # only the predominant phase direction as in _fast_fit
+        _, s, vt = np.linalg.svd(X, full_matrices=False)
+        out = vt[..., 0, :] * s[..., :1]
+    # which HPI coils to use
+    if hpi["hpi_pick"] is not None:
+        with use_log_level(False):
+            # loads hpi_stim channel
+            chpi_data = raw[hpi["hpi_pick"], time_sl][0]
+        ons = (np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(
+            bool
+        )
+        n_off = np.cumsum(~ons, axis=-1)
+        n_off = np.concatenate([np.zeros((len(n_off), 1), n_off.dtype), n_off], -1)
+        n_on = (n_off[:, offsets + n_window] == n_off[:, offsets]).sum(axis=0)
+        out[n_on < 3] = np.nan
+    return out
+
+
 @jit()
 def _fast_fit(this_data, proj, n_freqs, model, inv_model_reord):
     # first or last window
@@ -1271,39 +1353,50 @@ def _compute_chpi_amp_or_snr(
                 for key in ("snr", "power", "resid"):
                     cols = 1 if key == "resid" else n_freqs
                     sin_fits[f"{ch_type}_{key}"] = np.empty((n_times, cols))
-    else:
-        sin_fits["slopes"] = np.empty((n_times, n_freqs, n_chans))
     message = f"cHPI {'SNRs' if snr else 'amplitudes'}"
-    for mi, midpt in enumerate(ProgressBar(fit_idxs, mesg=message)):
-        #
-        # 0. determine samples to fit.
-        #
-        time_sl = midpt - hpi["n_window"] // 2
-        time_sl = slice(max(time_sl, 0), min(time_sl + hpi["n_window"], len(raw.times)))
-
-        #
-        # 1. Fit amplitudes for each channel from each of the N sinusoids
-        #
-        amps_or_snrs = _fit_chpi_amplitudes(raw, time_sl, hpi, snr)
-        if snr:
-            if amps_or_snrs is None:
-                amps_or_snrs = np.full((n_freqs, grad_offset + 3), np.nan)
-            # unpack the SNR estimates. mag & grad are returned in one array
-            # (because of Numba) so take care with which column is which.
-            # note that mean residual is a scalar (same for all HPI freqs) but
-            # is returned as a (tiled) vector (again, because Numba) so that's
-            # why below we take amps_or_snrs[0, 2] instead of [:, 2]
-            ch_types = raw.get_channel_types()
-            if "mag" in ch_types:
-                sin_fits["mag_snr"][mi] = amps_or_snrs[:, 0]  # SNR
-                sin_fits["mag_power"][mi] = amps_or_snrs[:, 1]  # mean power
-                sin_fits["mag_resid"][mi] = amps_or_snrs[0, 2]  # mean resid
-            if "grad" in ch_types:
-                sin_fits["grad_snr"][mi] = amps_or_snrs[:, grad_offset]
-                sin_fits["grad_power"][mi] = amps_or_snrs[:, grad_offset + 1]
-                sin_fits["grad_resid"][mi] = amps_or_snrs[0, grad_offset + 2]
-        else:
-            sin_fits["slopes"][mi] = amps_or_snrs
+    #
+    # 0. determine samples to fit.
+    #
+    n_window = hpi["n_window"]
+    starts = fit_idxs - n_window // 2
+    full = (starts >= 0) & (starts + n_window <= len(raw.times))
+    # mag & grad SNRs are returned in one array, see _fast_fit_snr
+    amps_or_snrs = np.full(
+        (n_times, n_freqs, grad_offset + 3 if snr else n_chans), np.nan
+    )
+    # full-length windows are fit in batches, using at most ~100 MB for each
+    max_samples = int(100e6 // (8 * len(hpi["meg_picks"])))
+    with ProgressBar(n_times, mesg=message) as pb:
+        for idx in _get_chpi_batches(starts, n_window, max_samples):
+            #
+            # 1. Fit amplitudes for each channel from each of the N sinusoids
+            #
+            if full[idx].any():
+                amps_or_snrs[idx[full[idx]]] = _fit_chpi_amplitudes_batch(
+                    raw, starts[idx[full[idx]]], hpi, snr
+                )
+            for mi in idx[~full[idx]]:  # first or last window
+                time_sl = slice(
+                    max(starts[mi], 0), min(starts[mi] + n_window, len(raw.times))
+                )
+                this_fit = _fit_chpi_amplitudes(raw, time_sl, hpi, snr)
+                if this_fit is not None:
+                    amps_or_snrs[mi] = this_fit
+            pb.update_with_increment_value(len(idx))
+    if snr:
+        # unpack the SNR estimates, taking care with which column is which.
+        # note that mean residual is a scalar (same for all HPI freqs) but
+        # is returned as a (tiled) vector, so we take [:, 0, 2] not [:, :, 2]
+        if "mag" in ch_types:
+            sin_fits["mag_snr"][:] = amps_or_snrs[:, :, 0]  # SNR
+            sin_fits["mag_power"][:] = amps_or_snrs[:, :, 1]  # mean power
+            sin_fits["mag_resid"][:, 0] = amps_or_snrs[:, 0, 2]  # mean resid
+        if "grad" in ch_types:
+            sin_fits["grad_snr"][:] = amps_or_snrs[:, :, grad_offset]
+            sin_fits["grad_power"][:] = amps_or_snrs[:, :, grad_offset + 1]
+            sin_fits["grad_resid"][:, 0] = amps_or_snrs[:, 0, grad_offset + 2]
+    else:
+        sin_fits["slopes"] = amps_or_snrs
     return sin_fits
 
 
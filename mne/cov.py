@@ -741,7 +741,8 @@ def compute_raw_covariance(
         mu = 0
         # Read data in chunks
         for raw_segment in epochs:
-            raw_segment = raw_segment[pick_mask]
+            # accumulate in double precision (even for single-precision data)
+            raw_segment = raw_segment[pick_mask].astype(np.float64, copy=False)
             mu += raw_segment.sum(axis=1)
             data += np.dot(raw_segment, raw_segment.T)
             n_samples += raw_segment.shape[1]
@@ -1135,7 +1136,7 @@ def compute_covariance(
         for ii, epochs_t in enumerate(epochs):
             tslice = _get_tslice(epochs_t, tmin, tmax)
             for e in epochs_t:
-                e = e[picks_meeg, tslice]
+                e = e[picks_meeg, tslice].astype(np.float64, copy=False)
                 if not keep_sample_mean:
                     data_mean[ii] += e
                 n_samples[ii] += e.shape[1]
@@ -1159,7 +1160,8 @@ def compute_covariance(
     else:
         epochs = epochs[0]
 
-    epochs = np.hstack(epochs)
+    # estimate the covariance in double precision
+    epochs = np.hstack(epochs).astype(np.float64, copy=False)
     n_samples_tot = epochs.shape[-1]
     _check_n_samples(n_samples_tot, len(picks_meeg), on_few_samples)
 
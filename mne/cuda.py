@@ -126,7 +126,9 @@ def _set_cuda_device(device_id, verbose=None):
 # Repeated FFT multiplication
 
 
-def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"):
+def _setup_cuda_fft_multiply_repeated(
+    n_jobs, h, n_fft, kind="FFT FIR filtering", *, h_fft=None
+):
     """Set up repeated CUDA FFT multiplication with a given filter.
 
     Parameters
@@ -140,6 +142,8 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
         The number of points in the FFT.
     kind : str
         The kind to report to the user.
+    h_fft : array | None
+        The precomputed ``rfft(h, n=n_fft)``, if available.
 
     Returns
     -------
@@ -166,7 +170,9 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     -----
     This function is designed to be used with fft_multiply_repeated().
     """
-    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=rfft(h, n=n_fft))
+    if h_fft is None:
+        h_fft = rfft(h, n=n_fft)
+    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=h_fft)
     if isinstance(n_jobs, str):
         _check_option("n_jobs", n_jobs, ("cuda",))
         n_jobs = 1
@@ -366,7 +372,7 @@ def _fft_resample(x, new_len, npads, to_removes, cuda_dict=None, pad="reflect_li
 
 # this has to go in mne.cuda instead of mne.filter to avoid import errors
 def _smart_pad(x, n_pad, pad="reflect_limited"):
-    """Pad vector x."""
+    """Pad vector x (or each row of x, along the last axis)."""
     n_pad = np.asarray(n_pad)
     assert n_pad.shape == (2,)
     if (n_pad == 0).all():
@@ -374,20 +380,22 @@ def _smart_pad(x, n_pad, pad="reflect_limited"):
     elif (n_pad < 0).any():
         raise RuntimeError("n_pad must be non-negative")
     if pad == "reflect_limited":
-        l_z_pad = np.zeros(max(n_pad[0] - len(x) + 1, 0), dtype=x.dtype)
-        r_z_pad = np.zeros(max(n_pad[1] - len(x) + 1, 0), dtype=x.dtype)
+        n_x = x.shape[-1]
+        l_z_pad = np.zeros(x.shape[:-1] + (max(n_pad[0] - n_x + 1, 0),), x.dtype)
+        r_z_pad = np.zeros(x.shape[:-1] + (max(n_pad[1] - n_x + 1, 0),), x.dtype)
         out = np.concatenate(
             [
                 l_z_pad,
-                2 * x[0] - x[n_pad[0] : 0 : -1],
+                2 * x[..., :1] - x[..., n_pad[0] : 0 : -1],
                 x,
-                2 * x[-1] - x[-2 : -n_pad[1] - 2 : -1],
+                2 * x[..., -1:] - x[..., -2 : -n_pad[1] - 2 : -1],
                 r_z_pad,
-            ]
+            ],
+            axis=-1,
         )
     else:
         kwargs = dict()
         if pad == "reflect":
             kwargs["reflect_type"] = "odd"
-        out = np.pad(x, (tuple(n_pad),), pad, **kwargs)
+        out = np.pad(x, ((0, 0),) * (x.ndim - 1) + (tuple(n_pad),), pad, **kwargs)
     return out
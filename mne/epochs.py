@@ -24,7 +24,7 @@ from ._fiff.meas_info import (
     read_meas_info,
     write_meas_info,
 )
-from ._fiff.open import _get_next_fname, fiff_open
+from ._fiff.open import _fiff_cache_dir_scope, _get_next_fname, fiff_open
 from ._fiff.pick import (
     _DATA_CH_TYPES_SPLIT,
     _pick_data_channels,
@@ -57,6 +57,7 @@ from ._fiff.write import (
 from .annotations import (
     EpochAnnotationsMixin,
     _read_annotations_fif,
+    _sync_onset,
     _write_annotations,
     events_from_annotations,
 )
@@ -87,6 +88,7 @@ from .utils import (
     _convert_times,
     _ensure_events,
     _gen_events,
+    _get_data_dtype,
     _on_missing,
     _path_like,
     _pl,
@@ -930,11 +932,34 @@ class BaseEpochs(
                 ignore_chs=self.info["bads"],
             )
 
+    def _is_good_epochs(self, data):
+        """Determine which of several complete epochs are good."""
+        if self.reject is None and self.flat is None:
+            return [(True, None)] * len(data)
+        if any(
+            callable(criterion)
+            for refl in (self.reject, self.flat)
+            if refl is not None
+            for criterion in refl.values()
+        ):
+            return [self._is_good_epoch(epoch) for epoch in data]
+        if self._reject_time is not None:
+            data = data[..., self._reject_time]
+        bad_tuples = _get_bad_tuples(
+            data,
+            self.ch_names,
+            self._channel_type_idx,
+            self.reject,
+            self.flat,
+            ignore_chs=self.info["bads"],
+        )
+        return [(True, None) if bad == () else (False, bad) for bad in bad_tuples]
+
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
 
-        Note: operates inplace
+        Note: operates inplace, on a single epoch or an array of epochs
         """
         if (epoch is None) or isinstance(epoch, str):
             return epoch
@@ -944,7 +969,9 @@ class BaseEpochs(
             # We explicitly detrend just data channels (not EMG, ECG, EOG which
             # are processed by baseline correction)
             use_picks = _pick_data_channels(self.info, exclude=())
-            epoch[use_picks] = detrend(epoch[use_picks], self.detrend, axis=1)
+            epoch[..., use_picks, :] = detrend(
+                epoch[..., use_picks, :], self.detrend, axis=-1
+            )
 
         # Baseline correct
         if self._do_baseline:
@@ -958,7 +985,7 @@ class BaseEpochs(
             )
 
         # Decimate if necessary (i.e., epoch not preloaded)
-        epoch = epoch[:, self._decim_slice]
+        epoch = epoch[..., self._decim_slice]
 
         # handle offset
         if self._offset is not None:
@@ -1124,7 +1151,19 @@ class BaseEpochs(
         This would compute the trimmed mean.
         """
         self._handle_empty("raise", "average")
-        if by_event_type:
+        if by_event_type and not self.preload and method in ("mean", "std"):
+            # accumulate all event types in a single pass over the data
+            self._check_aggregate_picks(picks)
+            event_types = list(self.event_id.keys())
+            groups = [[self.event_id[event_type]] for event_type in event_types]
+            evokeds = list()
+            for event_type, (data, n_events) in zip(
+                event_types, self._stream_aggregate(method, groups)
+            ):
+                evokeds.append(
+                    self._aggregate_to_evoked(data, picks, n_events, method, event_type)
+                )
+        elif by_event_type:
             evokeds = list()
             for event_type in self.event_id.keys():
                 ev = self[event_type]._compute_aggregate(picks=picks, mode=method)
@@ -1149,8 +1188,7 @@ class BaseEpochs(
         """
         return self.average(picks=picks, method="std", by_event_type=by_event_type)
 
-    def _compute_aggregate(self, picks, mode="mean"):
-        """Compute the mean, median, or std over epochs and return Evoked."""
+    def _check_aggregate_picks(self, picks):
         # if instance contains ICA channels they won't be included unless picks
         # is specified
         if picks is None:
@@ -1165,8 +1203,9 @@ class BaseEpochs(
                     "selected in picks"
                 )
 
-        n_channels = len(self.ch_names)
-        n_times = len(self.times)
+    def _compute_aggregate(self, picks, mode="mean"):
+        """Compute the mean, median, or std over epochs and return Evoked."""
+        self._check_aggregate_picks(picks)
 
         if self.preload:
             n_events = len(self.events)
@@ -1184,28 +1223,64 @@ class BaseEpochs(
                     "If data are not preloaded, can only compute "
                     "mean or standard deviation."
                 )
-            data = np.zeros((n_channels, n_times))
-            n_events = 0
-            for e in self:
-                if np.iscomplexobj(e):
-                    data = data.astype(np.complex128)
-                data += e
-                n_events += 1
+            ((data, n_events),) = self._stream_aggregate(mode, [None])
 
-            if n_events > 0:
-                data /= n_events
-            else:
-                data.fill(np.nan)
+        return self._aggregate_to_evoked(data, picks, n_events, mode, self._name)
 
-            # convert to stderr if requested, could do in one pass but do in
-            # two (slower) in case there are large numbers
-            if mode == "std":
-                data_mean = data.copy()
-                data.fill(0.0)
-                for e in self:
-                    data += (e - data_mean) ** 2
-                data = np.sqrt(data / n_events)
+    def _stream_aggregate(self, mode, groups):
+        """Compute the mean or std of groups of epochs in one pass over the data.
+
+        Parameters
+        ----------
+        mode : 'mean' | 'std'
+            What to compute.
+        groups : list of (list of int | None)
+            The event codes of the epochs to combine in each group, or None to
+            combine all epochs.
+
+        Returns
+        -------
+        aggregates : list of tuple
+            The ``(data, n_events)`` of each group.
+        """
+        shape = (len(self.ch_names), len(self.times))
+        n_events = np.zeros(len(groups), int)
+        sums = [np.zeros(shape) for _ in groups]
+        m2s = [np.zeros(shape) for _ in groups] if mode == "std" else None
+        # running sum (so that the mean is sum / n, as when summing the epochs)
+        # and sum of squared deviations from the running mean (Welford)
+        self.__iter__()
+        while True:
+            try:
+                e, event_code = self.__next__(True)
+            except StopIteration:
+                break
+            for gi, group in enumerate(groups):
+                if group is not None and event_code not in group:
+                    continue
+                if np.iscomplexobj(e) and not np.iscomplexobj(sums[gi]):
+                    sums[gi] = sums[gi].astype(np.complex128)
+                    if m2s is not None:
+                        m2s[gi] = m2s[gi].astype(np.complex128)
+                if m2s is not None and n_events[gi] > 0:
+                    delta = e - sums[gi] / n_events[gi]
+                sums[gi] += e
+                n_events[gi] += 1
+                if m2s is not None and n_events[gi] > 1:
+                    m2s[gi] += delta * (e - sums[gi] / n_events[gi])
+        aggregates = list()
+        for gi in range(len(groups)):
+            data = sums[gi]
+            if n_events[gi] == 0:
+                data.fill(np.nan)
+            elif mode == "std":
+                data = np.sqrt(m2s[gi] / n_events[gi])
+            else:
+                data /= n_events[gi]
+            aggregates.append((data, int(n_events[gi])))
+        return aggregates
 
+    def _aggregate_to_evoked(self, data, picks, n_events, mode, comment):
         if mode == "std":
             kind = "standard_error"
             data /= np.sqrt(n_events)
@@ -1213,7 +1288,7 @@ class BaseEpochs(
             kind = "average"
 
         return self._evoked_from_epoch_data(
-            data, self.info, picks, n_events, kind, self._name
+            data, self.info, picks, n_events, kind, comment
         )
 
     @property
@@ -1609,6 +1684,10 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _get_epochs_from_raw(self, idxs):
+        """Get the given epochs from disk (subclasses may read in batches)."""
+        return [self._get_epoch_from_raw(idx) for idx in idxs]
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1617,9 +1696,74 @@ class BaseEpochs(
             return epoch
         proj = self._do_delayed_proj or self.proj
         if self._projector is not None and proj is True:
-            epoch = np.dot(self._projector, epoch)
+            # keep single-precision data in single precision
+            epoch = (self._projector @ epoch).astype(epoch.dtype, copy=False)
         return epoch
 
+    def _get_checked_epoch(self, idx, detrend_picks, verbose=None):
+        """Get one processed epoch along with its rejection status."""
+        if self.preload:  # from memory
+            if self._do_delayed_proj:
+                epoch_noproj = self._data[idx]
+                epoch = self._project_epoch(epoch_noproj)
+            else:
+                epoch_noproj = None
+                epoch = self._data[idx]
+        else:  # from disk
+            epoch_noproj = self._get_epoch_from_raw(idx)
+            epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
+            epoch = self._project_epoch(epoch_noproj)
+
+        epoch_out = epoch_noproj if self._do_delayed_proj else epoch
+        return idx, epoch_out, self._is_good_epoch(epoch, verbose=verbose)
+
+    def _get_epochs_batch_from_raw(self, idxs):
+        """Get the given epochs as one array, or None if not possible."""
+        return None
+
+    def _get_epochs_subset_from_raw(self, idxs, picks, time_sl):
+        """Get some channels and samples of epochs as one array, or None.
+
+        Readers that can read subsets of the data from disk return the
+        calibrated data of shape ``(len(idxs), len(picks), n_samples)``.
+        """
+        return None
+
+    def _read_data_subset(self, idxs, picks, start, stop):
+        """Read only the requested channels and samples of epochs, or None.
+
+        This is only possible when the epochs are not processed after reading,
+        as detrending, baseline correction, and projection need all channels
+        and samples.
+        """
+        proj = self._projector is not None and self.proj is True
+        if (
+            self.detrend is not None
+            or self._do_baseline
+            or self._offset is not None
+            or (proj and not self._do_delayed_proj)
+            or len(idxs) == 0
+        ):
+            return None
+        # decimation is done when reading
+        times = range(len(self._raw_times))[self._decim_slice][start:stop]
+        time_sl = slice(times.start, times.stop, times.step)
+        # read up to ~100 MB of epochs at a time
+        n_batch = max(int(100e6 // max(len(picks) * len(times) * 8, 1)), 1)
+        data = None
+        for b_start in range(0, len(idxs), n_batch):
+            b_idx = idxs[b_start : b_start + n_batch]
+            epochs = self._get_epochs_subset_from_raw(b_idx, picks, time_sl)
+            if epochs is None:
+                return None
+            if data is None:
+                data = np.empty(
+                    (len(idxs),) + epochs.shape[1:],
+                    dtype=_get_data_dtype(epochs.dtype),
+                )
+            data[b_start : b_start + len(b_idx)] = epochs
+        return data
+
     def _handle_empty(self, on_empty, meth):
         if len(self.events) == 0:
             msg = (
@@ -1743,22 +1887,37 @@ class BaseEpochs(
                     copy=copy,
                 )
 
+            # only the requested channels and samples when possible
+            data = self._read_data_subset(use_idx, picks, start, stop)
+            if data is not None:
+                if ch_factors is not None:
+                    data *= ch_factors[:, np.newaxis]
+                return data
+
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
-                # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
-                if ii == 0:
-                    data = np.empty(
-                        (n_events, len(self.ch_names), len(self.times)),
-                        dtype=epoch_out.dtype,
+            # read up to ~100 MB of epochs at a time
+            n_batch = len(self.ch_names) * len(self._raw_times) * 8
+            n_batch = max(int(100e6 // n_batch), 1)
+            for b_start in range(0, n_events, n_batch):
+                b_idx = use_idx[b_start : b_start + n_batch]
+                epochs_noproj = self._get_epochs_from_raw(b_idx)
+                for ii, epoch_noproj in enumerate(epochs_noproj, b_start):
+                    epoch_noproj = self._detrend_offset_decim(
+                        epoch_noproj, detrend_picks
                     )
-                data[ii] = epoch_out
+                    if self._do_delayed_proj:
+                        epoch_out = epoch_noproj
+                    else:
+                        epoch_out = self._project_epoch(epoch_noproj)
+                    if ii == 0:
+                        # faster to pre-allocate memory here
+                        data = np.empty(
+                            (n_events, len(self.ch_names), len(self.times)),
+                            dtype=_get_data_dtype(epoch_out.dtype),
+                        )
+                    data[ii] = epoch_out
+                del epochs_noproj
         else:
             # bads need to be dropped, this might occur after a preload
             # e.g., when calling drop_bad w/new params
@@ -1766,43 +1925,51 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
+            detrend_picks = self._detrend_picks
             if not self.preload:
-                detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
+                # gather and process up to ~100 MB of epochs at a time
+                n_batch = len(self.ch_names) * len(self._raw_times) * 8
+                n_batch = max(int(100e6 // n_batch), 1)
+            else:
+                n_batch = max(n_events, 1)
+            for b_start in range(0, n_events, n_batch):
+                b_idx = np.arange(b_start, min(b_start + n_batch, n_events))
+                epochs_noproj = None
+                if not self.preload:
+                    epochs_noproj = self._get_epochs_batch_from_raw(b_idx)
+                if epochs_noproj is not None:  # all at once from memory
+                    epochs_noproj = self._detrend_offset_decim(
+                        epochs_noproj, detrend_picks
                     )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
-                    assert isinstance(bad_tuple, tuple)
-                    assert all(isinstance(x, str) for x in bad_tuple)
-                    drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
-
-                # store the epoch if there is a reason to (output or update)
-                if out or self.preload:
-                    # faster to pre-allocate, then trim as necessary
-                    if n_out == 0 and not self.preload:
-                        data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
-                        )
-                    data[n_out] = epoch_out
-                    n_out += 1
+                    epochs = self._project_epoch(epochs_noproj)
+                    epochs_out = epochs_noproj if self._do_delayed_proj else epochs
+                    checked = zip(b_idx, epochs_out, self._is_good_epochs(epochs))
+                else:
+                    checked = (
+                        self._get_checked_epoch(idx, detrend_picks, verbose=verbose)
+                        for idx in b_idx
+                    )
+                for idx, epoch_out, (is_good, bad_tuple) in checked:
+                    sel = self.selection[idx]
+                    if not is_good:
+                        assert isinstance(bad_tuple, tuple)
+                        assert all(isinstance(x, str) for x in bad_tuple)
+                        drop_log[sel] = drop_log[sel] + bad_tuple
+                        continue
+                    good_idx.append(idx)
+
+                    # store the epoch if there is a reason to (output or update)
+                    if out or self.preload:
+                        # faster to pre-allocate, then trim as necessary
+                        if n_out == 0 and not self.preload:
+                            data = np.empty(
+                                (n_events, epoch_out.shape[0], epoch_out.shape[1]),
+                                dtype=_get_data_dtype(epoch_out.dtype),
+                                order="C",
+                            )
+                        data[n_out] = epoch_out
+                        n_out += 1
+                del checked
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -2213,13 +2380,21 @@ class BaseEpochs(
         ----------
         fname : path-like
             The name of the file, which should end with ``-epo.fif`` or
-            ``-epo.fif.gz``.
+            ``-epo.fif.gz``. Using ``-epo.h5`` saves the epochs in chunked and
+            compressed HDF5 format (one epoch per chunk, which requires
+            ``h5io``), so that reading a subset of epochs with
+            ``preload=False`` only reads and decompresses those epochs.
+
+            .. versionchanged:: 1.13
+               Support for the HDF5 format.
         split_size : str | int
             Large raw files are automatically split into multiple pieces. This
             parameter specifies the maximum size of each piece. If the
             parameter is an integer, it specifies the size in Bytes. It is
             also possible to pass a human-readable string, e.g., 100MB.
             Note: Due to FIFF file limitations, the maximum split size is 2GB.
+            HDF5 files are not split, so ``split_size`` and ``split_naming``
+            must be left at their defaults when saving to ``-epo.h5``.
 
             .. versionadded:: 0.10.0
         fmt : str
@@ -2253,7 +2428,16 @@ class BaseEpochs(
         Bad epochs will be dropped before saving the epochs to disk.
         """
         check_fname(
-            fname, "epochs", ("-epo.fif", "-epo.fif.gz", "_epo.fif", "_epo.fif.gz")
+            fname,
+            "epochs",
+            (
+                "-epo.fif",
+                "-epo.fif.gz",
+                "_epo.fif",
+                "_epo.fif.gz",
+                "-epo.h5",
+                "_epo.h5",
+            ),
         )
 
         # check for file existence and expand `~` if present
@@ -2269,10 +2453,21 @@ class BaseEpochs(
         split_size_bytes = _get_split_size(split_size)
 
         _check_option("fmt", fmt, ["single", "double"])
+        if fname.endswith(".h5"):
+            from .io.hdf5.hdf5 import _check_hdf5_split
+
+            _check_hdf5_split(split_size_bytes, split_naming)
 
         # to know the length accurately. The get_data() call would drop
         # bad epochs anyway
         self.drop_bad()
+        if fname.endswith(".h5"):
+            from .io.hdf5.hdf5 import _write_epochs_hdf5
+
+            if len(self) == 0:
+                warn("Saving epochs with no data")
+            self._check_consistency()
+            return _write_epochs_hdf5(self, fname, fmt, overwrite)
         # total_size tracks sizes that get split
         # over_size tracks overhead (tags, things that get written to each)
         if len(self) == 0:
@@ -3702,6 +3897,48 @@ class Epochs(BaseEpochs):
         )
         return data
 
+    def _get_epochs_batch_from_raw(self, idxs):
+        """Gather several epochs from preloaded Raw data with one indexing step.
+
+        Returns None (so that epochs are read one at a time) unless the Raw
+        is preloaded, all epochs are within the data, and no bad annotations
+        overlap the epochs when rejecting by annotation.
+        """
+        raw = self._raw
+        if raw is None or not raw.preload or len(idxs) == 0:
+            return None
+        sfreq = raw.info["sfreq"]
+        event_samps = self.events[idxs, 0]
+        n_times = len(self._raw_times)
+        starts = np.round(event_samps + self._raw_times[0] * sfreq).astype(np.int64)
+        starts -= raw.first_samp
+        if starts.min() < 0 or starts.max() + n_times > raw._data.shape[1]:
+            return None
+        if self.reject_by_annotation and len(raw.annotations) > 0:
+            reject_tmin = self.reject_tmin
+            if reject_tmin is None:
+                reject_tmin = self._raw_times[0]
+            reject_starts = np.round(event_samps + reject_tmin * sfreq)
+            reject_starts -= raw.first_samp
+            reject_tmax = self.reject_tmax
+            if reject_tmax is None:
+                reject_tmax = self._raw_times[-1]
+            diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
+            reject_stops = starts + n_times - diff
+            annot = raw.annotations
+            bad = np.array(
+                [desc.lower().startswith("bad") for desc in annot.description], bool
+            )
+            onset = _sync_onset(raw, annot.onset)[bad]
+            offset = onset + annot.duration[bad]
+            overlaps = (onset[:, np.newaxis] < reject_stops / sfreq) & (
+                offset[:, np.newaxis] > reject_starts / sfreq
+            )
+            if overlaps.any():
+                return None
+        windows = np.lib.stride_tricks.sliding_window_view(raw._data, n_times, axis=1)
+        return windows[self.picks[np.newaxis], starts[:, np.newaxis]]
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
@@ -4073,6 +4310,35 @@ def _is_good(
             return False, bad_tuple
 
 
+def _get_bad_tuples(data, ch_names, channel_type_idx, reject, flat, ignore_chs=()):
+    """Test many epochs at once against non-callable reject and flat.
+
+    Equivalent to calling ``_is_good(..., full_report=True)`` on each epoch.
+    """
+    bad_tuples = [()] * len(data)
+    if len(data) == 0:
+        return bad_tuples
+    checkable = ~np.isin(ch_names, list(ignore_chs))
+    deltas = np.ptp(data, axis=-1)  # (n_epochs, n_channels)
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is None:
+            continue
+        for key, criterion in refl.items():
+            idx = channel_type_idx[key]
+            if len(idx) == 0:
+                continue
+            bads = f(deltas[:, idx], criterion) & checkable[idx]
+            for ei in np.where(bads.any(axis=1))[0]:
+                bad_names = tuple(ch_names[idx[i]] for i in np.where(bads[ei])[0])
+                if bad_tuples[ei] == ():
+                    logger.info(
+                        f"    Rejecting {t} epoch based on {key.upper()} : "
+                        f"{list(bad_names)}"
+                    )
+                bad_tuples[ei] = bad_tuples[ei] + bad_names
+    return bad_tuples
+
+
 def _read_one_epoch_file(f, tree, preload):
     """Read a single FIF file."""
     with f as fid:
@@ -4260,7 +4526,7 @@ def _read_one_epoch_file(f, tree, preload):
 
 @verbose
 def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
-    """Read epochs from a fif file.
+    """Read epochs from a fif (or HDF5) file.
 
     Parameters
     ----------
@@ -4276,6 +4542,10 @@ def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
     epochs : instance of Epochs
         The epochs.
     """
+    if _path_like(fname) and str(fname).endswith(".h5"):
+        from .io.hdf5.hdf5 import EpochsHDF5
+
+        return EpochsHDF5(fname, proj, preload, verbose)
     return EpochsFIF(fname, proj, preload, verbose)
 
 
@@ -4333,77 +4603,78 @@ class EpochsFIF(BaseEpochs):
         fname_rep = _get_fname_rep(fname)
         ep_list = list()
         raw = list()
-        for fname in fnames:
-            logger.info(f"Reading {fname_rep} ...")
-            fid, tree, _ = fiff_open(fname, preload=preload)
-            next_fname = _get_next_fname(fid, fname, tree)
-            (
-                info,
-                data,
-                data_tag,
-                events,
-                event_id,
-                metadata,
-                tmin,
-                tmax,
-                baseline,
-                selection,
-                drop_log,
-                epoch_shape,
-                cals,
-                reject_params,
-                fmt,
-                annotations,
-                raw_sfreq,
-            ) = _read_one_epoch_file(fid, tree, preload)
-
-            if (events[:, 0] < 0).any():
-                events = events.copy()
-                warn(
-                    "Incorrect events detected on disk, setting event "
-                    "numbers to consecutive increasing integers"
-                )
-                events[:, 0] = np.arange(1, len(events) + 1)
-            # here we ignore missing events, since users should already be
-            # aware of missing events if they have saved data that way
-            # we also retain original baseline without re-applying baseline
-            # correction (data is being baseline-corrected when written to
-            # disk)
-            epoch = BaseEpochs(
-                info,
-                data,
-                events,
-                event_id,
-                tmin,
-                tmax,
-                baseline=None,
-                metadata=metadata,
-                on_missing="ignore",
-                selection=selection,
-                drop_log=drop_log,
-                proj=False,
-                verbose=False,
-                raw_sfreq=raw_sfreq,
-            )
-            epoch.baseline = baseline
-            epoch._do_baseline = False  # might be superfluous but won't hurt
-            ep_list.append(epoch)
-
-            if not preload:
-                # store everything we need to index back to the original data
-                raw.append(
-                    _RawContainer(
-                        fiff_open(fname)[0],
-                        data_tag,
-                        events[:, 0].copy(),
-                        epoch_shape,
-                        cals,
-                        fmt,
+        with _fiff_cache_dir_scope():
+            for fname in fnames:
+                logger.info(f"Reading {fname_rep} ...")
+                fid, tree, _ = fiff_open(fname, preload=preload)
+                next_fname = _get_next_fname(fid, fname, tree)
+                (
+                    info,
+                    data,
+                    data_tag,
+                    events,
+                    event_id,
+                    metadata,
+                    tmin,
+                    tmax,
+                    baseline,
+                    selection,
+                    drop_log,
+                    epoch_shape,
+                    cals,
+                    reject_params,
+                    fmt,
+                    annotations,
+                    raw_sfreq,
+                ) = _read_one_epoch_file(fid, tree, preload)
+
+                if (events[:, 0] < 0).any():
+                    events = events.copy()
+                    warn(
+                        "Incorrect events detected on disk, setting event "
+                        "numbers to consecutive increasing integers"
                     )
+                    events[:, 0] = np.arange(1, len(events) + 1)
+                # here we ignore missing events, since users should already be
+                # aware of missing events if they have saved data that way
+                # we also retain original baseline without re-applying baseline
+                # correction (data is being baseline-corrected when written to
+                # disk)
+                epoch = BaseEpochs(
+                    info,
+                    data,
+                    events,
+                    event_id,
+                    tmin,
+                    tmax,
+                    baseline=None,
+                    metadata=metadata,
+                    on_missing="ignore",
+                    selection=selection,
+                    drop_log=drop_log,
+                    proj=False,
+                    verbose=False,
+                    raw_sfreq=raw_sfreq,
                 )
+                epoch.baseline = baseline
+                epoch._do_baseline = False  # might be superfluous but won't hurt
+                ep_list.append(epoch)
+
+                if not preload:
+                    # store everything we need to index back to the original data
+                    raw.append(
+                        _RawContainer(
+                            fiff_open(fname)[0],
+                            data_tag,
+                            events[:, 0].copy(),
+                            epoch_shape,
+                            cals,
+                            fmt,
+                        )
+                    )
 
-            if next_fname is not None:
-                fnames.append(next_fname)
+                if next_fname is not None:
+                    fnames.append(next_fname)
 
         unsafe_annot_add = raw_sfreq is None
         (
@@ -4476,46 +4747,82 @@ class EpochsFIF(BaseEpochs):
     @verbose
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
-        # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
-        for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
-                break
-        else:
+        return self._get_epochs_from_raw([idx])[0]
+
+    def _get_epochs_from_raw(self, idxs):
+        """Load several epochs from disk, coalescing contiguous reads."""
+        # Find the right file and on-disk epoch index for each requested epoch
+        idxs = np.atleast_1d(np.asarray(idxs, int))
+        event_samps = self.events[idxs, 0]
+        which = np.full(len(idxs), -1, int)
+        disk_idx = np.full(len(idxs), -1, int)
+        for ri, raw in enumerate(self._raw):
+            if len(raw.event_samps) == 0:
+                continue
+            order = np.argsort(raw.event_samps)
+            pos = np.searchsorted(raw.event_samps, event_samps, sorter=order)
+            pos = np.minimum(pos, len(order) - 1)
+            found = (raw.event_samps[order[pos]] == event_samps) & (which < 0)
+            which[found] = ri
+            disk_idx[found] = order[pos[found]]
+        if (which < 0).any():
             # read the correct subset of the data
             raise RuntimeError(
                 "Correct epoch could not be found, please contact mne-python developers"
             )
-        # the following is equivalent to this, but faster:
-        #
-        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
-        # >>> data *= raw.cals[np.newaxis, :, :]
-        # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
+        out = [None] * len(idxs)
+        for ri, raw in enumerate(self._raw):
+            mask = np.where(which == ri)[0]
+            if len(mask) == 0:
+                continue
+            # read each run of consecutive on-disk epochs with a single read
+            want = np.unique(disk_idx[mask])
+            breaks = np.where(np.diff(want) != 1)[0] + 1
+            data = dict()
+            for run in np.split(want, breaks):
+                run_data = _read_epochs_fif_run(raw, run[0], len(run))
+                data.update(zip(run.tolist(), run_data))
+            for ii in mask:
+                out[ii] = data[disk_idx[ii]]
+        # each epoch is scaled in place downstream, so duplicates need copies
+        seen = set()
+        for ii in range(len(out)):
+            if id(out[ii]) in seen:
+                out[ii] = out[ii].copy()
+            seen.add(id(out[ii]))
+        return out
+
+
+def _read_epochs_fif_run(raw, start, n_epochs):
+    """Read consecutive epochs from a _RawContainer in a single read."""
+    fmt = raw.fmt
+    size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
+    offset = start * size + 16  # 16 = Tag header
+    # the following is equivalent to this, but faster:
+    #
+    # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
+    # >>> data *= raw.cals[np.newaxis, :, :]
+    # >>> data = data[start:start + n_epochs]
+    #
+    # Eventually this could be refactored in io/tag.py if other functions
+    # could make use of it
+    raw.fid.seek(raw.data_tag.pos + offset, 0)
+    if fmt == ">c8":
+        read_fmt = ">f4"
+    elif fmt == ">c16":
+        read_fmt = ">f8"
+    else:
+        read_fmt = fmt
+    data = np.frombuffer(raw.fid.read(size * n_epochs), read_fmt)
+    if read_fmt != fmt:
+        data = data.view(fmt)
+        data = data.astype(np.complex128)
+    else:
+        data = data.astype(np.float64)
 
-        data = _reshape_view(data, raw.epoch_shape)
-        data *= raw.cals
-        return data
+    data = _reshape_view(data, (n_epochs,) + tuple(raw.epoch_shape))
+    data *= raw.cals
+    return list(data)
 
 
 @fill_doc
@@ -4849,6 +5156,7 @@ def average_movements(
         _check_destination,
         _check_usable,
         _col_norm_pinv,
+        _get_cached_trans_sss_basis,
         _get_coil_scale,
         _get_mf_picks_fix_mags,
         _get_n_moments,
@@ -4856,6 +5164,7 @@ def average_movements(
         _prep_mf_coils,
         _remove_meg_projs_comps,
         _reset_meg_bads,
+        _sss_cache,
         _trans_sss_basis,
     )
 
@@ -4904,6 +5213,7 @@ def average_movements(
     decomp_coil_scale = coil_scale[good_mask]
     exp = dict(int_order=int_order, ext_order=ext_order, head_frame=True, origin=origin)
     n_in = _get_n_moments(int_order)
+    cache_dir = _sss_cache.get_dir()
     for ei, epoch in enumerate(epochs):
         event_time = epochs.events[epochs._current - 1, 0] / orig_sfreq
         use_idx = np.where(t <= event_time)[0]
@@ -4926,7 +5236,9 @@ def average_movements(
             reuse = True
         epoch = epoch.copy()  # because we operate inplace
         if not reuse:
-            S = _trans_sss_basis(exp, all_coils, trans, coil_scale=decomp_coil_scale)
+            S = _get_cached_trans_sss_basis(
+                exp, all_coils, trans, decomp_coil_scale, cache_dir=cache_dir
+            )
             # Get the weight from the un-regularized version (eq. 44)
             weight = np.linalg.norm(S[:, :n_in])
             # XXX Eventually we could do cross-talk and fine-cal here
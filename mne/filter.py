@@ -4,10 +4,13 @@
 
 """IIR and FIR filtering and resampling functions."""
 
-from collections import Counter
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import partial
 from math import gcd
+from threading import Lock
 
 import numpy as np
 from scipy import fft, signal
@@ -23,13 +26,14 @@ from .cuda import (
     _smart_pad,
 )
 from .fixes import _reshape_view, minimum_phase
-from .parallel import parallel_func
+from .parallel import _check_n_jobs, parallel_func
 from .utils import (
     _check_option,
     _check_preload,
     _ensure_int,
     _pl,
     _validate_type,
+    get_config,
     logger,
     sum_squared,
     verbose,
@@ -39,6 +43,137 @@ from .utils import (
 # These values from Ifeachor and Jervis.
 _length_factors = dict(hann=3.1, hamming=3.3, blackman=5.0)
 
+# Minimum number of samples (rows times padded length) to FIR filter in blocks
+# of rows with threaded FFTs when n_jobs > 1
+_FIR_BLOCK_MIN_SIZE = 1_000_000
+
+# In-memory LRU cache of filter designs (FIR kernels, IIR coefficients and
+# ringing estimates, kernel FFTs, DPSS tapers), shared by all filtering calls
+_filter_cache = OrderedDict()
+_filter_cache_stats = dict(hits=0, misses=0)
+_filter_cache_config = dict(max_size=None)
+_filter_cache_lock = Lock()
+
+
+def _get_filter_cache_size():
+    """Get the maximum cache size, looked up once until the cache is cleared."""
+    max_size = _filter_cache_config["max_size"]
+    if max_size is None:
+        max_size = int(get_config("MNE_FILTER_CACHE_SIZE", "128"))
+        _filter_cache_config["max_size"] = max_size
+    return max_size
+
+
+def _freeze(obj):
+    """Make the arrays in a cached value read-only."""
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+    elif isinstance(obj, tuple | list):
+        for o in obj:
+            _freeze(o)
+    return obj
+
+
+def _get_cached_filter(key, func, *, copy=False):
+    """Get func() from the filter cache, computing and storing it if needed.
+
+    With ``copy=True``, a copy is returned instead of the read-only cached
+    value (e.g., SciPy's IIR filtering functions need writeable coefficients).
+    """
+    max_size = _get_filter_cache_size()
+    if max_size <= 0:
+        return func()
+    with _filter_cache_lock:
+        out = _filter_cache.get(key)
+        if out is not None:
+            _filter_cache.move_to_end(key)
+            _filter_cache_stats["hits"] += 1
+    if out is None:
+        out = _freeze(func())
+        with _filter_cache_lock:
+            _filter_cache_stats["misses"] += 1
+            _filter_cache[key] = out
+            while len(_filter_cache) > max_size:
+                _filter_cache.popitem(last=False)
+    return deepcopy(out) if copy else out
+
+
+def _filter_cache_key(*args):
+    """Convert arguments to a hashable key for the filter cache."""
+    key = list()
+    for arg in args:
+        if isinstance(arg, np.ndarray | list | tuple):
+            arg = tuple(np.atleast_1d(np.asarray(arg, float)).tolist())
+        elif isinstance(arg, np.generic):
+            arg = arg.item()
+        key.append(arg)
+    return tuple(key)
+
+
+def get_filter_cache_info():
+    """Get information about the in-memory cache of filter designs.
+
+    Designing a filter (e.g., a FIR kernel with :func:`scipy.signal.firwin`,
+    or IIR coefficients along with the number of samples needed to pad for
+    ringing) is repeated every time the same filter is requested. Designs are
+    thus kept in a least-recently-used cache that is shared by all filtering
+    functions and methods, along with the FFTs of the FIR kernels used for
+    overlap-add filtering and the DPSS tapers used by
+    ``method='spectrum_fit'`` notch filtering.
+
+    Returns
+    -------
+    info : dict
+        A dictionary with keys:
+
+        ``n_entries``
+            The number of cached designs and kernel FFTs.
+        ``max_size``
+            The maximum number of entries, set by the
+            ``MNE_FILTER_CACHE_SIZE`` configuration value (see
+            :func:`mne.set_config`, defaults to 128), which is looked up
+            when the cache is first used and again after
+            :func:`~mne.filter.clear_filter_cache`. Zero disables the cache.
+        ``hits``, ``misses``
+            The number of designs that were found in the cache and computed,
+            respectively, since the cache was last cleared.
+
+    See Also
+    --------
+    clear_filter_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    with _filter_cache_lock:
+        return dict(
+            n_entries=len(_filter_cache),
+            max_size=_get_filter_cache_size(),
+            **_filter_cache_stats,
+        )
+
+
+def clear_filter_cache():
+    """Remove all entries from the in-memory cache of filter designs.
+
+    This also resets the hit and miss counts, and the maximum number of
+    entries is looked up again from the ``MNE_FILTER_CACHE_SIZE``
+    configuration value the next time the cache is used.
+
+    See Also
+    --------
+    get_filter_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    with _filter_cache_lock:
+        _filter_cache.clear()
+        _filter_cache_stats.update(hits=0, misses=0)
+        _filter_cache_config["max_size"] = None
+
 
 def next_fast_len(target):
     """Find the next fast size of input data to `fft`, for zero-padding, etc.
@@ -332,27 +467,82 @@ def _overlap_add_filter(
         )
 
     # Figure out if we should use CUDA
-    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
-
-    # Process each row separately
+    h_key = hashlib.sha1(np.ascontiguousarray(h).tobytes()).hexdigest()
+    h_fft = _get_cached_filter(
+        ("rfft", h.dtype.str, len(h), h_key, int(n_fft)),
+        partial(fft.rfft, h, n=n_fft),
+    )
     picks = _picks_to_idx(len(x), picks)
-    parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
-    if n_jobs == 1:
+    if not isinstance(n_jobs, str):
+        n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+    if _use_overlap_filter_blocks(n_jobs, len(picks), n_x):
+        # Process blocks of rows at once, with threaded FFTs
+        row_nbytes = 16 * (n_x + n_fft)
+        for block in _get_filter_blocks(picks, row_nbytes):
+            x[block] = _overlap_filter_block(
+                x[block], h_fft, len(h), n_edge, phase, pad, n_fft, n_jobs
+            )
+    else:
+        _, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, h_fft=h_fft)
+        # Process each row separately
         for p in picks:
             x[p] = _1d_overlap_filter(
                 x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
             )
-    else:
-        data_new = parallel(
-            p_fun(x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft) for p in picks
-        )
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
 
     x = _reshape_view(x, orig_shape)
     return x
 
 
+def _use_overlap_filter_blocks(n_jobs, n_rows, n_x):
+    """Check whether to filter blocks of rows with batched, threaded FFTs."""
+    # Batched FFTs are not faster than filtering row by row in a single thread
+    # (which also has a smaller memory footprint), but they can use n_jobs FFT
+    # threads, which only pays off when there is enough data to split
+    return (
+        not isinstance(n_jobs, str)
+        and n_jobs > 1
+        and n_rows > 1
+        and n_rows * n_x >= _FIR_BLOCK_MIN_SIZE
+    )
+
+
+def _get_filter_blocks(picks, row_nbytes, n_blocks=1):
+    """Split picks into blocks of rows that can be filtered at once."""
+    # use at most ~100 MB of working memory per block
+    n_blocks = max(int(np.ceil(len(picks) * row_nbytes / 100e6)), n_blocks)
+    n_blocks = min(n_blocks, len(picks))
+    return [block for block in np.array_split(picks, n_blocks) if len(block)]
+
+
+def _overlap_filter_block(x, h_fft, n_h, n_edge, phase, pad, n_fft, n_jobs):
+    """Do overlap-add FFT FIR filtering of the rows of a 2D array."""
+    # same as _1d_overlap_filter, but with batched FFTs over the rows
+    x_ext = _smart_pad(x, (n_edge, n_edge), pad)
+    n_x = x_ext.shape[1]
+    x_filtered = np.zeros_like(x_ext)
+
+    n_seg = n_fft - n_h + 1
+    n_segments = int(np.ceil(n_x / float(n_seg)))
+    shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+
+    for seg_idx in range(n_segments):
+        start = seg_idx * n_seg
+        stop = (seg_idx + 1) * n_seg
+        seg_fft = fft.rfft(x_ext[:, start:stop], n=n_fft, axis=-1, workers=n_jobs)
+        seg_fft *= h_fft
+        prod = fft.irfft(seg_fft, n=n_fft, axis=-1, workers=n_jobs)
+
+        start_filt = max(0, start - shift)
+        stop_filt = min(start - shift + n_fft, n_x)
+        start_prod = max(0, shift - start)
+        stop_prod = start_prod + stop_filt - start_filt
+        x_filtered[:, start_filt:stop_filt] += prod[:, start_prod:stop_prod]
+
+    # Remove mirrored edges that we added and cast (n_edge can be zero)
+    return x_filtered[:, : n_x - 2 * n_edge].astype(x.dtype)
+
+
 def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     """Do one-dimensional overlap-add FFT FIR filtering."""
     # pad to reduce ringing
@@ -474,6 +664,9 @@ def _construct_fir_filter(
     If x is multi-dimensional, this operates along the last dimension.
     """
     assert freq[0] == 0
+    key = _filter_cache_key(
+        "fir", sfreq, freq, gain, filter_length, phase, fir_window, fir_design
+    )
     if fir_design == "firwin2":
         fir_design = signal.firwin2
     else:
@@ -492,16 +685,10 @@ def _construct_fir_filter(
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
-    # construct symmetric (linear phase) filter
-    if phase == "minimum-half":
-        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
-        h = minimum_phase(h)
-    else:
-        h = fir_design(N, freq, gain, window=fir_window)
-        if phase == "minimum":
-            h = minimum_phase(h, half=False)
+    h, (att_db, att_freq) = _get_cached_filter(
+        key, partial(_design_fir, N, freq, gain, phase, fir_window, fir_design)
+    )
     assert h.size == N
-    att_db, att_freq = _filter_attenuation(h, freq, gain)
     if phase == "zero-double":
         att_db += 6
     if att_db < min_att_db:
@@ -513,6 +700,19 @@ def _construct_fir_filter(
     return h
 
 
+def _design_fir(N, freq, gain, phase, fir_window, fir_design):
+    """Design a FIR filter and compute its stop-band attenuation."""
+    # construct symmetric (linear phase) filter
+    if phase == "minimum-half":
+        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
+        h = minimum_phase(h)
+    else:
+        h = fir_design(N, freq, gain, window=fir_window)
+        if phase == "minimum":
+            h = minimum_phase(h, half=False)
+    return h, _filter_attenuation(h, freq, gain)
+
+
 def _check_zero_phase_length(N, phase, gain_nyq=0):
     N = int(N)
     if N % 2 == 0:
@@ -569,14 +769,18 @@ def _iir_filter(x, iir_params, picks, n_jobs, copy, phase="zero"):
         else:
             fun = partial(signal.lfilter, b=iir_params["b"], a=iir_params["a"], axis=-1)
             _check_coefficients((iir_params["b"], iir_params["a"]))
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs)
-    if n_jobs == 1:
-        for p in picks:
-            x[p] = fun(x=x[p])
+    # Process blocks of rows at once, in threads if requested
+    n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+    row_nbytes = 16 * (x.shape[1] + 2 * iir_params.get("padlen", 0))
+    blocks = _get_filter_blocks(picks, row_nbytes, n_blocks=n_jobs)
+    if n_jobs == 1 or len(blocks) == 1:
+        for block in blocks:
+            x[block] = fun(x=x[block])
     else:
-        data_new = parallel(p_fun(x=x[p]) for p in picks)
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            data_new = pool.map(lambda block: fun(x=x[block]), blocks)
+            for block, data in zip(blocks, data_new):
+                x[block] = data
     x = _reshape_view(x, orig_shape)
     return x
 
@@ -793,7 +997,7 @@ def construct_iir_filter(
     if not isinstance(iir_params, dict):
         raise TypeError(f"iir_params must be a dict, got {type(iir_params)}")
     # if the filter has been designed, we're good to go
-    Wp = None
+    Wp = key = None
     if "sos" in iir_params:
         system = iir_params["sos"]
         output = "sos"
@@ -847,7 +1051,12 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            key = _filter_cache_key(
+                "iirfilter", *(x for item in sorted(kwargs.items()) for x in item)
+            )
+            system = _get_cached_filter(
+                key, partial(signal.iirfilter, **kwargs), copy=True
+            )
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -862,13 +1071,27 @@ def construct_iir_filter(
                 raise ValueError(
                     "iir_params must have at least 'gstop' and 'gpass' (or N) entries."
                 )
-            system = signal.iirdesign(
+            key = _filter_cache_key(
+                "iirdesign",
                 Wp,
                 Ws,
                 iir_params["gpass"],
                 iir_params["gstop"],
-                ftype=ftype,
-                output=output,
+                ftype,
+                output,
+            )
+            system = _get_cached_filter(
+                key,
+                partial(
+                    signal.iirdesign,
+                    Wp,
+                    Ws,
+                    iir_params["gpass"],
+                    iir_params["gstop"],
+                    ftype=ftype,
+                    output=output,
+                ),
+                copy=True,
             )
 
     if system is None:
@@ -890,7 +1113,12 @@ def construct_iir_filter(
         logger.info(f"- Cutoff{_pl(f_pass)} at {edge_freqs} Hz: {cutoffs} dB")
     # now deal with padding
     if "padlen" not in iir_params:
-        padlen = estimate_ringing_samples(system)
+        if key is None:
+            padlen = estimate_ringing_samples(system)
+        else:
+            padlen = _get_cached_filter(
+                ("ringing",) + key, partial(estimate_ringing_samples, system)
+            )
     else:
         padlen = iir_params["padlen"]
 
@@ -925,6 +1153,33 @@ def _check_method(method, iir_params, extra_types=()):
     return iir_params, method
 
 
+_FIR_PAD_MODES = (
+    "reflect_limited",
+    "constant",
+    "edge",
+    "empty",
+    "linear_ramp",
+    "maximum",
+    "mean",
+    "median",
+    "minimum",
+    "reflect",
+    "symmetric",
+    "wrap",
+)
+
+
+def _check_fir_pad(pad, method):
+    """Check the padding mode of FIR filtering (None means "edge")."""
+    if method == "iir":
+        return pad
+    if pad is None:
+        pad = "edge"
+    if not callable(pad):  # numpy.pad also takes functions
+        _check_option("pad", pad, _FIR_PAD_MODES)
+    return pad
+
+
 @verbose
 def filter_data(
     data,
@@ -1013,7 +1268,7 @@ def filter_data(
     """
     data = _check_filterable(data)
     iir_params, method = _check_method(method, iir_params)
-    filt = create_filter(
+    filt = _create_filter(
         data,
         sfreq,
         l_freq,
@@ -1166,6 +1421,39 @@ def create_filter(
 
     .. versionadded:: 0.14
     """
+    out = _create_filter(
+        data,
+        sfreq,
+        l_freq,
+        h_freq,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    # FIR kernels are shared with the filter cache, return a writeable copy
+    return out.copy() if isinstance(out, np.ndarray) else out
+
+
+def _create_filter(
+    data,
+    sfreq,
+    l_freq,
+    h_freq,
+    filter_length,
+    l_trans_bandwidth,
+    h_trans_bandwidth,
+    method,
+    iir_params,
+    phase,
+    fir_window,
+    fir_design,
+):
+    """Create a filter, returning cached FIR kernels as read-only arrays."""
     sfreq = float(sfreq)
     if sfreq < 0:
         raise ValueError("sfreq must be positive")
@@ -1417,6 +1705,148 @@ def create_filter(
     return out
 
 
+class CausalFilter:
+    """Apply a filter causally to data arriving in consecutive chunks.
+
+    The filter state (IIR initial conditions, or the FIR overlap-add tail) is
+    kept between calls to :meth:`process`, so that filtering a signal chunk by
+    chunk gives the same result as filtering the concatenated signal at once.
+
+    Parameters
+    ----------
+    filt : array | dict
+        The filter to apply, as returned by :func:`mne.filter.create_filter`:
+        the FIR filter coefficients (for ``method='fir'``), or the IIR filter
+        parameters containing ``'sos'`` or ``'b'`` and ``'a'`` (for
+        ``method='iir'``).
+
+    See Also
+    --------
+    create_filter
+    filter_data
+
+    Notes
+    -----
+    Filters are applied in a single forward pass. The output is thus
+    equivalent to :func:`mne.filter.filter_data` with ``phase='forward'`` for
+    IIR filters, and with ``phase='minimum'`` and ``pad='constant'`` for FIR
+    filters, where in both cases the signal is assumed to be zero before the
+    first chunk. FIR filters should be designed with ``phase='minimum'``;
+    linear-phase (e.g., ``phase='zero'``) kernels can be used too, but then
+    delay the signal by ``(len(filt) - 1) // 2`` samples.
+
+    .. versionadded:: 1.13
+    """
+
+    def __init__(self, filt):
+        if isinstance(filt, dict):
+            if "sos" in filt:
+                self._system = dict(sos=np.array(filt["sos"], float))
+                _check_coefficients(self._system["sos"])
+            elif "b" in filt and "a" in filt:
+                self._system = dict(
+                    b=np.array(filt["b"], float), a=np.array(filt["a"], float)
+                )
+                _check_coefficients((self._system["b"], self._system["a"]))
+            else:
+                raise ValueError(
+                    "filt must contain 'sos' or 'b' and 'a' for IIR filtering, "
+                    f"got keys {sorted(filt)}"
+                )
+        else:
+            _validate_type(filt, (np.ndarray, list, tuple), "filt", "array or dict")
+            h = np.array(filt, float)
+            if h.ndim != 1 or len(h) == 0:
+                raise ValueError(
+                    f"FIR filter coefficients must be a non-empty 1D array, got "
+                    f"shape {h.shape}"
+                )
+            self._system = dict(h=h)
+        self.reset()
+
+    def __repr__(self):  # noqa: D105
+        if "h" in self._system:
+            kind = f"FIR, {len(self._system['h'])} taps"
+        elif "sos" in self._system:
+            kind = f"IIR, {len(self._system['sos'])} second-order sections"
+        else:
+            order = max(len(self._system["b"]), len(self._system["a"])) - 1
+            kind = f"IIR, order {order}"
+        return f"<CausalFilter | {kind}, {self._n_processed} samples processed>"
+
+    def reset(self):
+        """Reset the filter state, as if no data had been processed.
+
+        Returns
+        -------
+        filt : instance of CausalFilter
+            The filter object (modified in place).
+        """
+        self._state = None
+        self._shape = None
+        self._n_processed = 0
+        return self
+
+    def process(self, chunk):
+        """Filter the next chunk of data.
+
+        Parameters
+        ----------
+        chunk : array, shape (..., n_times)
+            The next samples of the signal, with time on the last axis. All
+            chunks must have the same shape except along the last axis.
+
+        Returns
+        -------
+        out : array, shape (..., n_times)
+            The filtered chunk.
+        """
+        chunk = _check_filterable(chunk)
+        if chunk.ndim == 0:
+            raise ValueError("chunk must have at least one dimension")
+        if self._shape is None:
+            self._shape = chunk.shape[:-1]
+        elif chunk.shape[:-1] != self._shape:
+            raise ValueError(
+                f"chunk must have shape {self._shape + (-1,)} (like the previous "
+                f"chunks), got {chunk.shape}; use reset() to start a new signal"
+            )
+        x = np.reshape(chunk, (int(np.prod(self._shape)), chunk.shape[-1]))
+        if x.shape[-1] == 0:
+            out = np.array(x, float)
+        elif "h" in self._system:
+            out = self._process_fir(x)
+        else:
+            out = self._process_iir(x)
+        self._n_processed += x.shape[-1]
+        return np.reshape(out, chunk.shape)
+
+    def _process_fir(self, x):
+        h = self._system["h"]
+        n_x, n_tail = x.shape[-1], len(h) - 1
+        if self._state is None:
+            self._state = np.zeros((len(x), n_tail), np.result_type(x, h))
+        # overlap-add: the tail of the previous chunks is added to this one
+        y = signal.oaconvolve(x, h[np.newaxis], mode="full", axes=-1)
+        y[:, :n_tail] += self._state
+        self._state = y[:, n_x:].copy()
+        return y[:, :n_x]
+
+    def _process_iir(self, x):
+        if "sos" in self._system:
+            sos = self._system["sos"]
+            if self._state is None:
+                self._state = np.zeros((len(sos), len(x), 2), np.result_type(x))
+            out, self._state = signal.sosfilt(sos, x, axis=-1, zi=self._state)
+        else:
+            b, a = self._system["b"], self._system["a"]
+            if self._state is None:
+                n_state = max(len(a), len(b)) - 1
+                self._state = np.zeros((len(x), n_state), np.result_type(x))
+            out, self._state = signal.lfilter(b, a, x, axis=-1, zi=self._state)
+        return out
+
+
 @verbose
 def notch_filter(
     x,
@@ -1526,31 +1956,11 @@ def notch_filter(
     x = _check_filterable(x, "notch filtered", "notch_filter")
     iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
 
-    if freqs is not None:
-        freqs = np.atleast_1d(freqs)
-    elif method != "spectrum_fit":
-        raise ValueError("freqs=None can only be used with method spectrum_fit")
-
-    # Only have to deal with notch_widths for non-autodetect
-    if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the same length as freqs"
-                )
-
+    freqs, notch_widths = _check_notch_freqs(freqs, notch_widths, method)
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
         tb_2 = trans_bandwidth / 2.0
-        lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
-        highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+        lows, highs = _get_notch_bands(freqs, notch_widths, tb_2)
         xf = filter_data(
             x,
             Fs,
@@ -1586,17 +1996,78 @@ def notch_filter(
     return xf
 
 
+def _check_notch_freqs(freqs, notch_widths, method):
+    """Check the notch frequencies and widths."""
+    if freqs is not None:
+        freqs = np.atleast_1d(freqs)
+    elif method != "spectrum_fit":
+        raise ValueError("freqs=None can only be used with method spectrum_fit")
+
+    # Only have to deal with notch_widths for non-autodetect
+    if freqs is not None:
+        if notch_widths is None:
+            notch_widths = freqs / 200.0
+        elif np.any(notch_widths < 0):
+            raise ValueError("notch_widths must be >= 0")
+        else:
+            notch_widths = np.atleast_1d(notch_widths)
+            if len(notch_widths) == 1:
+                notch_widths = notch_widths[0] * np.ones_like(freqs)
+            elif len(notch_widths) != len(freqs):
+                raise ValueError(
+                    "notch_widths must be None, scalar, or the same length as freqs"
+                )
+    return freqs, notch_widths
+
+
+def _get_notch_bands(freqs, notch_widths, tb_2):
+    """Get the edges of the stop bands of a FIR or IIR notch filter."""
+    lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
+    highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+    return lows, highs
+
+
+def _get_mt_filter_length(filter_length, sfreq, n_times):
+    """Get the window length (in samples) of spectrum_fit notch filtering."""
+    if isinstance(filter_length, str) and filter_length == "auto":
+        filter_length = "10s"
+    if filter_length is None:
+        filter_length = n_times
+    return min(_to_samples(filter_length, sfreq, "", ""), n_times)
+
+
+def _log_notch_freqs(freq_list, line_freqs):
+    """Report the frequencies removed by spectrum_fit notch filtering."""
+    # do some sanitizing first by binning into 1 Hz bins
+    counts = Counter(sum((np.unique(np.round(f)).tolist() for f in freq_list), list()))
+    kind = "Detected" if line_freqs is None else "Removed"
+    found_freqs = (
+        "\n".join(
+            f"    {freq:6.2f} : {counts[freq]:4d} window{_pl(counts[freq])}"
+            for freq in sorted(counts)
+        )
+        or "    None"
+    )
+    logger.info(f"{kind} notch frequencies (Hz):\n{found_freqs}")
+
+
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
 
-    # figure out what tapers to use
-    window_fun, _, _ = _compute_mt_params(
-        n_times, sfreq, mt_bandwidth, False, False, verbose=False
-    )
+    def _compute():
+        # figure out what tapers to use
+        window_fun, _, _ = _compute_mt_params(
+            n_times, sfreq, mt_bandwidth, False, False, verbose=False
+        )
 
-    # F-stat of 1-p point
-    threshold = fstat.ppf(1 - p_value / n_times, 2, 2 * len(window_fun) - 2)
-    return window_fun, threshold
+        # F-stat of 1-p point
+        threshold = fstat.ppf(1 - p_value / n_times, 2, 2 * len(window_fun) - 2)
+        return window_fun, float(threshold)
+
+    # the DPSS tapers are costly to compute for long windows, and the same
+    # lengths are used for (almost) every window and call
+    key = _filter_cache_key("dpss", int(n_times), sfreq, mt_bandwidth, p_value)
+    return _get_cached_filter(key, _compute)
 
 
 def _mt_spectrum_proc(
@@ -1614,49 +2085,36 @@ def _mt_spectrum_proc(
     """Call _mt_spectrum_remove."""
     # set up array for filtering, reshape to 2D, operate on last axis
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
-    if isinstance(filter_length, str) and filter_length == "auto":
-        filter_length = "10s"
-    if filter_length is None:
-        filter_length = x.shape[-1]
-    filter_length = min(_to_samples(filter_length, sfreq, "", ""), x.shape[-1])
+    filter_length = _get_mt_filter_length(filter_length, sfreq, x.shape[-1])
     get_wt = partial(
         _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
     )
     window_fun, threshold = get_wt(filter_length)
+    # Process blocks of channels at once (the tapered spectra of all channels
+    # in a block are kept in memory for each window)
     parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
+    n_tapers, n_samples = window_fun.shape
+    row_nbytes = 16 * (n_tapers + 1) * (n_samples // 2 + 1) + 8 * x.shape[-1]
+    blocks = _get_filter_blocks(picks, row_nbytes, n_blocks=n_jobs)
     if n_jobs == 1:
         freq_list = list()
-        for ii, x_ in enumerate(x):
-            if ii in picks:
-                x[ii], f = _mt_spectrum_remove_win(
-                    x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
-                )
-                freq_list.append(f)
+        for block in blocks:
+            x[block], f = _mt_spectrum_remove_win(
+                x[block], sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
+            )
+            freq_list.extend(f)
     else:
         data_new = parallel(
-            p_fun(x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
-            for xi, x_ in enumerate(x)
-            if xi in picks
-        )
-        freq_list = [d[1] for d in data_new]
-        data_new = np.array([d[0] for d in data_new])
-        x[picks, :] = data_new
-
-    # report found frequencies, but do some sanitizing first by binning into
-    # 1 Hz bins
-    counts = Counter(
-        sum((np.unique(np.round(ff)).tolist() for f in freq_list for ff in f), list())
-    )
-    kind = "Detected" if line_freqs is None else "Removed"
-    found_freqs = (
-        "\n".join(
-            f"    {freq:6.2f} : {counts[freq]:4d} window{_pl(counts[freq])}"
-            for freq in sorted(counts)
+            p_fun(
+                x[block], sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
+            )
+            for block in blocks
         )
-        or "    None"
-    )
-    logger.info(f"{kind} notch frequencies (Hz):\n{found_freqs}")
+        freq_list = sum((d[1] for d in data_new), list())
+        for block, d in zip(blocks, data_new):
+            x[block] = d[0]
 
+    _log_notch_freqs(freq_list, line_freqs)
     x = _reshape_view(x, orig_shape)
     return x
 
@@ -1664,6 +2122,7 @@ def _mt_spectrum_proc(
 def _mt_spectrum_remove_win(
     x, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
 ):
+    """Remove line frequencies from the rows of x in overlapping windows."""
     n_times = x.shape[-1]
     n_samples = window_fun.shape[1]
     n_overlap = (n_samples + 1) // 2
@@ -1675,7 +2134,7 @@ def _mt_spectrum_remove_win(
         out = _mt_spectrum_remove(
             x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
         )
-        rm_freqs.append(out[1])
+        rm_freqs.extend(out[1])
         return (out[0],)  # must return a tuple
 
     _COLA(process, x_out, n_times, n_samples, n_overlap, sfreq, verbose=False).feed(x)
@@ -1688,11 +2147,12 @@ def _mt_spectrum_remove(
     """Use MT-spectrum to remove line frequencies.
 
     Based on Chronux. If line_freqs is specified, all freqs within notch_width
-    of each line_freq is set to zero.
+    of each line_freq is set to zero. The rows of x (channels) are processed
+    at once, and the removed frequencies are returned for each row.
     """
     from .time_frequency.multitaper import _mt_spectra
 
-    assert x.ndim == 1
+    assert x.ndim == 2
     if x.shape[-1] != window_fun.shape[-1]:
         window_fun, threshold = get_thresh(x.shape[-1])
     # drop the even tapers
@@ -1708,12 +2168,12 @@ def _mt_spectrum_remove(
     H0_sq = sum_squared(H0)
 
     # make "time" vector
-    rads = 2 * np.pi * (np.arange(x.size) / float(sfreq))
+    rads = 2 * np.pi * (np.arange(x.shape[-1]) / float(sfreq))
 
     # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
-    x_p, freqs = _mt_spectra(x[np.newaxis, :], window_fun, sfreq)
+    x_p, freqs = _mt_spectra(x, window_fun, sfreq)
 
-    # sum of the product of x_p and H0 across tapers (1, n_freqs)
+    # sum of the product of x_p and H0 across tapers (n_ch, n_freqs)
     x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
 
     # resulting calculated amplitudes for all freqs
@@ -1723,7 +2183,7 @@ def _mt_spectrum_remove(
         # figure out which freqs to remove using F stat
 
         # estimated coefficient
-        x_hat = A * H0[:, np.newaxis]
+        x_hat = A[:, np.newaxis, :] * H0[:, np.newaxis]
 
         # numerator for F-statistic
         num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
@@ -1734,9 +2194,8 @@ def _mt_spectrum_remove(
         den[den == 0] = np.inf
         f_stat = num / den
 
-        # find frequencies to remove
-        indices = np.where(f_stat > threshold)[1]
-        rm_freqs = freqs[indices]
+        # find frequencies to remove (n_ch, n_freqs)
+        mask = f_stat > threshold
     else:
         # specify frequencies
         indices_1 = np.unique([np.argmin(np.abs(freqs - lf)) for lf in line_freqs])
@@ -1746,20 +2205,18 @@ def _mt_spectrum_remove(
         ]
         indices_2 = np.where(np.any(np.array(indices_2), axis=0))[0]
         indices = np.unique(np.r_[indices_1, indices_2])
-        rm_freqs = freqs[indices]
-
-    fits = list()
-    for ind in indices:
-        c = 2 * A[0, ind]
-        fit = np.abs(c) * np.cos(freqs[ind] * rads + np.angle(c))
-        fits.append(fit)
-
-    if len(fits) == 0:
-        datafit = 0.0
-    else:
-        # fitted sinusoids are summed, and subtracted from data
-        datafit = np.sum(fits, axis=0)
-
+        mask = np.zeros(A.shape, bool)
+        mask[:, indices] = True
+    rm_freqs = [freqs[m] for m in mask]
+
+    # fitted sinusoids |c| * cos(f * t + angle(c)) = Re(c * exp(1j * f * t)),
+    # with c = 2 * A, are summed over the frequencies to remove for each row,
+    # and subtracted from data
+    used = np.where(mask.any(axis=0))[0]
+    if len(used) == 0:
+        return x, rm_freqs
+    c = np.where(mask[:, used], 2 * A[:, used], 0.0)
+    datafit = (c @ np.exp(1j * np.outer(freqs[used], rads))).real
     return x - datafit, rm_freqs
 
 
@@ -1786,7 +2243,7 @@ def _check_filterable(x, kind="filtered", alternative="filter"):
             )
     _validate_type(x, (np.ndarray, list, tuple), f"Data to be {kind}")
     x = np.asanyarray(x)
-    if x.dtype != np.float64:
+    if x.dtype not in (np.float64, np.float32):
         raise ValueError(f"Data to be {kind} must be real floating, got {x.dtype}")
     return x
 
@@ -2502,27 +2959,10 @@ class FilterMixin:
         The object has to have the data loaded e.g. with ``preload=True``
         or ``self.load_data()``.
 
-        ``l_freq`` and ``h_freq`` are the frequencies below which and above
-        which, respectively, to filter out of the data. Thus the uses are:
-
-            * ``l_freq < h_freq``: band-pass filter
-            * ``l_freq > h_freq``: band-stop filter
-            * ``l_freq is not None and h_freq is None``: high-pass filter
-            * ``l_freq is None and h_freq is not None``: low-pass filter
-
-        ``self.info['lowpass']`` and ``self.info['highpass']`` are only
-        updated with picks=None.
-
-        .. note:: If n_jobs > 1, more memory is required as
-                  ``len(picks) * n_times`` additional time points need to
-                  be temporarily stored in memory.
-
         When working on SourceEstimates the sample rate of the original
         data is inferred from tstep.
 
-        For more information, see the tutorials
-        :ref:`disc-filtering` and :ref:`tut-filter-resample` and
-        :func:`mne.filter.create_filter`.
+        %(notes_filter)s
 
         .. versionadded:: 0.15
         """
@@ -2536,8 +2976,7 @@ class FilterMixin:
             s_freq = self.info["sfreq"]
         else:
             s_freq = 1.0 / self.tstep
-        if pad is None and method != "iir":
-            pad = "edge"
+        pad = _check_fir_pad(pad, method)
         if isinstance(self, BaseRaw):
             # Deal with annotations
             onsets, ends = _annotations_starts_stops(
@@ -2945,12 +3384,10 @@ def _filt_update_info(info, update_info, l_freq, h_freq):
 
 
 def _iir_pad_apply_unpad(x, *, func, padlen, padtype, **kwargs):
-    x_out = np.reshape(x, (-1, x.shape[-1])).copy()
-    for this_x in x_out:
-        x_ext = this_x
-        if padlen:
-            x_ext = _smart_pad(x_ext, (padlen, padlen), padtype)
-        x_ext = func(x=x_ext, axis=-1, padlen=0, **kwargs)
-        this_x[:] = x_ext[padlen : len(x_ext) - padlen]
+    x_ext = np.reshape(x, (-1, x.shape[-1]))
+    if padlen:
+        x_ext = _smart_pad(x_ext, (padlen, padlen), padtype)
+    x_ext = func(x=x_ext, axis=-1, padlen=0, **kwargs)
+    x_out = x_ext[:, padlen : x_ext.shape[-1] - padlen].astype(x.dtype)
     x_out = _reshape_view(x_out, x.shape)
     return x_out
@@ -25,9 +25,13 @@ __all__ = [
     "apply_forward",
     "apply_forward_raw",
     "average_forward_solutions",
+    "clear_field_map_cache",
+    "clear_forward_cache",
     "compute_depth_prior",
     "compute_orient_prior",
     "convert_forward_solution",
+    "get_field_map_cache_info",
+    "get_forward_cache_info",
     "is_fixed_orient",
     "make_field_map",
     "make_forward_dipole",
@@ -43,11 +47,15 @@ from ._compute_forward import (
     _compute_forwards,
     _concatenate_coils,
     _magnetic_dipole_field_vec,
+    clear_forward_cache,
+    get_forward_cache_info,
 )
 from ._field_interpolation import (
     _as_meg_type_inst,
     _make_surface_mapping,
     _map_meg_or_eeg_channels,
+    clear_field_map_cache,
+    get_field_map_cache_info,
     make_field_map,
 )
 from ._make_forward import (
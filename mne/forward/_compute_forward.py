@@ -11,17 +11,28 @@
 # 2) EEG and MEG: forward solutions for inverse methods. Mosher, Leahy, and
 #        Lewis, 1999. Generalized discussion of forward solutions.
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 
 import numpy as np
 
 from .._fiff.constants import FIFF
 from ..bem import _import_openmeeg, _make_openmeeg_geometry
 from ..fixes import _reshape_view, bincount, jit
-from ..parallel import parallel_func
+from ..parallel import _check_n_jobs, parallel_func
 from ..surface import _jit_cross, _project_onto_surface
 from ..transforms import apply_trans, invert_transform
-from ..utils import _check_option, _pl, fill_doc, logger, verbose, warn
+from ..utils import (
+    _check_option,
+    _DiskCache,
+    _pl,
+    fill_doc,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 
 # #############################################################################
 # COIL SPECIFICATION AND FIELD COMPUTATION MATRIX
@@ -375,7 +386,9 @@ def _bem_inf_fields(rr, rmag, cosmag):
 
 
 @fill_doc
-def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _bem_pot_or_field(
+    rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type, chunk_nbytes
+):
     """Calculate the magnetic field or electric potential forward solution.
 
     The code is very similar between EEG and MEG potentials, so combine them.
@@ -399,37 +412,35 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
     %(n_jobs)s
     coil_type : str
         'meg' or 'eeg'
+    chunk_nbytes : float
+        The memory budget of the chunks of sources.
 
     Returns
     -------
     B : ndarray, shape (n_dipoles * 3, n_sensors)
         Forward solution for a set of sensors
     """
-    # Both MEG and EEG have the inifinite-medium potentials
-    # This could be just vectorized, but eats too much memory, so instead we
-    # reduce memory by chunking within _do_inf_pots and parallelize, too:
-    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots, n_jobs, max_jobs=len(rr))
-    nas = np.array_split
-    B = np.sum(
-        parallel(
-            p_fun(
-                mri_rr, sr.copy(), np.ascontiguousarray(mri_Q), np.array(sol)
-            )  # copy and contig
-            for sr, sol in zip(nas(bem_rr, n_jobs), nas(solution.T, n_jobs))
-        ),
-        axis=0,
-    )
-    # The copy()s above should make it so the whole objects don't need to be
-    # pickled...
-
-    # Only MEG coils are sensitive to the primary current distribution.
-    if coil_type == "meg":
-        # Primary current contribution (can be calc. in coil/dipole coords)
-        parallel, p_fun, n_jobs = parallel_func(_do_prim_curr, n_jobs)
-        pcc = np.concatenate(parallel(p_fun(r, coils) for r in nas(rr, n_jobs)), axis=0)
-        B += pcc
-        B *= _MAG_FACTOR
-    return B
+    # Both MEG and EEG have the infinite-medium potentials. This could be just
+    # vectorized, but eats too much memory, so instead we chunk the sources
+    n_sensors = solution.shape[0]
+    n_int = len(coils[0]) if coil_type == "meg" else 0
+
+    def _do_chunk(start, stop, out):
+        # Doing work of 'fwd_bem_pot_calc' in MNE-C
+        # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
+        v0s = _bem_inf_pots(mri_rr[start:stop], bem_rr, mri_Q)
+        v0s = v0s.reshape(-1, v0s.shape[2])
+        np.dot(v0s, solution.T, out=out)
+        # Only MEG coils are sensitive to the primary current distribution.
+        if coil_type == "meg":
+            # Primary current contribution (can be calc. in coil/dipole coords)
+            out += _do_prim_curr(rr[start:stop], coils)
+            out *= _MAG_FACTOR
+
+    # The infinite-medium potentials and their product with the solution, plus
+    # the primary currents (one source at a time)
+    rr_nbytes = 24 * (len(bem_rr) + 2 * n_sensors) + 48 * n_int
+    return _compute_chunked(_do_chunk, rr, n_sensors, rr_nbytes, n_jobs, chunk_nbytes)
 
 
 def _do_prim_curr(rr, coils):
@@ -470,38 +481,44 @@ def _rr_bounds(rr, chunk=200):
     return zip(bounds[:-1], bounds[1:])
 
 
-def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
-    """Calculate infinite potentials for MEG or EEG sensors using chunks.
+def _get_fwd_chunk_nbytes():
+    """Get the memory budget for the chunks of sources of forward computations."""
+    size = get_config("MNE_FORWARD_CHUNK_SIZE", "100")
+    try:
+        size = float(size)
+    except ValueError:
+        raise ValueError(
+            f"MNE_FORWARD_CHUNK_SIZE must be a number, got {repr(size)}"
+        ) from None
+    if size <= 0:
+        raise ValueError(f"MNE_FORWARD_CHUNK_SIZE must be positive, got {size}")
+    return size * 1e6
 
-    Parameters
-    ----------
-    mri_rr : ndarray, shape (n_dipoles, 3)
-        3D dipole source positions in MRI coordinates
-    bem_rr : ndarray, shape (n_BEM_vertices, 3)
-        3D vertex positions for all surfaces in the BEM
-    mri_Q :
-        3x3 head -> MRI transform. I.e., head_mri_t.dot(np.eye(3))
-    sol : ndarray, shape (n_sensors_subset, n_BEM_vertices_subset)
-        Comes from _bem_specify_coils
 
-    Returns
-    -------
-    B : ndarray, (n_dipoles * 3, n_sensors)
-        Forward solution for sensors due to volume currents
+def _compute_chunked(fun, rr, n_sensors, rr_nbytes, n_jobs, chunk_nbytes):
+    """Compute a forward solution in chunks of sources.
+
+    ``fun(start, stop, out)`` must fill ``out``, a view of rows
+    ``3 * start:3 * stop`` of the preallocated forward solution. The chunks are
+    sized so that ``rr_nbytes`` of temporaries per source stay (across all
+    threads) within ``chunk_nbytes`` (see :func:`_get_fwd_chunk_nbytes`).
     """
-    # Doing work of 'fwd_bem_pot_calc' in MNE-C
-    # The following code is equivalent to this, but saves memory
-    # v0s = _bem_inf_pots(rr, bem_rr, Q)  # n_rr x 3 x n_bem_rr
-    # v0s.shape = (len(rr) * 3, v0s.shape[2])
-    # B = np.dot(v0s, sol)
-
-    # We chunk the source mri_rr's in order to save memory
-    B = np.empty((len(mri_rr) * 3, sol.shape[1]))
-    for start, stop in _rr_bounds(mri_rr):
-        # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
-        v0s = _bem_inf_pots(mri_rr[start:stop], bem_rr, mri_Q)
-        v0s = v0s.reshape(-1, v0s.shape[2])
-        B[3 * start : 3 * stop] = np.dot(v0s, sol)
+    n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+    B = np.empty((3 * len(rr), n_sensors))
+    chunk = max(int(chunk_nbytes // (n_jobs * rr_nbytes)), 1)
+    bounds = list(_rr_bounds(rr, chunk=chunk))
+
+    def _do(bound):
+        start, stop = bound
+        fun(start, stop, B[3 * start : 3 * stop])
+
+    if n_jobs == 1 or len(bounds) == 1:
+        for bound in bounds:
+            _do(bound)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            for _ in pool.map(_do, bounds):
+                pass
     return B
 
 
@@ -509,14 +526,30 @@ def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
 # SPHERE COMPUTATION
 
 
-def _sphere_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _sphere_pot_or_field(
+    rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type, chunk_nbytes
+):
     """Do potential or field for spherical model."""
-    fun = _eeg_spherepot_coil if coil_type == "eeg" else _sphere_field
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs, max_jobs=len(rr))
-    B = np.concatenate(
-        parallel(p_fun(r, coils, sphere=solution) for r in np.array_split(rr, n_jobs))
-    )
-    return B
+    coils = _triage_coils(coils)
+    if coil_type == "eeg":
+        # The EEG computation holds the GIL, so use processes instead of threads
+        parallel, p_fun, n_jobs = parallel_func(
+            _eeg_spherepot_coil, n_jobs, max_jobs=len(rr)
+        )
+        return np.concatenate(
+            parallel(
+                p_fun(r, coils, sphere=solution) for r in np.array_split(rr, n_jobs)
+            )
+        )
+    n_sensors = coils[3][-1] + 1
+    n_int = len(coils[0])
+
+    def _do_chunk(start, stop, out):
+        out[:] = _sphere_field(rr[start:stop], coils, sphere=solution)
+
+    # The sources are processed one at a time, so just the output (twice)
+    rr_nbytes = 48 * n_sensors + 72 * n_int
+    return _compute_chunked(_do_chunk, rr, n_sensors, rr_nbytes, n_jobs, chunk_nbytes)
 
 
 def _sphere_field(rrs, coils, sphere):
@@ -709,7 +742,16 @@ def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
 
 
 @verbose
-def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
+def _prep_field_computation(
+    *,
+    sensors,
+    bem,
+    n_jobs,
+    cache_dir=None,
+    cache_key=None,
+    chunk_nbytes=None,
+    verbose=None,
+):
     """Precompute and store some things that are used for both MEG and EEG.
 
     Calculation includes multiplication factors, coordinate transforms,
@@ -726,6 +768,14 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
         Gets updated here with BEM and sensor information for later forward
         calculations.
     %(n_jobs)s
+    cache_dir : Path | None
+        The directory of the on-disk cache.
+    cache_key : str | None
+        The key of the conductor model in the on-disk cache, or None to
+        compute everything.
+    chunk_nbytes : float | None
+        The memory budget of the chunks of sources, or None to look it up
+        from the ``MNE_FORWARD_CHUNK_SIZE`` configuration value.
     %(verbose)s
     """
     bem_rr = mults = mri_Q = head_mri_t = None
@@ -753,11 +803,25 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
                 logger.info("\n" + start + "...")
                 cf = FIFF.FIFFV_COORD_HEAD
                 # multiply solution by "mults" here for simplicity
-                solution = _bem_specify_coils(bem, coils, cf, mults, n_jobs)
+                solution = _get_cached_fwd(
+                    "field-meg",
+                    cache_key,
+                    coils,
+                    partial(_bem_specify_coils, bem, coils, cf, mults, n_jobs),
+                    axis=0,
+                    cache_dir=cache_dir,
+                )
             else:
                 # Compute solution for EEG sensor
                 logger.info("Setting up for EEG...")
-                solution = _bem_specify_els(bem, coils, mults)
+                solution = _get_cached_fwd(
+                    "field-eeg",
+                    cache_key,
+                    coils,
+                    partial(_bem_specify_els, bem, coils, mults),
+                    axis=0,
+                    cache_dir=cache_dir,
+                )
         else:
             solution = bem
             if coil_type == "eeg":
@@ -778,8 +842,17 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
     #    fun (_bem_pot_or_field if not 'sphere'; otherwise _sph_pot_or_field)
     #    solutions (len 2 list; [ndarray, shape (n_MEG_sens, n BEM vertices),
     #                            ndarray, shape (n_EEG_sens, n BEM vertices)]
+    #    chunk_nbytes (memory budget of the chunks of sources, looked up once
+    #                  so that e.g. each dipole fit evaluation does not)
+    if chunk_nbytes is None:
+        chunk_nbytes = _get_fwd_chunk_nbytes()
     fwd_data = dict(
-        bem_rr=bem_rr, mri_Q=mri_Q, head_mri_t=head_mri_t, fun=fun, solutions=solutions
+        bem_rr=bem_rr,
+        mri_Q=mri_Q,
+        head_mri_t=head_mri_t,
+        fun=fun,
+        solutions=solutions,
+        chunk_nbytes=chunk_nbytes,
     )
     return fwd_data
 
@@ -793,7 +866,7 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
     if fwd_data["head_mri_t"] is not None:
         mri_rr = np.ascontiguousarray(apply_trans(fwd_data["head_mri_t"]["trans"], rr))
     mri_Q, bem_rr, fun = fwd_data["mri_Q"], fwd_data["bem_rr"], fwd_data["fun"]
-    solutions = fwd_data["solutions"]
+    solutions, chunk_nbytes = fwd_data["solutions"], fwd_data["chunk_nbytes"]
     del fwd_data
     rr = np.ascontiguousarray(rr)  # usually true but not guaranteed, e.g. in dipole.py
     for coil_type, sens in sensors.items():
@@ -818,6 +891,7 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
             bem_rr=bem_rr,
             n_jobs=n_jobs,
             coil_type=coil_type,
+            chunk_nbytes=chunk_nbytes,
         )
 
         # Compensate if needed (only done for MEG systems w/compensation)
@@ -840,10 +914,22 @@ def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
         # This modifies "sensors" in place, so let's copy it in case the calling
         # function needs to reuse it (e.g., in simulate_raw.py)
         sensors = deepcopy(sensors)
-        fwd_data = _prep_field_computation(sensors=sensors, bem=bem, n_jobs=n_jobs)
-        Bs = _compute_forwards_meeg(
-            rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs
-        )
+        cache_dir = _fwd_cache.get_dir()
+        cache_key = None if cache_dir is None else _get_fwd_cache_key(bem)
+        if cache_key is None:
+            fwd_data = _prep_field_computation(sensors=sensors, bem=bem, n_jobs=n_jobs)
+            Bs = _compute_forwards_meeg(
+                rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs
+            )
+        else:
+            Bs = _compute_forwards_cached(
+                rr,
+                sensors=sensors,
+                bem=bem,
+                n_jobs=n_jobs,
+                cache_dir=cache_dir,
+                cache_key=cache_key,
+            )
     else:
         Bs = _compute_forwards_openmeeg(rr, bem=bem, sensors=sensors)
     n_sensors_want = sum(len(s["ch_names"]) for s in sensors.values())
@@ -853,6 +939,156 @@ def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
     return Bs
 
 
+def _compute_forwards_cached(rr, *, sensors, bem, n_jobs, cache_dir, cache_key):
+    """Compute the MEG and EEG forward solutions using the on-disk cache."""
+    Bs = dict()
+    chunk_nbytes = _get_fwd_chunk_nbytes()
+    # The gain depends on the sources, too
+    rr_key = _fwd_cache.hash(cache_key, rr)
+    for coil_type, sens in sensors.items():
+        # Cache the gain of each sensor, i.e., before compensation
+        this_sensors = {coil_type: dict(defs=sens["defs"], ch_names=sens["ch_names"])}
+
+        def _compute(this_sensors=this_sensors, coil_type=coil_type):
+            fwd_data = _prep_field_computation(
+                sensors=this_sensors,
+                bem=bem,
+                n_jobs=n_jobs,
+                cache_dir=cache_dir,
+                cache_key=cache_key,
+                chunk_nbytes=chunk_nbytes,
+            )
+            return _compute_forwards_meeg(
+                rr, sensors=this_sensors, fwd_data=fwd_data, n_jobs=n_jobs
+            )[coil_type]
+
+        B = _get_cached_fwd(
+            f"gain-{coil_type}",
+            rr_key,
+            sens["defs"],
+            _compute,
+            axis=1,
+            cache_dir=cache_dir,
+        )
+        compensator = sens.get("compensator", None)
+        post_picks = sens.get("post_picks", None)
+        if compensator is not None:
+            B = B @ compensator.T
+        if post_picks is not None:
+            B = B[:, post_picks]
+        Bs[coil_type] = B
+    return Bs
+
+
+# #############################################################################
+# ON-DISK CACHE
+
+_fwd_cache = _DiskCache("fwd", "MNE_FORWARD_CACHE_DIR", version=1)
+
+
+def _get_fwd_cache_key(bem):
+    """Get the cache key of a conductor model, or None if it cannot be cached."""
+    try:
+        if bem["is_sphere"]:
+            return _fwd_cache.hash(dict(bem))
+        return _fwd_cache.hash(
+            [(surf["rr"], surf["tris"]) for surf in bem["surfs"]],
+            bem["solution"],
+            bem["source_mult"],
+            bem["field_mult"],
+            bem["head_mri_t"]["trans"],
+        )
+    except TypeError as exc:  # something unusual, don't cache it
+        logger.debug(f"    Not caching forward computations: {exc}")
+        return None
+
+
+def _get_cached_fwd(kind, key, coils, func, *, axis, cache_dir):
+    """Get the output of func() from the on-disk cache.
+
+    The output has one entry per sensor along ``axis``. An entry computed for a
+    superset of the sensors (e.g., before channels were dropped) is sliced.
+    """
+    if key is None:
+        return func()
+    digests = np.array([_fwd_cache.hash(c["rmag"], c["cosmag"], c["w"]) for c in coils])
+
+    def _select(npz):
+        have = {digest: ii for ii, digest in enumerate(npz["digests"])}
+        if not all(digest in have for digest in digests):
+            return None
+        return np.take(npz["data"], [have[digest] for digest in digests], axis=axis)
+
+    this_dir = cache_dir / f"{kind}-{key}"
+    for fname in _fwd_cache.glob(this_dir):
+        out = _fwd_cache.read(fname, _select)
+        if out is not None:
+            _fwd_cache.count("hits")
+            logger.info(f"    Using cached {kind} for {len(digests)} sensors")
+            return out
+    out = func()
+    _fwd_cache.count("misses")
+    fname = _fwd_cache.fname(this_dir, _fwd_cache.hash(digests))
+    _fwd_cache.write(cache_dir, fname, digests=digests, data=out)
+    return out
+
+
+def get_forward_cache_info():
+    """Get information about the on-disk cache of forward computations.
+
+    When the ``MNE_FORWARD_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), the BEM field computation matrices and the gain
+    matrices computed by :func:`mne.make_forward_solution` are stored in that
+    directory (see the Notes there). The least recently used files are removed
+    when the directory grows beyond ``MNE_DISK_CACHE_SIZE`` megabytes (1000 by
+    default).
+
+    Returns
+    -------
+    info : dict
+        A dictionary with keys:
+
+        ``cache_dir``
+            The cache directory (:class:`~pathlib.Path`), or None if caching
+            is disabled.
+        ``n_files``
+            The number of cached matrices.
+        ``size``
+            The total size of the cache in bytes.
+        ``hits``, ``misses``
+            The number of matrices that were read from the cache and computed
+            (and written to it) in this session, respectively.
+
+    See Also
+    --------
+    clear_forward_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    return _fwd_cache.info()
+
+
+@verbose
+def clear_forward_cache(*, verbose=None):
+    """Remove all entries from the on-disk cache of forward computations.
+
+    Parameters
+    ----------
+    %(verbose)s
+
+    See Also
+    --------
+    get_forward_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _fwd_cache.clear()
+
+
 def _compute_forwards_openmeeg(rr, *, bem, sensors):
     """Compute the MEG and EEG forward solutions for OpenMEEG."""
     if len(bem["surfs"]) != 3:
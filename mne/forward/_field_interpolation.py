@@ -9,7 +9,6 @@ import inspect
 from copy import deepcopy
 
 import numpy as np
-from scipy.interpolate import interp1d
 
 from .._fiff.constants import FIFF
 from .._fiff.meas_info import _simplify_info
@@ -24,10 +23,15 @@ from ..surface import get_head_surf, get_meg_helmet_surf
 from ..transforms import _find_trans, transform_surface_to
 from ..utils import _check_fname, _check_option, _pl, _reg_pinv, logger, verbose
 from ._lead_dots import (
-    _do_cross_dots,
     _do_self_dots,
     _do_surface_dots,
-    _get_legen_table,
+    _dots_cache,
+    _dots_cache_config,
+    _dots_cache_lock,
+    _dots_cache_stats,
+    _dots_disk_cache,
+    _get_dots_cache_size,
+    _get_legen_interp,
 )
 from ._make_forward import _create_eeg_els, _create_meg_coils, _read_coil_defs
 
@@ -37,8 +41,7 @@ def _setup_dots(mode, info, coils, ch_type):
     int_rad = 0.06
     noise = make_ad_hoc_cov(info, dict(mag=20e-15, grad=5e-13, eeg=1e-6))
     n_coeff, interp = (50, "nearest") if mode == "fast" else (100, "linear")
-    lut, n_fact = _get_legen_table(ch_type, False, n_coeff, verbose=False)
-    lut_fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, interp, axis=0)
+    lut_fun, n_fact = _get_legen_interp(ch_type, n_coeff, interp)
     return int_rad, noise, lut_fun, n_fact
 
 
@@ -187,19 +190,25 @@ def _map_meg_or_eeg_channels(info_from, info_to, mode, *, origin, miss=None):
     #
     int_rad, noise, lut_fun, n_fact = _setup_dots(mode, info_from, coils_from, kind)
     logger.info(
-        f"    Computing dot products for {len(coils_from)} "
-        f"{kind.upper()} channel{_pl(coils_from)}..."
-    )
-    self_dots = _do_self_dots(
-        int_rad, False, coils_from, origin, kind, lut_fun, n_fact, n_jobs=None
-    )
-    logger.info(
-        f"    Computing cross products for {len(coils_from)} → "
+        f"    Computing dot products for {len(coils_from)} → "
         f"{len(coils_to)} {kind.upper()} channel{_pl(coils_to)}..."
     )
-    cross_dots = _do_cross_dots(
-        int_rad, False, coils_from, coils_to, origin, kind, lut_fun, n_fact
-    ).T
+    # The cross products are part of the self products of all coils, which
+    # (when cached) also cover other subsets, e.g. for different bad channels
+    all_dots = _do_self_dots(
+        int_rad,
+        False,
+        coils_from + coils_to,
+        origin,
+        kind,
+        lut_fun,
+        n_fact,
+        n_jobs=None,
+        cache_dir=_dots_disk_cache.get_dir(),
+    )
+    n_from = len(coils_from)
+    self_dots = all_dots[:n_from, :n_from]
+    cross_dots = all_dots[n_from:, :n_from]
 
     ch_names = [c["ch_name"] for c in info_from["chs"]]
     fmd = dict(
@@ -398,14 +407,25 @@ def _make_surface_mapping(
     # Step 2. Calculate the dot products
     #
     int_rad, noise, lut_fun, n_fact = _setup_dots(mode, info, coils, ch_type)
+    cache_dir = _dots_disk_cache.get_dir()
     logger.info("Computing dot products for %i %s...", len(coils), type_str)
     self_dots = _do_self_dots(
-        int_rad, False, coils, origin, ch_type, lut_fun, n_fact, n_jobs
+        int_rad, False, coils, origin, ch_type, lut_fun, n_fact, n_jobs, cache_dir
     )
     sel = np.arange(len(surf["rr"]))  # eventually we should do sub-selection
     logger.info("Computing dot products for %i surface locations...", len(sel))
     surface_dots = _do_surface_dots(
-        int_rad, False, coils, surf, sel, origin, ch_type, lut_fun, n_fact, n_jobs
+        int_rad,
+        False,
+        coils,
+        surf,
+        sel,
+        origin,
+        ch_type,
+        lut_fun,
+        n_fact,
+        n_jobs,
+        cache_dir,
     )
 
     #
@@ -503,6 +523,20 @@ def make_field_map(
     surf_maps : list
         The surface maps to be used for field plots. The list contains
         separate ones for MEG and EEG (if both MEG and EEG are present).
+
+    Notes
+    -----
+    The lead field dot products used to compute the maps (and to interpolate
+    bad channels with :meth:`~mne.io.Raw.interpolate_bads`) are kept in memory
+    for the most recently used sensor geometries, origins, and surfaces, so
+    that they are not recomputed, e.g., for a different subset of the sensors.
+    The number of cached products is set by the ``MNE_FIELD_MAP_CACHE_SIZE``
+    configuration value (see :func:`mne.forward.get_field_map_cache_info`), and
+    the cache can be emptied with :func:`mne.forward.clear_field_map_cache`.
+    When the ``MNE_FIELD_MAP_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), they are also stored in this directory, from which
+    the least recently used files are removed when it grows beyond
+    ``MNE_DISK_CACHE_SIZE`` megabytes (1000 by default).
     """
     info = evoked.info
 
@@ -559,3 +593,91 @@ def make_field_map(
         surf_maps.append(this_map)
 
     return surf_maps
+
+
+def get_field_map_cache_info():
+    """Get information about the cache of lead field dot products.
+
+    The dot products used by :func:`mne.make_field_map` and to interpolate bad
+    channels (e.g., with :meth:`~mne.io.Raw.interpolate_bads`) are kept in a
+    least-recently-used cache, so that they are not recomputed for the same
+    sensor geometry, origin, and surface (or a subset of the sensors). When
+    the ``MNE_FIELD_MAP_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), they are also stored in that directory, from
+    which the least recently used files are removed when it grows beyond
+    ``MNE_DISK_CACHE_SIZE`` megabytes (1000 by default).
+
+    Returns
+    -------
+    info : dict
+        A dictionary with keys:
+
+        ``n_entries``
+            The number of cached dot product matrices in memory.
+        ``max_size``
+            The maximum number of entries in memory, set by the
+            ``MNE_FIELD_MAP_CACHE_SIZE`` configuration value (see
+            :func:`mne.set_config`, defaults to 10), which is looked up
+            when the cache is first used and again after
+            :func:`~mne.forward.clear_field_map_cache`. Zero disables the
+            in-memory cache.
+        ``cache_dir``
+            The cache directory (:class:`~pathlib.Path`), or None if the
+            on-disk cache is disabled.
+        ``n_files``
+            The number of cached dot product matrices on disk.
+        ``size``
+            The total size of the on-disk cache in bytes.
+        ``hits``, ``misses``
+            The number of dot products that were found in the cache (in memory
+            or in ``MNE_FIELD_MAP_CACHE_DIR``) and computed, respectively,
+            since the cache was last cleared.
+
+    See Also
+    --------
+    clear_field_map_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    max_size = _get_dots_cache_size()
+    disk_info = _dots_disk_cache.info()
+    with _dots_cache_lock:
+        return dict(
+            n_entries=len(_dots_cache),
+            max_size=max_size,
+            cache_dir=disk_info["cache_dir"],
+            n_files=disk_info["n_files"],
+            size=disk_info["size"],
+            **_dots_cache_stats,
+        )
+
+
+@verbose
+def clear_field_map_cache(*, verbose=None):
+    """Remove all entries from the cache of lead field dot products.
+
+    This removes the entries kept in memory and the files in
+    ``MNE_FIELD_MAP_CACHE_DIR``, and resets the hit and miss counts. The
+    maximum number of entries in memory is looked up again from the
+    ``MNE_FIELD_MAP_CACHE_SIZE`` configuration value the next time the cache
+    is used.
+
+    Parameters
+    ----------
+    %(verbose)s
+
+    See Also
+    --------
+    get_field_map_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _dots_disk_cache.clear()
+    with _dots_cache_lock:
+        _dots_cache.clear()
+        _dots_cache_stats.update(hits=0, misses=0)
+        _dots_cache_config["max_size"] = None
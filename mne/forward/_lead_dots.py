@@ -7,13 +7,24 @@
 
 import os
 import os.path as op
+from collections import OrderedDict
+from functools import lru_cache, partial
+from threading import Lock
 
 import numpy as np
 from numpy.polynomial import legendre
 
 from ..fixes import _reshape_view
 from ..parallel import parallel_func
-from ..utils import _get_extra_data_path, _open_lock, fill_doc, logger, verbose
+from ..utils import (
+    _DiskCache,
+    _get_extra_data_path,
+    _open_lock,
+    fill_doc,
+    get_config,
+    logger,
+    verbose,
+)
 
 ##############################################################################
 # FAST LEGENDRE (DERIVATIVE) POLYNOMIALS USING LOOKUP TABLE
@@ -112,6 +123,57 @@ def _get_legen_table(
     return lut, n_fact
 
 
+class _LegenInterp:
+    """Interpolate a Legendre table sampled uniformly on [-1, 1].
+
+    Calling it is equivalent to using :class:`scipy.interpolate.interp1d`,
+    but :meth:`rows` allows interpolating sums over the coefficients instead,
+    which avoids expanding (and copying) the table for each point.
+    """
+
+    def __init__(self, lut, kind):
+        assert kind in ("nearest", "linear")
+        self.lut = lut
+        self.kind = kind
+
+    def rows(self, x):
+        """Get the table rows and their weights that interpolate the table at x."""
+        n_interp = len(self.lut) - 1
+        x = (np.asarray(x, float) + 1.0) * (n_interp / 2.0)
+        bad = ~np.isfinite(x)  # e.g., from sensors with unknown positions
+        if bad.any():
+            x = np.where(bad, 0.0, x)
+        if self.kind == "nearest":
+            rows = [(np.rint(x).astype(np.intp), None)]
+        else:
+            idx = np.minimum(x.astype(np.intp), n_interp - 1)
+            weight = x - idx
+            rows = [(idx, 1.0 - weight), (idx + 1, weight)]
+        if bad.any():  # propagate NaN like scipy.interpolate.interp1d
+            rows = [
+                (idx, np.where(bad, np.nan, 1.0 if weight is None else weight))
+                for idx, weight in rows
+            ]
+        return rows
+
+    def __call__(self, x):
+        out = 0.0
+        for idx, weight in self.rows(x):
+            rows = self.lut[idx]
+            if weight is not None:
+                rows = rows * weight.reshape(weight.shape + (1,) * (rows.ndim - 1))
+            out = out + rows
+        return out
+
+
+@lru_cache(maxsize=4)
+def _get_legen_interp(ch_type, n_coeff, kind):
+    """Get a (read-only) Legendre table interpolator, kept in memory."""
+    lut, n_fact = _get_legen_table(ch_type, False, n_coeff, verbose=False)
+    lut.flags.writeable = n_fact.flags.writeable = False
+    return _LegenInterp(lut, kind), n_fact
+
+
 def _comp_sum_eeg(beta, ctheta, lut_fun, n_fact):
     """Lead field dot products using Legendre polynomial (P_n) series."""
     # Compute the sum occurring in the evaluation.
@@ -119,13 +181,17 @@ def _comp_sum_eeg(beta, ctheta, lut_fun, n_fact):
     #   sums[:]    (2n+1)^2/n beta^n P_n
     n_chunk = 50000000 // (8 * max(n_fact.shape) * 2)
     lims = np.concatenate([np.arange(0, beta.size, n_chunk), [beta.size]])
-    s0 = np.empty(beta.shape)
+    s0 = np.zeros(beta.shape)
     for start, stop in zip(lims[:-1], lims[1:]):
-        coeffs = lut_fun(ctheta[start:stop])
         betans = np.tile(beta[start:stop][:, np.newaxis], (1, n_fact.shape[0]))
         np.cumprod(betans, axis=1, out=betans)  # run inplace
-        coeffs *= betans
-        s0[start:stop] = np.dot(coeffs, n_fact)  # == weighted sum across cols
+        betans *= n_fact
+        # the sum is linear in the coefficients, so it can be interpolated
+        for idx, weight in lut_fun.rows(ctheta[start:stop]):
+            this_s0 = np.einsum("ij,ij->i", betans, lut_fun.lut[idx])
+            if weight is not None:
+                this_s0 *= weight
+            s0[start:stop] += this_s0
     return s0
 
 
@@ -138,7 +204,7 @@ def _comp_sums_meg(beta, ctheta, lut_fun, n_fact, volume_integral):
         Coefficients of the integration.
     ctheta : array, shape (n_points * n_points, 1)
         Cosine of the angle between the sensor integration points.
-    lut_fun : callable
+    lut_fun : instance of _LegenInterp
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
@@ -163,7 +229,10 @@ def _comp_sums_meg(beta, ctheta, lut_fun, n_fact, volume_integral):
     # sums = np.rollaxis(sums, 2)
     # or
     # sums = np.einsum('ji,jk,ijk->ki', bbeta, n_fact, lut_fun(ctheta)))
-    sums = np.empty((n_fact.shape[1], len(beta)))
+    # The sums are linear in the coefficients, so rather than interpolating
+    # the table for each point (which expands it to float64), we interpolate
+    # the sums computed from the neighboring table rows.
+    sums = np.zeros((n_fact.shape[1], len(beta)))
     # beta can be e.g. 3 million elements, which ends up using lots of memory
     # so we split up the computations into ~50 MB blocks
     n_chunk = 50000000 // (8 * max(n_fact.shape) * 2)
@@ -172,13 +241,11 @@ def _comp_sums_meg(beta, ctheta, lut_fun, n_fact, volume_integral):
         bbeta = np.tile(beta[start:stop][np.newaxis], (n_fact.shape[0], 1))
         bbeta[0] *= beta[start:stop]
         np.cumprod(bbeta, axis=0, out=bbeta)  # run inplace
-        np.einsum(
-            "ji,jk,ijk->ki",
-            bbeta,
-            n_fact,
-            lut_fun(ctheta[start:stop]),
-            out=sums[:, start:stop],
-        )
+        for idx, weight in lut_fun.rows(ctheta[start:stop]):
+            this_sums = np.einsum("ji,jk,ijk->ki", bbeta, n_fact, lut_fun.lut[idx])
+            if weight is not None:
+                this_sums *= weight
+            sums[:, start:stop] += this_sums
     return sums
 
 
@@ -229,7 +296,7 @@ def _fast_sphere_dot_r0(
         Weights of integration points in the second sensor.
     volume_integral : bool
         If True, compute volume integral.
-    lut : callable
+    lut : instance of _LegenInterp
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
@@ -241,13 +308,6 @@ def _fast_sphere_dot_r0(
     result : float
         The integration sum.
     """
-    if w1 is None:  # operating on surface, treat independently
-        out_shape = (len(rr2s), len(rr1_orig))
-        sum_axis = 1  # operate along second axis only at the end
-    else:
-        out_shape = (len(rr2s),)
-        sum_axis = None  # operate on flattened array at the end
-    out = np.empty(out_shape)
     rr2 = np.concatenate(rr2s)
     lr2 = np.concatenate(lr2s)
     cosmags2 = np.concatenate(cosmags2s)
@@ -302,18 +362,19 @@ def _fast_sphere_dot_r0(
         result *= _eeg_const
         result /= lr1lr2
         # now we add them all up with weights
-    offset = 0
     result *= np.concatenate(w2s)
-    if w1 is not None:
-        result *= w1[:, np.newaxis]
-    for ii, w2 in enumerate(w2s):
-        out[ii] = np.sum(result[:, offset : offset + len(w2)], axis=sum_axis)
-        offset += len(w2)
-    return out
+    if w1 is not None:  # sum over the points of both sensors
+        result = np.dot(w1, result)
+    # else operating on surface, treat independently
+    offsets = np.cumsum([0] + [len(w2) for w2 in w2s[:-1]])
+    out = np.add.reduceat(result, offsets, axis=-1)
+    return out.T
 
 
 @fill_doc
-def _do_self_dots(intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs):
+def _do_self_dots(
+    intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs, cache_dir=None
+):
     """Perform the lead field dot product integrations.
 
     Parameters
@@ -329,17 +390,38 @@ def _do_self_dots(intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs):
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'.
-    lut : callable
+    lut : instance of _LegenInterp
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
     %(n_jobs)s
+    cache_dir : Path | None
+        The directory of the on-disk cache, or None to only cache in memory.
 
     Returns
     -------
     products : array, shape (n_coils, n_coils)
         The integration products.
+
+    Notes
+    -----
+    The products are cached, so those of any subset of the coils are obtained
+    without recomputation.
     """
+    key = _dots_hash(intrad, volume, r0, ch_type, lut.kind, lut.lut.shape, n_fact)
+    return _get_cached_dots(
+        "self",
+        key,
+        coils,
+        partial(
+            _compute_self_dots, intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs
+        ),
+        cache_dir,
+    )
+
+
+def _compute_self_dots(intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs):
+    """Perform the lead field dot product integrations (without caching)."""
     if ch_type == "eeg":
         intrad = intrad * 0.7
     # convert to normalized distances from expansion center
@@ -406,7 +488,7 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact):
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'
-    lut : callable
+    lut : instance of _LegenInterp
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
@@ -456,7 +538,7 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact):
 
 @fill_doc
 def _do_surface_dots(
-    intrad, volume, coils, surf, sel, r0, ch_type, lut, n_fact, n_jobs
+    intrad, volume, coils, surf, sel, r0, ch_type, lut, n_fact, n_jobs, cache_dir=None
 ):
     """Compute the map construction products.
 
@@ -477,17 +559,60 @@ def _do_surface_dots(
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'.
-    lut : callable
+    lut : instance of _LegenInterp
         Look-up table for Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
     %(n_jobs)s
+    cache_dir : Path | None
+        The directory of the on-disk cache, or None to only cache in memory.
 
     Returns
     -------
-    products : array, shape (n_coils, n_coils)
+    products : array, shape (n_vertices, n_coils)
         The integration products.
+
+    Notes
+    -----
+    The products are cached, so those of any subset of the coils are obtained
+    without recomputation.
     """
+    key = _dots_hash(
+        intrad,
+        volume,
+        r0,
+        ch_type,
+        lut.kind,
+        lut.lut.shape,
+        n_fact,
+        surf["rr"][sel],
+        surf["nn"][sel],
+    )
+    return _get_cached_dots(
+        "surface",
+        key,
+        coils,
+        partial(
+            _compute_surface_dots,
+            intrad,
+            volume,
+            coils,
+            surf,
+            sel,
+            r0,
+            ch_type,
+            lut,
+            n_fact,
+            n_jobs,
+        ),
+        cache_dir,
+    )
+
+
+def _compute_surface_dots(
+    intrad, volume, coils, surf, sel, r0, ch_type, lut, n_fact, n_jobs
+):
+    """Compute the map construction products (without caching)."""
     # convert to normalized distances from expansion center
     rmags = [coil["rmag"] - r0[np.newaxis, :] for coil in coils]
     rlens = [np.sqrt(np.sum(r * r, axis=1)) for r in rmags]
@@ -573,7 +698,7 @@ def _do_surface_dots_subset(
         Integration weights of the coils.
     volume : bool
         If True, compute volume integral.
-    lut : callable
+    lut : instance of _LegenInterp
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
@@ -584,19 +709,22 @@ def _do_surface_dots_subset(
 
     Returns
     -------
-    products : array, shape (n_coils, n_coils)
-        The integration products.
+    products : array, shape (n_vertices, n_coils)
+        The integration products, nonzero only for the coils in idx.
     """
-    products = _fast_sphere_dot_r0(
+    products = np.zeros((len(rsurf), len(rmags)))
+    if len(idx) == 0:
+        return products
+    products[:, idx] = _fast_sphere_dot_r0(
         intrad,
         rsurf,
-        rmags,
+        [rmags[ci] for ci in idx],
         lsurf,
-        rlens,
+        [rlens[ci] for ci in idx],
         this_nn,
-        cosmags,
+        [cosmags[ci] for ci in idx],
         None,
-        ws,
+        [ws[ci] for ci in idx],
         volume,
         lut,
         n_fact,
@@ -604,3 +732,98 @@ def _do_surface_dots_subset(
     ).T
     assert rref is None  # guaranteed by our code path
     return products
+
+
+###############################################################################
+# CACHING
+
+# Least-recently-used in-memory cache of dot products, optionally backed by
+# files in MNE_FIELD_MAP_CACHE_DIR
+_dots_cache = OrderedDict()
+_dots_cache_stats = dict(hits=0, misses=0)
+_dots_cache_config = dict(max_size=None)
+_dots_cache_lock = Lock()
+_dots_disk_cache = _DiskCache("dots", "MNE_FIELD_MAP_CACHE_DIR", version=2)
+
+
+def _get_dots_cache_size():
+    """Get the maximum cache size, looked up once until the cache is cleared."""
+    max_size = _dots_cache_config["max_size"]
+    if max_size is None:
+        max_size = int(get_config("MNE_FIELD_MAP_CACHE_SIZE", "10"))
+        _dots_cache_config["max_size"] = max_size
+    return max_size
+
+
+def _dots_hash(*args):
+    """Hash objects used to compute dot products."""
+    return _dots_disk_cache.hash(*args)
+
+
+def _slice_dots(kind, have_digests, data, digests):
+    """Slice cached products to the requested coils, or return None."""
+    have = {digest: ii for ii, digest in enumerate(have_digests)}
+    if not all(digest in have for digest in digests):
+        return None
+    idx = np.array([have[digest] for digest in digests], int)
+    out = data[..., idx]
+    if kind == "self":
+        out = out[idx]
+    return out
+
+
+def _get_cached_dots(kind, key, coils, func, cache_dir):
+    """Get func() from the in-memory (and optionally on-disk) cache.
+
+    The output has one entry per coil along its last axis (and, for
+    ``kind="self"``, also along its first axis). Entries computed for a
+    superset of the coils (e.g., before marking channels as bad) are sliced.
+    """
+    digests = np.array([_dots_hash(c["rmag"], c["cosmag"], c["w"]) for c in coils])
+    group = f"{kind}-{key}"
+    with _dots_cache_lock:
+        for cache_key, (have_digests, data) in reversed(_dots_cache.items()):
+            if cache_key[0] != group:
+                continue
+            out = _slice_dots(kind, have_digests, data, digests)
+            if out is not None:
+                _dots_cache.move_to_end(cache_key)
+                _dots_cache_stats["hits"] += 1
+                return out
+
+    def _select(npz):
+        have_digests = npz["digests"]
+        if not np.isin(digests, have_digests).all():
+            return None
+        data = npz["data"]
+        return have_digests, data, _slice_dots(kind, have_digests, data, digests)
+
+    if cache_dir is not None:
+        for fname in _dots_disk_cache.glob(cache_dir / group):
+            read = _dots_disk_cache.read(fname, _select)
+            if read is not None:
+                have_digests, data, out = read
+                with _dots_cache_lock:
+                    _dots_cache_stats["hits"] += 1
+                _add_cached_dots(group, have_digests, data)
+                return out
+    out = func()
+    with _dots_cache_lock:
+        _dots_cache_stats["misses"] += 1
+    _add_cached_dots(group, digests, out.copy())
+    if cache_dir is not None:
+        fname = _dots_disk_cache.fname(cache_dir / group, _dots_hash(digests))
+        _dots_disk_cache.write(cache_dir, fname, digests=digests, data=out)
+    return out
+
+
+def _add_cached_dots(group, digests, data):
+    """Add products to the in-memory cache."""
+    max_size = _get_dots_cache_size()
+    if max_size <= 0:
+        return
+    data.flags.writeable = False
+    with _dots_cache_lock:
+        _dots_cache[(group, _dots_hash(digests))] = (digests, data)
+        while len(_dots_cache) > max_size:
+            _dots_cache.popitem(last=False)
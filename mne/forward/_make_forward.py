@@ -687,8 +687,22 @@ def make_forward_solution(
         in :func:`mne.make_bem_solution`, then OpenMEEG will automatically
         be used to compute the forward solution.
 
+    When the ``MNE_FORWARD_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), the BEM field computation matrices and the gain
+    matrices are stored in this directory, keyed on the conductor model
+    (including the MRI<->head transform), the sensor geometry, and (for the
+    gain matrices) the source locations. Later calls for the same subject reuse
+    them, e.g., with a different source space but the same sensors, or with a
+    subset of the channels. The least recently used files are removed when the
+    directory grows beyond ``MNE_DISK_CACHE_SIZE`` megabytes (1000 by default),
+    see :func:`mne.forward.get_forward_cache_info` and
+    :func:`mne.forward.clear_forward_cache`.
+
     .. versionchanged:: 1.2
        Added support for OpenMEEG-based forward solution calculations.
+
+    .. versionadded:: 1.13
+       The on-disk cache.
     """
     # Currently not (sup)ported:
     # 1. --grad option (gradients of the field, not used much)
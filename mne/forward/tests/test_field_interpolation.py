@@ -17,19 +17,32 @@ from numpy.testing import (
 from scipy.interpolate import interp1d
 
 import mne
-from mne import Epochs, make_fixed_length_events, pick_types, read_evokeds
+from mne import (
+    Epochs,
+    make_fixed_length_events,
+    pick_info,
+    pick_types,
+    read_evokeds,
+)
 from mne.datasets import testing
 from mne.fixes import _reshape_view
-from mne.forward import _make_surface_mapping, make_field_map
-from mne.forward._field_interpolation import _setup_dots
+from mne.forward import (
+    _lead_dots,
+    _make_surface_mapping,
+    clear_field_map_cache,
+    get_field_map_cache_info,
+    make_field_map,
+)
+from mne.forward._field_interpolation import _map_meg_or_eeg_channels, _setup_dots
 from mne.forward._lead_dots import (
     _comp_sum_eeg,
     _comp_sums_meg,
     _do_cross_dots,
     _get_legen_table,
+    _LegenInterp,
 )
 from mne.forward._make_forward import _create_meg_coils
-from mne.io import read_raw_fif
+from mne.io import read_info, read_raw_fif
 from mne.surface import get_head_surf, get_meg_helmet_surf
 
 base_dir = op.join(op.dirname(__file__), "..", "..", "io", "tests", "data")
@@ -75,8 +88,10 @@ def test_legendre_val():
     # Table approximation
     for nc, interp in zip([100, 50], ["nearest", "linear"]):
         lut, n_fact = _get_legen_table("eeg", n_coeff=nc, force_calc=True)
-        lut_fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, interp, axis=0)
+        lut_fun = _LegenInterp(lut, interp)
         vals_i = lut_fun(xs)
+        lut_fun_scipy = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, interp, axis=0)
+        assert_allclose(vals_i, lut_fun_scipy(xs), rtol=1e-6, atol=1e-6)
         # Need a "1:" here because we omit the first coefficient in our table!
         assert_allclose(
             vals_np[:, 1 : vals_i.shape[1] + 1], vals_i, rtol=1e-2, atol=5e-3
@@ -107,12 +122,14 @@ def test_legendre_val():
     # compare fast and slow for MEG
     ctheta = rng.rand(20 * 30) * 2.0 - 1.0
     beta = rng.rand(20 * 30) * 0.8
-    lut, n_fact = _get_legen_table("meg", n_coeff=10, force_calc=True)
-    fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, "nearest", axis=0)
-    coeffs = _comp_sums_meg(beta, ctheta, fun, n_fact, False)
-    lut, n_fact = _get_legen_table("meg", n_coeff=20, force_calc=True)
-    fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, "linear", axis=0)
-    coeffs = _comp_sums_meg(beta, ctheta, fun, n_fact, False)
+    for nc, interp in zip([10, 20], ["nearest", "linear"]):
+        lut, n_fact = _get_legen_table("meg", n_coeff=nc, force_calc=True)
+        coeffs = _comp_sums_meg(beta, ctheta, _LegenInterp(lut, interp), n_fact, False)
+        # compare to interpolating the table itself
+        fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, interp, axis=0)
+        bbeta = np.cumprod([beta] * (nc - 1), axis=0) * beta
+        want = np.einsum("ji,jk,ijk->ki", bbeta, n_fact, fun(ctheta))
+        assert_allclose(coeffs, want, rtol=1e-6, atol=1e-6 * np.abs(want).max())
 
 
 def test_legendre_table():
@@ -128,6 +145,116 @@ def test_legendre_table():
         assert_allclose(n_fact1, n_fact2)
 
 
+def test_make_surface_mapping_n_jobs():
+    """Test that surface mappings do not depend on n_jobs."""
+    info = read_info(raw_fname)
+    info = pick_info(info, pick_types(info, meg=True)[::10])
+    with info._unlock():
+        info["projs"] = []
+    surf = get_meg_helmet_surf(info)
+    maps = [
+        _make_surface_mapping(
+            info, surf, "meg", mode="fast", n_jobs=n_jobs, origin=(0.0, 0.0, 0.04)
+        )["data"]
+        for n_jobs in (1, 2)
+    ]
+    assert_allclose(maps[1], maps[0], rtol=1e-7)
+
+
+def test_field_map_dots_cache(tmp_path, monkeypatch):
+    """Test the cache of the dot products used for field mapping."""
+    info = read_info(raw_fname)
+    info = pick_info(info, pick_types(info, meg=True)[::10])
+    with info._unlock():
+        info["projs"] = []
+    origin = (0.0, 0.0, 0.04)
+    picks = np.arange(len(info["ch_names"]))
+    clear_field_map_cache()
+    stats = _lead_dots._dots_cache_stats
+
+    def map_bads(bads):
+        good = np.setdiff1d(picks, bads)
+        return _map_meg_or_eeg_channels(
+            pick_info(info, good), pick_info(info, bads), "accurate", origin=origin
+        )
+
+    # computed once, then sliced for other bad channels
+    misses, hits = stats["misses"], stats["hits"]
+    want = map_bads([0, 1])
+    assert stats["misses"] - misses == 1
+    want_2 = map_bads([1, 2])
+    assert stats["misses"] - misses == 1
+    assert stats["hits"] - hits == 1
+    _lead_dots._dots_cache.clear()
+    assert_allclose(map_bads([1, 2]), want_2, rtol=1e-7)
+    assert stats["misses"] - misses == 2
+    _lead_dots._dots_cache.clear()
+    assert_allclose(map_bads([0, 1]), want, rtol=1e-7)
+    assert stats["misses"] - misses == 3
+    # on disk
+    _lead_dots._dots_cache.clear()
+    monkeypatch.setenv("MNE_FIELD_MAP_CACHE_DIR", str(tmp_path))
+    assert_allclose(map_bads([0, 1]), want, rtol=1e-7)
+    assert stats["misses"] - misses == 4
+    assert len(list(tmp_path.rglob("*-dots.npz"))) == 1
+    _lead_dots._dots_cache.clear()
+    assert_allclose(map_bads([1, 2]), want_2, rtol=1e-7)
+    assert stats["misses"] - misses == 4
+    info_cache = get_field_map_cache_info()
+    assert info_cache["cache_dir"] == tmp_path
+    assert info_cache["n_files"] == 1
+    assert info_cache["size"] > 0
+    # a corrupted cache leads to recomputation
+    for fname in tmp_path.rglob("*-dots.npz"):
+        fname.write_bytes(b"foo")
+    _lead_dots._dots_cache.clear()
+    assert_allclose(map_bads([0, 1]), want, rtol=1e-7)
+    assert stats["misses"] - misses == 5
+    clear_field_map_cache()
+    info_cache = get_field_map_cache_info()
+    assert info_cache["n_files"] == info_cache["size"] == 0
+    assert not list(tmp_path.iterdir())
+    monkeypatch.delenv("MNE_FIELD_MAP_CACHE_DIR")
+    # surface mappings (also with a different origin)
+    surf = get_meg_helmet_surf(info)
+    _lead_dots._dots_cache.clear()
+    want = _make_surface_mapping(info, surf, "meg", mode="fast", origin=origin)
+    misses, hits = stats["misses"], stats["hits"]
+    data = _make_surface_mapping(info, surf, "meg", mode="fast", origin=origin)
+    assert_allclose(data["data"], want["data"], rtol=1e-7)
+    assert stats["hits"] - hits == 2  # self and surface dots
+    _make_surface_mapping(info, surf, "meg", mode="fast", origin=(0.0, 0.0, 0.03))
+    assert stats["misses"] - misses == 2
+    # size control
+    info_cache = get_field_map_cache_info()
+    assert info_cache["n_entries"] == 4
+    assert info_cache["max_size"] == 10
+    assert info_cache["hits"] == stats["hits"]
+    assert info_cache["misses"] == stats["misses"]
+    assert info_cache["cache_dir"] is None
+    clear_field_map_cache()
+    assert get_field_map_cache_info() == dict(
+        n_entries=0, max_size=10, cache_dir=None, n_files=0, size=0, hits=0, misses=0
+    )
+    monkeypatch.setenv("MNE_FIELD_MAP_CACHE_SIZE", "1")
+    assert get_field_map_cache_info()["max_size"] == 10  # looked up once
+    clear_field_map_cache()
+    _make_surface_mapping(info, surf, "meg", mode="fast", origin=origin)
+    _make_surface_mapping(info, surf, "meg", mode="fast", origin=origin)
+    info_cache = get_field_map_cache_info()
+    assert (info_cache["n_entries"], info_cache["max_size"]) == (1, 1)
+    assert (info_cache["hits"], info_cache["misses"]) == (0, 4)
+    monkeypatch.setenv("MNE_FIELD_MAP_CACHE_SIZE", "0")
+    clear_field_map_cache()
+    data = _make_surface_mapping(info, surf, "meg", mode="fast", origin=origin)
+    assert_allclose(data["data"], want["data"], rtol=1e-7)
+    info_cache = get_field_map_cache_info()
+    assert (info_cache["n_entries"], info_cache["max_size"]) == (0, 0)
+    assert (info_cache["hits"], info_cache["misses"]) == (0, 2)
+    monkeypatch.delenv("MNE_FIELD_MAP_CACHE_SIZE")
+    clear_field_map_cache()
+
+
 @testing.requires_testing_data
 def test_make_field_map_eeg():
     """Test interpolation of EEG field onto head."""
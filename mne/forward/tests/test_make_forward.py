@@ -27,12 +27,18 @@ from mne import (
     write_forward_solution,
 )
 from mne._fiff.constants import FIFF
-from mne.bem import make_bem_solution, read_bem_surfaces
+from mne.bem import _surfaces_to_bem, make_bem_solution, read_bem_surfaces
 from mne.channels import make_standard_montage
 from mne.datasets import testing
 from mne.dipole import Dipole, fit_dipole
-from mne.forward import Forward, _do_forward_solution, use_coil_def
-from mne.forward._compute_forward import _magnetic_dipole_field_vec
+from mne.forward import (
+    Forward,
+    _do_forward_solution,
+    clear_forward_cache,
+    get_forward_cache_info,
+    use_coil_def,
+)
+from mne.forward._compute_forward import _fwd_cache, _magnetic_dipole_field_vec
 from mne.forward._make_forward import (
     _create_meg_coils,
     _ForwardModeler,
@@ -48,7 +54,7 @@ from mne.source_space._source_space import (
     write_source_spaces,
 )
 from mne.surface import _get_ico_surface
-from mne.transforms import Transform, apply_trans, invert_transform
+from mne.transforms import Transform, apply_trans, invert_transform, translation
 from mne.utils import (
     _record_warnings,
     catch_logging,
@@ -947,3 +953,104 @@ def test_make_forward_iterative():
         fwd_data.append(fm.compute(ss)["sol"]["data"])
     fwd_data = np.concatenate(fwd_data, axis=1)
     assert_allclose(fwd_data, fwd["sol"]["data"])
+
+
+def test_make_forward_cache(tmp_path, monkeypatch):
+    """Test the on-disk cache of forward computations."""
+    r0 = (0.0, 0.0, 0.04)
+    surf = _get_ico_surface(3)
+    surf["rr"] = surf["rr"] * 0.08 + r0
+    bem = make_bem_solution(
+        _surfaces_to_bem([surf], [FIFF.FIFFV_BEM_SURF_ID_BRAIN], [0.3], rescale=False)
+    )
+    sphere = make_sphere_model(r0=r0, head_radius=0.09)
+    src = setup_volume_source_space(pos=15.0, sphere=r0 + (0.07,), exclude=10)
+    trans = Transform("mri", "head")
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True)[::10])
+    for model in (bem, sphere):
+        want = make_forward_solution(info, trans, src, model)["sol"]["data"]
+        cache_dir = tmp_path / ("sphere" if model["is_sphere"] else "bem")
+        monkeypatch.setenv("MNE_FORWARD_CACHE_DIR", str(cache_dir))
+        stats = _fwd_cache.stats.copy()
+        fwd = make_forward_solution(info, trans, src, model)
+        assert_array_equal(fwd["sol"]["data"], want)
+        n_miss = 1 if model["is_sphere"] else 2  # gain (and BEM field matrix)
+        assert _fwd_cache.stats["misses"] - stats["misses"] == n_miss
+        assert _fwd_cache.stats["hits"] == stats["hits"]
+        assert len(list(cache_dir.rglob("*-fwd.npz"))) == n_miss
+        # same computation
+        fwd = make_forward_solution(info, trans, src, model)
+        assert_array_equal(fwd["sol"]["data"], want)
+        assert _fwd_cache.stats["hits"] - stats["hits"] == 1
+        # dropped channels
+        picks = np.arange(0, len(info["ch_names"]), 2)
+        fwd = make_forward_solution(pick_info(info, picks), trans, src, model)
+        assert_array_equal(fwd["sol"]["data"], want[picks])
+        assert _fwd_cache.stats["hits"] - stats["hits"] == 2
+        assert _fwd_cache.stats["misses"] - stats["misses"] == n_miss
+        # different sources (with a BEM, the field matrix is reused)
+        src_small = setup_volume_source_space(pos=20.0, sphere=r0 + (0.07,))
+        make_forward_solution(info, trans, src_small, model)
+        assert _fwd_cache.stats["misses"] - stats["misses"] == n_miss + 1
+        assert _fwd_cache.stats["hits"] - stats["hits"] == 2 + (n_miss - 1)
+        # a different transform (or a corrupted cache) leads to recomputation
+        misses = _fwd_cache.stats["misses"]
+        trans_2 = Transform("mri", "head", translation(0.0, 0.0, 0.001))
+        make_forward_solution(info, trans_2, src, model)
+        assert _fwd_cache.stats["misses"] - misses == n_miss
+        for fname in cache_dir.rglob("*-fwd.npz"):
+            fname.write_bytes(b"foo")
+        misses = _fwd_cache.stats["misses"]
+        fwd = make_forward_solution(info, trans, src, model)
+        assert_array_equal(fwd["sol"]["data"], want)
+        assert _fwd_cache.stats["misses"] - misses == n_miss
+        info_cache = get_forward_cache_info()
+        assert info_cache["cache_dir"] == cache_dir
+        assert info_cache["n_files"] == len(list(cache_dir.rglob("*-fwd.npz")))
+        assert info_cache["hits"] == _fwd_cache.stats["hits"]
+        clear_forward_cache()
+        assert get_forward_cache_info()["n_files"] == 0
+        assert get_forward_cache_info()["misses"] == 0
+        monkeypatch.delenv("MNE_FORWARD_CACHE_DIR")
+    assert get_forward_cache_info()["cache_dir"] is None
+
+
+@pytest.mark.parametrize("n_jobs", (1, 2))
+def test_make_forward_chunked(n_jobs, monkeypatch):
+    """Test computing forward solutions in chunks of sources."""
+    r0 = (0.0, 0.0, 0.04)
+    surf = _get_ico_surface(2)
+    surf["rr"] = surf["rr"] * 0.08 + r0
+    bem = make_bem_solution(
+        _surfaces_to_bem([surf], [FIFF.FIFFV_BEM_SURF_ID_BRAIN], [0.3], rescale=False)
+    )
+    sphere = make_sphere_model(r0=r0, head_radius=0.09)
+    src = setup_volume_source_space(pos=15.0, sphere=r0 + (0.07,), exclude=10)
+    trans = Transform("mri", "head")
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True)[::10])
+    info_eeg = read_info(fname_raw)
+    info_eeg = pick_info(info_eeg, pick_types(info_eeg, meg=False, eeg=True)[::5])
+    for model, this_info in ((bem, info), (sphere, info), (sphere, info_eeg)):
+        want = make_forward_solution(this_info, trans, src, model)["sol"]["data"]
+        # one source at a time
+        monkeypatch.setenv("MNE_FORWARD_CHUNK_SIZE", "1e-6")
+        got = make_forward_solution(this_info, trans, src, model, n_jobs=n_jobs)
+        atol = 1e-12 * np.abs(want).max()
+        assert_allclose(got["sol"]["data"], want, rtol=1e-12, atol=atol)
+        monkeypatch.delenv("MNE_FORWARD_CHUNK_SIZE")
+    # the memory budget is looked up once per call
+    keys = list()
+
+    def _get_config(key, default=None):
+        keys.append(key)
+        return default
+
+    monkeypatch.setattr("mne.forward._compute_forward.get_config", _get_config)
+    make_forward_solution(info, trans, src, bem)
+    assert keys.count("MNE_FORWARD_CHUNK_SIZE") == 1
+    monkeypatch.undo()
+    monkeypatch.setenv("MNE_FORWARD_CHUNK_SIZE", "foo")
+    with pytest.raises(ValueError, match="must be a number"):
+        make_forward_solution(info, trans, src, sphere)
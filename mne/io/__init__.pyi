@@ -3,9 +3,11 @@ __all__ = [
     "Raw",
     "RawArray",
     "anonymize_info",
+    "clear_fiff_cache",
     "concatenate_raws",
     "constants",
     "get_channel_type_constants",
+    "get_fiff_cache_info",
     "match_channel_orders",
     "pick",
     "read_epochs_eeglab",
@@ -36,6 +38,7 @@ __all__ = [
     "read_raw_fif",
     "read_raw_fil",
     "read_raw_gdf",
+    "read_raw_hdf5",
     "read_raw_hitachi",
     "read_raw_kit",
     "read_raw_mef",
@@ -54,7 +57,9 @@ __all__ = [
 from . import constants, pick
 from ._fiff_wrap import (
     anonymize_info,
+    clear_fiff_cache,
     get_channel_type_constants,
+    get_fiff_cache_info,
     read_fiducials,
     read_info,
     show_fiff,
@@ -82,6 +87,7 @@ from .eyelink import read_raw_eyelink
 from .fieldtrip import read_epochs_fieldtrip, read_evoked_fieldtrip, read_raw_fieldtrip
 from .fiff import Raw, read_raw_fif
 from .fil import read_raw_fil
+from .hdf5 import read_raw_hdf5
 from .hitachi import read_raw_hitachi
 from .kit import read_epochs_kit, read_raw_kit
 from .mef import read_raw_mef
@@ -0,0 +1,440 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+"""Out-of-core filtering and resampling of raw data to a new file."""
+
+import threading
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from .._fiff.pick import _picks_to_idx
+from .._fiff.utils import _mult_cal_one
+from .._ola import _COLA
+from ..annotations import _annotations_starts_stops
+from ..filter import (
+    _check_fir_pad,
+    _check_method,
+    _check_notch_freqs,
+    _create_filter,
+    _filt_check_picks,
+    _filt_update_info,
+    _get_mt_filter_length,
+    _get_notch_bands,
+    _get_window_thresh,
+    _log_notch_freqs,
+    _mt_spectrum_remove,
+    _overlap_add_filter,
+    _prep_polyphase,
+    _resamp_ratio_len,
+    _resample_polyphase,
+)
+from ..utils import _check_fname, _pl, logger
+from .base import BaseRaw
+
+# Padding modes of scipy.signal.resample_poly that depend on the entire signal
+# (and thus cannot be reproduced chunk-by-chunk)
+_GLOBAL_PADS = ("mean", "median", "minimum", "maximum", "line")
+# Minimum duration of the chunks that are processed at once
+_CHUNK_SEC = 10.0
+
+
+class _RawChunked(BaseRaw):
+    """Raw whose data are computed chunk-by-chunk from another instance.
+
+    ``process(start, stop)`` must return the data (in physical units) of all
+    channels for samples ``start`` to ``stop`` (zero-based). The most recent
+    chunk is kept, so that reading sequentially in buffers smaller than
+    ``n_chunk`` (e.g., when saving) computes each sample only once.
+    """
+
+    def __init__(self, info, first_samp, n_times, process, n_chunk, annotations):
+        cals = np.array([ch["cal"] * ch["range"] for ch in info["chs"]], float)
+        super().__init__(
+            info,
+            preload=False,
+            first_samps=(first_samp,),
+            last_samps=(first_samp + n_times - 1,),
+            raw_extras=[
+                dict(
+                    first_samp=first_samp,
+                    n_times=n_times,
+                    cals=cals,
+                    process=process,
+                    n_chunk=n_chunk,
+                    chunk=(0, 0, None),
+                    lock=threading.Lock(),
+                )
+            ],
+            verbose=False,
+        )
+        self.set_annotations(annotations, emit_warning=False)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Compute a segment of data."""
+        extra = self._raw_extras[fi]
+        start = start - extra["first_samp"]
+        stop = stop - extra["first_samp"]
+        with extra["lock"]:
+            c_start, c_stop, chunk = extra["chunk"]
+            if start < c_start or stop > c_stop:
+                c_start = start
+                c_stop = min(max(stop, start + extra["n_chunk"]), extra["n_times"])
+                chunk = extra["process"](c_start, c_stop)
+                chunk /= extra["cals"][:, np.newaxis]
+                extra["chunk"] = (c_start, c_stop, chunk)
+        _mult_cal_one(data, chunk[:, start - c_start : stop - c_start], idx, cals, mult)
+
+
+def _check_out_fname(raw, out_fname, overwrite):
+    out_fname = _check_fname(out_fname, overwrite=overwrite, name="out_fname")
+    if not raw.preload and out_fname in [Path(f) for f in raw.filenames if f]:
+        raise ValueError(
+            "out_fname must differ from the file(s) the data are read from, got "
+            f"{out_fname}"
+        )
+    return out_fname
+
+
+def _write_chunked(raw, info, first_samp, n_times, process, n_margin, out_fname):
+    """Write the data computed by ``process`` to disk and read it lazily."""
+    from .fiff import read_raw_fif
+
+    n_chunk = max(4 * n_margin, int(round(_CHUNK_SEC * info["sfreq"])))
+    n_chunk = min(n_chunk, n_times)
+    logger.info(
+        f"Writing {out_fname.name} in chunks of {n_chunk} sample{_pl(n_chunk)} "
+        f"({n_chunk / info['sfreq']:0.1f} s)"
+    )
+    chunked = _RawChunked(
+        info, first_samp, n_times, process, n_chunk, raw.annotations.copy()
+    )
+    # overwrite was already checked (and the file might legitimately exist)
+    fnames = chunked.save(out_fname, overwrite=True, verbose="warning")
+    return read_raw_fif(fnames[0], verbose="warning")
+
+
+def _filter_raw_to_file(
+    raw,
+    out_fname,
+    overwrite,
+    *,
+    l_freq,
+    h_freq,
+    picks,
+    filter_length,
+    l_trans_bandwidth,
+    h_trans_bandwidth,
+    n_jobs,
+    method,
+    iir_params,
+    phase,
+    fir_window,
+    fir_design,
+    skip_by_annotation,
+    pad,
+):
+    """Filter raw data chunk-by-chunk and write the result to disk.
+
+    The output matches that of filtering the data in memory with
+    :meth:`mne.io.Raw.filter`: each chunk is filtered together with enough
+    neighboring samples (at least the filter length) that the result does not
+    depend on the chunk boundaries, and the edges of each contiguous segment
+    are padded just like they are when filtering in memory.
+    """
+    out_fname = _check_out_fname(raw, out_fname, overwrite)
+    iir_params, method = _check_method(method, iir_params)
+    if method != "fir":
+        raise ValueError(
+            f'out_fname can only be used with method="fir", got method="{method}"'
+        )
+    update_info, picks = _filt_check_picks(raw.info, picks, l_freq, h_freq)
+    pad = _check_fir_pad(pad, method)
+    onsets, ends = _annotations_starts_stops(raw, skip_by_annotation, invert=True)
+    logger.info(
+        "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
+    )
+    # The filter only depends on the data through sanity checks of the length
+    # of the longest segment, so avoid allocating it
+    n_longest = int((ends - onsets).max()) if len(onsets) else 1
+    h = _create_filter(
+        np.broadcast_to(np.zeros(1), (1, n_longest)),
+        raw.info["sfreq"],
+        l_freq,
+        h_freq,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    process, n_margin = _get_fir_process(
+        raw, h, picks, n_jobs, phase, pad, onsets, ends
+    )
+    info = raw.info.copy()
+    _filt_update_info(info, update_info, l_freq, h_freq)
+    return _write_chunked(
+        raw, info, raw.first_samp, raw.n_times, process, n_margin, out_fname
+    )
+
+
+def _get_fir_process(raw, h, picks, n_jobs, phase, pad, onsets, ends):
+    """Get a function that FIR filters the contiguous segments of a chunk."""
+    n_margin = len(h)
+
+    def process(start, stop):
+        r_start = max(start - n_margin, 0)
+        r_stop = min(stop + n_margin, raw.n_times)
+        x = raw._getitem((slice(None), slice(r_start, r_stop)), return_times=False)
+        out = np.array(x[:, start - r_start : stop - r_start])
+        for onset, end in zip(onsets, ends):
+            if onset >= stop or end <= start:
+                continue
+            # filter the part of the segment we need plus the margin
+            s_start = max(onset, start - n_margin) - r_start
+            s_stop = min(end, stop + n_margin) - r_start
+            filt = _overlap_add_filter(
+                x[:, s_start:s_stop], h, None, phase, picks, n_jobs, True, pad
+            )
+            o_start, o_stop = max(onset, start), min(end, stop)
+            out[:, o_start - start : o_stop - start] = filt[
+                :, o_start - r_start - s_start : o_stop - r_start - s_start
+            ]
+        return out
+
+    return process, n_margin
+
+
+def _notch_raw_to_file(
+    raw,
+    out_fname,
+    overwrite,
+    *,
+    freqs,
+    picks,
+    filter_length,
+    notch_widths,
+    trans_bandwidth,
+    n_jobs,
+    method,
+    iir_params,
+    mt_bandwidth,
+    p_value,
+    phase,
+    fir_window,
+    fir_design,
+    pad,
+    skip_by_annotation,
+):
+    """Notch filter raw data chunk-by-chunk and write the result to disk.
+
+    With ``method='fir'``, each chunk is filtered like in
+    :func:`_filter_raw_to_file`. With ``method='spectrum_fit'``, the
+    overlapping windows of each contiguous segment are placed like when
+    filtering in memory, and each chunk is computed from the (weighted) windows
+    that overlap it.
+    """
+    out_fname = _check_out_fname(raw, out_fname, overwrite)
+    iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
+    if method not in ("fir", "spectrum_fit"):
+        raise ValueError(
+            'out_fname can only be used with method="fir" or "spectrum_fit", got '
+            f'method="{method}"'
+        )
+    freqs, notch_widths = _check_notch_freqs(freqs, notch_widths, method)
+    picks = _picks_to_idx(raw.info, picks, exclude=(), none="data_or_ica")
+    pad = _check_fir_pad(pad, method)
+    onsets, ends = _annotations_starts_stops(raw, skip_by_annotation, invert=True)
+    logger.info(
+        "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
+    )
+    sfreq = raw.info["sfreq"]
+    if method == "fir":
+        tb_2 = trans_bandwidth / 2.0
+        lows, highs = _get_notch_bands(freqs, notch_widths, tb_2)
+        n_longest = int((ends - onsets).max()) if len(onsets) else 1
+        h = _create_filter(
+            np.broadcast_to(np.zeros(1), (1, n_longest)),
+            sfreq,
+            highs,
+            lows,
+            filter_length,
+            tb_2,
+            tb_2,
+            method,
+            iir_params,
+            phase,
+            fir_window,
+            fir_design,
+        )
+        process, n_margin = _get_fir_process(
+            raw, h, picks, n_jobs, phase, pad, onsets, ends
+        )
+        return _write_chunked(
+            raw, raw.info, raw.first_samp, raw.n_times, process, n_margin, out_fname
+        )
+
+    get_wt = partial(
+        _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
+    )
+    segments = list()
+    for onset, end in zip(onsets, ends):
+        n_samples = _get_mt_filter_length(filter_length, sfreq, end - onset)
+        window_fun, threshold = get_wt(n_samples)
+        # only used for the placement and weights of the windows
+        cola = _COLA(
+            lambda x, *, start, stop: (x,),
+            np.empty((0, end - onset)),
+            end - onset,
+            n_samples,
+            (n_samples + 1) // 2,
+            sfreq,
+            verbose=False,
+        )
+        segments.append((onset, cola, window_fun, threshold))
+    n_margin = max((len(cola._window) for _, cola, _, _ in segments), default=1)
+    # the windows computed for the previous chunk, which can overlap this one
+    done = dict()
+    freq_list = list()
+
+    def process(start, stop):
+        x = raw._getitem((slice(None), slice(start, stop)), return_times=False)
+        out = np.array(x)
+        out[picks] = 0.0
+        this_done = dict()
+        for si, (onset, cola, window_fun, threshold) in enumerate(segments):
+            w_starts, w_stops = onset + cola.starts, onset + cola.stops
+            for wi in np.where((w_starts < stop) & (w_stops > start))[0]:
+                w_start, w_stop = w_starts[wi], w_stops[wi]
+                if (si, wi) in done:
+                    filt = done[(si, wi)]
+                else:
+                    x = raw._getitem(
+                        (picks, slice(w_start, w_stop)), return_times=False
+                    )
+                    filt, rm_freqs = _mt_spectrum_remove(
+                        x, sfreq, freqs, notch_widths, window_fun, threshold, get_wt
+                    )
+                    filt *= cola._get_window(wi)
+                    freq_list.extend(rm_freqs)
+                this_done[(si, wi)] = filt
+                o_start, o_stop = max(w_start, start), min(w_stop, stop)
+                out[picks, o_start - start : o_stop - start] += filt[
+                    :, o_start - w_start : o_stop - w_start
+                ]
+        done.clear()
+        done.update(this_done)
+        return out
+
+    raw_out = _write_chunked(
+        raw, raw.info, raw.first_samp, raw.n_times, process, n_margin, out_fname
+    )
+    _log_notch_freqs(freq_list, freqs)
+    return raw_out
+
+
+def _resample_raw_to_file(
+    raw, out_fname, overwrite, *, sfreq, window, stim_picks, n_jobs, pad, method
+):
+    """Resample raw data chunk-by-chunk and write the result to disk.
+
+    Each file of the instance is resampled separately with the same polyphase
+    filter as :meth:`mne.io.Raw.resample`, and each output chunk is computed
+    from an input chunk that starts at a multiple of the decimation factor
+    (so the output samples line up) and includes the filter neighborhood.
+    """
+    out_fname = _check_out_fname(raw, out_fname, overwrite)
+    if method != "polyphase":
+        raise ValueError(
+            f'out_fname can only be used with method="polyphase", got method="{method}"'
+        )
+    pad = "reflect" if pad == "auto" else pad
+    if pad in _GLOBAL_PADS:
+        raise ValueError(
+            f"out_fname cannot be used with pad={repr(pad)}, which depends on the "
+            "entire signal"
+        )
+    o_sfreq = float(raw.info["sfreq"])
+    ratio, n_news = zip(
+        *(_resamp_ratio_len(sfreq, o_sfreq, n_orig) for n_orig in raw._raw_lengths)
+    )
+    ratio, n_news = ratio[0], np.array(n_news, int)
+    offsets = np.concatenate([[0], np.cumsum(raw._raw_lengths)])
+    new_offsets = np.concatenate([[0], np.cumsum(n_news)])
+    filts = dict()
+    for n_orig, n_new in zip(raw._raw_lengths, n_news):
+        if (n_orig, n_new) not in filts:
+            up, down, h = _prep_polyphase(n_new / n_orig, n_orig, n_new, window)
+            # input samples needed on each side, as a multiple of down
+            n_margin = (len(h) // (up * down) + 2) * down
+            filts[(n_orig, n_new)] = (up, down, h, n_margin)
+    half_len = max(len(f[2]) for f in filts.values()) // 2
+    logger.info(
+        f"Polyphase resampling neighborhood: ±{half_len} input sample{_pl(half_len)}"
+    )
+    n_margin_out = int(np.ceil(max(f[3] for f in filts.values()) * ratio))
+    data_picks = np.setdiff1d(np.arange(raw.info["nchan"]), stim_picks)
+
+    def process(start, stop):
+        out = np.empty((raw.info["nchan"], stop - start))
+        for fi, (n_orig, n_new) in enumerate(zip(raw._raw_lengths, n_news)):
+            j0 = max(start, new_offsets[fi]) - new_offsets[fi]
+            j1 = min(stop, new_offsets[fi + 1]) - new_offsets[fi]
+            if j0 >= j1:
+                continue
+            o_sl = slice(j0 + new_offsets[fi] - start, j1 + new_offsets[fi] - start)
+            up, down, h, n_margin = filts[(n_orig, n_new)]
+            # start on a multiple of down so that output sample t * down / up
+            # of this chunk is output sample j0 of the full computation
+            i0 = max((j0 // up) * down - n_margin, 0)
+            i1 = min(-(-j1 // up) * down + n_margin, n_orig)
+            x = raw._getitem(
+                (slice(None), slice(offsets[fi] + i0, offsets[fi] + i1)),
+                return_times=False,
+            )
+            t = i0 * up // down
+            y = _resample_polyphase(
+                x[data_picks], up=up, down=down, pad=pad, window=h, n_jobs=n_jobs
+            )
+            assert y.shape[1] >= j1 - t
+            out[data_picks, o_sl] = y[:, j0 - t : j1 - t]
+            if len(stim_picks):
+                out[stim_picks, o_sl] = _resample_stim_chunk(
+                    x[stim_picks], i0, n_orig, n_new, j0, j1
+                )
+        return out
+
+    info = raw.info.copy()
+    lowpass = info.get("lowpass")
+    lowpass = np.inf if lowpass is None else lowpass
+    with info._unlock():
+        info["lowpass"] = min(lowpass, sfreq / 2.0)
+        info["sfreq"] = sfreq
+    first_samp = int(np.round(raw._first_samps[0] * ratio))
+    return _write_chunked(
+        raw, info, first_samp, int(n_news.sum()), process, n_margin_out, out_fname
+    )
+
+
+def _resample_stim_chunk(stim, i0, n_orig, n_new, j0, j1):
+    """Resample samples j0 ... j1 of stim channels like _resample_stim_channels.
+
+    ``stim`` holds the input samples starting at sample ``i0``.
+    """
+    ratio = float(n_new) / n_orig
+    picks = np.minimum((np.arange(j0, j1 + 1) / ratio).astype(int), n_orig - 1)
+    if j1 == n_new:
+        picks[-1] = n_orig
+    picks -= i0
+    out = np.empty((len(stim), j1 - j0))
+    for wi, (w_start, w_stop) in enumerate(zip(picks[:-1], picks[1:])):
+        for si, this_stim in enumerate(stim):
+            nonzero = this_stim[w_start:w_stop].nonzero()[0]
+            idx = w_start + (nonzero[0] if len(nonzero) else 0)
+            out[si, wi] = this_stim[idx]
+    return out
@@ -16,5 +16,5 @@ from .._fiff.meas_info import (
     write_fiducials,
     write_info,
 )
-from .._fiff.open import show_fiff
+from .._fiff.open import clear_fiff_cache, get_fiff_cache_info, show_fiff
 from .._fiff.pick import get_channel_type_constants  # moved up a level
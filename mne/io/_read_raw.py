@@ -42,6 +42,7 @@ def _get_supported():
         read_raw_fif,
         read_raw_fil,
         read_raw_gdf,
+        read_raw_hdf5,
         read_raw_kit,
         read_raw_mef,
         read_raw_nedf,
@@ -63,6 +64,7 @@ def _get_supported():
         ".mefd": dict(MEF=read_raw_mef),
         ".fif": dict(FIF=read_raw_fif),
         ".fif.gz": dict(FIF=read_raw_fif),
+        ".h5": dict(HDF5=read_raw_hdf5),
         ".set": dict(EEGLAB=read_raw_eeglab),
         ".cnt": dict(CNT=read_raw_cnt, ANT=read_raw_ant),
         ".mff": dict(EGI=read_raw_egi),
@@ -150,6 +152,7 @@ def read_raw(fname, *, preload=False, verbose=None, **kwargs) -> BaseRaw:
     * `~mne.io.read_raw_fif`
     * `~mne.io.read_raw_fil`
     * `~mne.io.read_raw_gdf`
+    * `~mne.io.read_raw_hdf5`
     * `~mne.io.read_raw_kit`
     * `~mne.io.read_raw_mef`
     * `~mne.io.read_raw_nedf`
@@ -0,0 +1,180 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+"""Concurrent and prefetching reads of non-preloaded raw data."""
+
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import numpy as np
+
+from ..parallel import _check_n_jobs
+from ..utils import _ensure_int, get_config, logger
+
+# Cumulative statistics of reads from disk in this session (updated from the
+# reading threads, too)
+_read_stats = dict(n_reads=0, n_bytes=0, time=0.0, prefetch_hits=0)
+_read_stats_lock = Lock()
+_pools = dict()
+# id(raw) -> per-instance state (raw instances are not hashable, and keeping
+# this out of the instance keeps futures out of copies and pickles)
+_states = dict()
+
+
+def _get_read_n_jobs():
+    """Get the number of threads to use for reading from multiple files."""
+    n_jobs = get_config("MNE_READ_N_JOBS", "1")
+    try:
+        n_jobs = int(n_jobs)
+    except ValueError:
+        raise ValueError(
+            f"MNE_READ_N_JOBS must be an integer, got {repr(n_jobs)}"
+        ) from None
+    return _check_n_jobs(n_jobs)
+
+
+def _get_read_prefetch():
+    return get_config("MNE_READ_PREFETCH", "false").lower() in ("true", "1")
+
+
+def _get_pool(kind, n_jobs):
+    """Get a (process-wide) thread pool, recreating it if the size changed."""
+    n_jobs = _ensure_int(n_jobs, "n_jobs")
+    pool = _pools.get(kind)
+    if pool is None or pool._max_workers != n_jobs:
+        if pool is not None:
+            pool.shutdown(wait=False)
+        pool = _pools[kind] = ThreadPoolExecutor(
+            max_workers=n_jobs, thread_name_prefix=f"mne_read_{kind}"
+        )
+    return pool
+
+
+def _read_files(raw, data, reads, cals, mult):
+    """Read segments from the files of a raw instance.
+
+    Parameters
+    ----------
+    raw : instance of BaseRaw
+        The raw instance.
+    data : ndarray, shape (n_channels, n_times)
+        The array to fill.
+    reads : list of tuple
+        For each file to read from, the file index, the slice of ``data`` to
+        fill, the start and stop samples in the file, and the channel indices.
+    cals, mult : ndarray | None
+        Calibrations and projection/compensation, see ``_read_segment_file``.
+    """
+    from .base import _ReadSegmentFileProtector
+
+    def _read_one(fi, this_sl, start_file, stop_file, idx):
+        _ReadSegmentFileProtector(raw)._read_segment_file(
+            data[:, this_sl], idx, fi, start_file, stop_file, cals, mult
+        )
+
+    t0 = time.perf_counter()
+    n_jobs = min(_get_state(raw)["n_jobs"], len(reads))
+    if n_jobs > 1:
+        # Each read fills a different set of columns of the output, so these
+        # can run concurrently (reading is I/O-bound and releases the GIL)
+        pool = _get_pool("files", n_jobs)
+        for future in [pool.submit(_read_one, *read) for read in reads]:
+            future.result()
+    else:
+        for read in reads:
+            _read_one(*read)
+    dt = time.perf_counter() - t0
+    with _read_stats_lock:
+        _read_stats["n_reads"] += 1
+        _read_stats["n_bytes"] += data.nbytes
+        _read_stats["time"] += dt
+    logger.debug(
+        f"    Read {data.nbytes / 1e6:0.1f} MB from {len(reads)} file(s) using "
+        f"{n_jobs} thread(s) in {dt:0.3f} s ({data.nbytes / 1e6 / max(dt, 1e-9):0.1f} "
+        "MB/s)"
+    )
+
+
+def _get_state(raw):
+    """Get the read settings and prefetch state of a raw instance.
+
+    The settings (MNE_READ_N_JOBS and MNE_READ_PREFETCH) are looked up once,
+    when the instance is first read from, rather than for every read.
+    """
+    state = _states.get(id(raw))
+    if state is None or state["ref"]() is not raw:
+        state = dict(
+            ref=weakref.ref(raw),
+            last=(None, None),
+            prefetched=None,
+            n_jobs=_get_read_n_jobs(),
+            prefetch=_get_read_prefetch(),
+        )
+        _states[id(raw)] = state
+        weakref.finalize(raw, _states.pop, id(raw), None)
+    return state
+
+
+def _prefetch_key(raw, start, stop, sel):
+    """Get a key for a segment that changes when the raw read state changes."""
+    sel_key = sel
+    if sel is not None and not isinstance(sel, slice):
+        sel_key = np.asarray(sel).tobytes()
+    return (
+        start,
+        stop,
+        sel_key,
+        np.concatenate(raw._read_picks).tobytes(),
+        raw._first_samps.tobytes(),
+        raw._last_samps.tobytes(),
+        id(raw._projector),
+        id(raw._comp),
+    )
+
+
+def _get_prefetched(raw, start, stop, sel):
+    """Get a prefetched segment of data, or None if it is not available."""
+    state = _get_state(raw)
+    if state["prefetched"] is None:
+        return None
+    key, future = state["prefetched"]
+    state["prefetched"] = None
+    if key != _prefetch_key(raw, start, stop, sel):
+        future.cancel()
+        return None
+    data = future.result()
+    with _read_stats_lock:
+        _read_stats["prefetch_hits"] += 1
+    logger.debug(f"    Using prefetched data for samples {start} ... {stop}")
+    return data
+
+
+def _maybe_prefetch(raw, start, stop, sel):
+    """Start reading the next segment in the background if reads are regular.
+
+    Reads are considered regular if the segment is the same length as the
+    previous one and starts after it (e.g., consecutive or overlapping
+    chunks), or if it starts exactly where the previous one stopped.
+    """
+    state = _get_state(raw)
+    last_start, last_stop = state["last"]
+    state["last"] = (start, stop)
+    if last_start is None or stop >= raw.n_times or not state["prefetch"]:
+        return
+    if stop - start == last_stop - last_start and start > last_start:
+        step = start - last_start
+    elif start == last_stop:
+        step = stop - start
+    else:
+        return
+    next_start, next_stop = start + step, min(stop + step, raw.n_times)
+    if next_start >= next_stop:
+        return
+    key = _prefetch_key(raw, next_start, next_stop, sel)
+    future = _get_pool("prefetch", 1).submit(
+        raw._read_segment, next_start, next_stop, sel, _prefetch=False
+    )
+    state["prefetched"] = (key, future)
@@ -85,6 +85,7 @@ from ..utils import (
     _convert_times,
     _file_like,
     _get_argvalues,
+    _get_data_dtype,
     _get_stim_channel,
     _pl,
     _scale_dataframe_data,
@@ -92,7 +93,6 @@ from ..utils import (
     _time_mask,
     _validate_type,
     check_fname,
-    copy_doc,
     copy_function_doc_to_method_doc,
     fill_doc,
     logger,
@@ -102,6 +102,7 @@ from ..utils import (
     warn,
 )
 from ..viz import _RAW_CLIP_DEF, plot_raw
+from ._read_scheduler import _get_prefetched, _maybe_prefetch, _read_files
 
 
 @fill_doc
@@ -202,10 +203,15 @@ class BaseRaw(
     ):
         # wait until the end to preload data, but triage here
         if isinstance(preload, np.ndarray):
-            # some functions (e.g., filtering) only work w/64-bit data
-            if preload.dtype not in (np.float64, np.complex128):
+            if preload.dtype not in (
+                np.float64,
+                np.complex128,
+                np.float32,
+                np.complex64,
+            ):
                 raise RuntimeError(
-                    f"datatype must be float64 or complex128, not {preload.dtype}"
+                    "datatype must be float64, complex128, float32 or complex64, not "
+                    f"{preload.dtype}"
                 )
             if preload.dtype != dtype:
                 raise ValueError("preload and dtype must match")
@@ -364,7 +370,14 @@ class BaseRaw(
 
     @verbose
     def _read_segment(
-        self, start=0, stop=None, sel=None, data_buffer=None, *, verbose=None
+        self,
+        start=0,
+        stop=None,
+        sel=None,
+        data_buffer=None,
+        *,
+        _prefetch=True,
+        verbose=None,
     ):
         """Read a chunk of raw data.
 
@@ -384,6 +397,9 @@ class BaseRaw(
             to store the data.
         projector : array
             SSP operator to apply to the data.
+        _prefetch : bool
+            Whether to use (and schedule) reads of the next segment in the
+            background when reading sequentially (see ``MNE_READ_PREFETCH``).
         %(verbose)s
 
         Returns
@@ -398,6 +414,13 @@ class BaseRaw(
         if start >= stop:
             raise ValueError("No data in this range")
 
+        # sequential reads might have already been done in the background
+        if _prefetch and data_buffer is None:
+            data = _get_prefetched(self, start, stop, sel)
+            if data is not None:
+                _maybe_prefetch(self, start, stop, sel)
+                return data
+
         #  Initialize the data and calibration vector
         if sel is None:
             n_out = self.info["nchan"]
@@ -405,7 +428,6 @@ class BaseRaw(
         else:
             n_out = len(sel)
             idx = _convert_slice(sel)
-        del sel
         assert n_out <= self.info["nchan"]
         data_shape = (n_out, stop - start)
         dtype = self._dtype
@@ -457,6 +479,7 @@ class BaseRaw(
 
         # read from necessary files
         offset = 0
+        reads = list()
         for fi in np.nonzero(files_used)[0]:
             start_file = self._first_samps[fi]
             # first iteration (only) could start in the middle somewhere
@@ -474,16 +497,11 @@ class BaseRaw(
             this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
-                orig_idx,
-                fi,
-                int(start_file),
-                int(stop_file),
-                cals,
-                mult,
-            )
+            reads.append((fi, this_sl, int(start_file), int(stop_file), orig_idx))
             offset += n_read
+        _read_files(self, data, reads, cals, mult)
+        if _prefetch and data_buffer is None:
+            _maybe_prefetch(self, start, stop, sel)
         return data
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
@@ -566,7 +584,7 @@ class BaseRaw(
         return self._getitem((picks, slice(start, stop)), return_times=False)
 
     @verbose
-    def load_data(self, *, memmap=None, verbose=None):
+    def load_data(self, *, memmap=None, dtype=None, verbose=None):
         """Load raw data.
 
         Parameters
@@ -575,6 +593,9 @@ class BaseRaw(
             If not ``None``, preload data into a memory-mapped file at this
             path. If ``None`` (default), preload data into RAM.
 
+            .. versionadded:: 1.13
+        %(dtype_data)s
+
             .. versionadded:: 1.13
         %(verbose)s
 
@@ -586,17 +607,22 @@ class BaseRaw(
         Notes
         -----
         This function will load raw data if it was not already preloaded.
-        If data were already preloaded, it will do nothing.
+        If data were already preloaded, it will do nothing, except for
+        converting them to single precision if ``dtype='float32'``.
 
         .. versionadded:: 0.10.0
         """
         if not self.preload:
             if memmap is not None:
                 _validate_type(memmap, "path-like", "memmap")
-            self._preload_data(memmap if memmap is not None else True)
+            self._preload_data(memmap if memmap is not None else True, dtype=dtype)
+        elif dtype is not None:
+            dtype = _get_data_dtype(self._data.dtype, dtype)
+            if dtype.itemsize < self._data.dtype.itemsize:
+                self._data = self._data.astype(dtype)
         return self
 
-    def _preload_data(self, preload):
+    def _preload_data(self, preload, *, dtype=None):
         """Actually preload the data."""
         data_buffer = preload
         if isinstance(preload, bool | np.bool_) and not preload:
@@ -605,6 +631,14 @@ class BaseRaw(
         logger.info(
             f"Reading 0 ... {len(t) - 1}  =  {0.0:9.3f} ... {t[-1]:9.3f} secs..."
         )
+        dtype = _get_data_dtype(self._dtype, dtype)
+        if dtype != self._dtype:
+            # read directly into a single-precision buffer
+            data_buffer = _allocate_data(
+                True if data_buffer is None else data_buffer,
+                (self.info["nchan"], len(t)),
+                dtype,
+            )
         self._data = self._read_segment(data_buffer=data_buffer)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
@@ -1065,6 +1099,98 @@ class BaseRaw(
             return data, times
         return data
 
+    @fill_doc
+    def iter_chunks(
+        self,
+        duration,
+        overlap=0.0,
+        picks=None,
+        reject_by_annotation=None,
+        return_times=False,
+        *,
+        tmin=None,
+        tmax=None,
+    ):
+        """Iterate over the data in chunks of fixed duration.
+
+        This allows processing long recordings that are not preloaded with
+        bounded memory usage, as only one chunk of data is read from disk at
+        a time.
+
+        Parameters
+        ----------
+        duration : float
+            Duration of each chunk in seconds. The final chunk can be shorter.
+        overlap : float
+            Overlap between consecutive chunks in seconds. Must be smaller
+            than ``duration``. Defaults to 0.
+        %(picks_all)s
+        reject_by_annotation : None | 'omit' | 'NaN'
+            Whether to reject by annotation, see :meth:`get_data`. If
+            ``'omit'``, bad segments are removed from each chunk (so chunks
+            can be shorter than ``duration``), and chunks that are entirely bad
+            are not yielded.
+        return_times : bool
+            Whether to yield the times of the samples in each chunk as well.
+            Defaults to False.
+        tmin : float | None
+            Start time of the first chunk in seconds. None (default) means
+            the start of the data.
+        tmax : float | None
+            End time of the data to iterate over in seconds. None (default)
+            means the end of the data.
+
+        Yields
+        ------
+        data : ndarray, shape (n_channels, n_times)
+            The data of the chunk.
+        times : ndarray, shape (n_times,)
+            Times of the samples in the chunk, with the same reference as
+            :attr:`times`. Only yielded if ``return_times=True``.
+
+        See Also
+        --------
+        get_data
+
+        Notes
+        -----
+        Setting the ``MNE_READ_PREFETCH`` configuration value to ``'true'``
+        (see :func:`mne.set_config`) reads the next chunk in a background
+        thread while the current one is being processed. The setting is looked
+        up when data are first read from the instance.
+
+        .. versionadded:: 1.13
+        """
+        _validate_type(duration, "numeric", "duration")
+        _validate_type(overlap, "numeric", "overlap")
+        sfreq = self.info["sfreq"]
+        n_samples = int(round(duration * sfreq))
+        n_overlap = int(round(overlap * sfreq))
+        if n_samples < 1:
+            raise ValueError(
+                f"duration must correspond to at least one sample, got {duration}"
+            )
+        if not 0 <= n_overlap < n_samples:
+            raise ValueError(
+                "overlap must be non-negative and smaller than duration, got "
+                f"{overlap} (duration {duration})"
+            )
+        picks = _picks_to_idx(self.info, picks, "all", exclude=())
+        first, last = self._handle_tmin_tmax(tmin, tmax)
+        first, last = max(first, 0), min(last, self.n_times)
+        step = n_samples - n_overlap
+        for start in range(first, max(last - n_overlap, first + 1), step):
+            out = self.get_data(
+                picks,
+                start,
+                min(start + n_samples, last),
+                reject_by_annotation=reject_by_annotation,
+                return_times=True,
+            )
+            if out[0].shape[1] == 0:
+                continue  # all omitted
+            yield out if return_times else out[0]
+
     @verbose
     def apply_function(
         self,
@@ -1158,7 +1284,7 @@ class BaseRaw(
         return self
 
     # Need a separate method because the default pad is different for raw
-    @copy_doc(FilterMixin.filter)
+    @verbose
     def filter(
         self,
         l_freq,
@@ -1175,15 +1301,72 @@ class BaseRaw(
         fir_design="firwin",
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
+        *,
+        out_fname=None,
+        overwrite=False,
         verbose=None,
     ):
-        return super().filter(
-            l_freq,
-            h_freq,
-            picks,
-            filter_length,
-            l_trans_bandwidth,
-            h_trans_bandwidth,
+        """Filter a subset of channels.
+
+        Parameters
+        ----------
+        %(l_freq)s
+        %(h_freq)s
+        %(picks_all_data)s
+        %(filter_length)s
+        %(l_trans_bandwidth)s
+        %(h_trans_bandwidth)s
+        %(n_jobs_fir)s
+        %(method_fir)s
+        %(iir_params)s
+        %(phase)s
+        %(fir_window)s
+        %(fir_design)s
+        %(skip_by_annotation)s
+
+            .. versionadded:: 0.16.
+        %(pad_fir)s
+        %(out_fname_raw)s
+        %(verbose)s
+
+        Returns
+        -------
+        raw : instance of Raw
+            The filtered data, or a new instance reading the filtered data
+            from ``out_fname``.
+
+        See Also
+        --------
+        mne.filter.create_filter
+        mne.io.Raw.notch_filter
+        mne.io.Raw.resample
+        mne.filter.filter_data
+        mne.filter.construct_iir_filter
+
+        Notes
+        -----
+        Applies a zero-phase low-pass, high-pass, band-pass, or band-stop
+        filter to the channels selected by ``picks``.
+        Unless ``out_fname`` is given, the data are modified inplace and have
+        to be loaded, e.g. with ``preload=True`` or ``self.load_data()``.
+
+        With ``out_fname`` (only supported for ``method='fir'``), each chunk
+        of data is filtered together with (at least) one filter length of
+        neighboring samples, so the result matches filtering the data in
+        memory and then saving them with :meth:`mne.io.Raw.save` (with the
+        default ``fmt='single'``).
+
+        %(notes_filter)s
+
+        .. versionadded:: 0.15
+        """
+        kwargs = dict(
+            l_freq=l_freq,
+            h_freq=h_freq,
+            picks=picks,
+            filter_length=filter_length,
+            l_trans_bandwidth=l_trans_bandwidth,
+            h_trans_bandwidth=h_trans_bandwidth,
             n_jobs=n_jobs,
             method=method,
             iir_params=iir_params,
@@ -1192,8 +1375,12 @@ class BaseRaw(
             fir_design=fir_design,
             skip_by_annotation=skip_by_annotation,
             pad=pad,
-            verbose=verbose,
         )
+        if out_fname is not None:
+            from ._chunked import _filter_raw_to_file
+
+            return _filter_raw_to_file(self, out_fname, overwrite, **kwargs)
+        return super().filter(**kwargs)
 
     @verbose
     def notch_filter(
@@ -1213,6 +1400,9 @@ class BaseRaw(
         fir_design="firwin",
         pad="reflect_limited",
         skip_by_annotation=("edge", "bad_acq_skip"),
+        *,
+        out_fname=None,
+        overwrite=False,
         verbose=None,
     ):
         """Notch filter a subset of channels.
@@ -1252,12 +1442,14 @@ class BaseRaw(
 
             .. versionadded:: 0.15
         %(skip_by_annotation)s
+        %(out_fname_raw)s
         %(verbose)s
 
         Returns
         -------
         raw : instance of Raw
-            The raw instance with filtered data.
+            The raw instance with filtered data, or a new instance reading the
+            filtered data from ``out_fname``.
 
         See Also
         --------
@@ -1267,10 +1459,16 @@ class BaseRaw(
         Notes
         -----
         Applies a zero-phase notch filter to the channels selected by
-        "picks". By default the data of the Raw object is modified inplace.
+        "picks". Unless ``out_fname`` is given, the data of the Raw object are
+        modified inplace and have to be loaded, e.g. with ``preload=True`` or
+        ``self.load_data()``.
 
-        The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        With ``out_fname`` (only supported for ``method='fir'`` and
+        ``method='spectrum_fit'``), each chunk of data is filtered together
+        with (at least) one filter length (or, for ``'spectrum_fit'``, the
+        overlapping windows) of neighboring samples, so the result matches
+        filtering the data in memory and then saving them with
+        :meth:`mne.io.Raw.save` (with the default ``fmt='single'``).
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
@@ -1278,6 +1476,29 @@ class BaseRaw(
 
         For details, see :func:`mne.filter.notch_filter`.
         """
+        if out_fname is not None:
+            from ._chunked import _notch_raw_to_file
+
+            return _notch_raw_to_file(
+                self,
+                out_fname,
+                overwrite,
+                freqs=freqs,
+                picks=picks,
+                filter_length=filter_length,
+                notch_widths=notch_widths,
+                trans_bandwidth=trans_bandwidth,
+                n_jobs=n_jobs,
+                method=method,
+                iir_params=iir_params,
+                mt_bandwidth=mt_bandwidth,
+                p_value=p_value,
+                phase=phase,
+                fir_window=fir_window,
+                fir_design=fir_design,
+                pad=pad,
+                skip_by_annotation=skip_by_annotation,
+            )
         fs = float(self.info["sfreq"])
         picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
         _check_preload(self, "raw.notch_filter")
@@ -1319,6 +1540,8 @@ class BaseRaw(
         events=None,
         pad="auto",
         method="fft",
+        out_fname=None,
+        overwrite=False,
         verbose=None,
     ):
         """Resample all channels.
@@ -1366,12 +1589,14 @@ class BaseRaw(
         %(method_resample)s
 
             .. versionadded:: 1.7
+        %(out_fname_raw)s
         %(verbose)s
 
         Returns
         -------
         raw : instance of Raw
-            The resampled version of the raw object.
+            The resampled version of the raw object, or a new instance reading
+            the resampled data from ``out_fname``.
         events : array, shape (n_events, 3) | None
             If events are jointly resampled, these are returned with the raw.
 
@@ -1389,6 +1614,12 @@ class BaseRaw(
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
         resulting raw object will have the data loaded into memory.
+
+        With ``out_fname`` (only supported for ``method='polyphase'``), the
+        memory requirements instead only depend on the length of the polyphase
+        filter, and the result matches resampling the
+        data in memory and then saving them with :meth:`mne.io.Raw.save`
+        (with the default ``fmt='single'``).
         """
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
@@ -1398,6 +1629,38 @@ class BaseRaw(
             else:
                 return self
 
+        # set up stim channel processing
+        if stim_picks is None:
+            stim_picks = pick_types(
+                self.info, meg=False, ref_meg=False, stim=True, exclude=[]
+            )
+        else:
+            stim_picks = _picks_to_idx(
+                self.info, stim_picks, exclude=(), with_ref_meg=False
+            )
+
+        if out_fname is not None:
+            from ._chunked import _resample_raw_to_file
+
+            raw = _resample_raw_to_file(
+                self,
+                out_fname,
+                overwrite,
+                sfreq=sfreq,
+                window=window,
+                stim_picks=stim_picks,
+                n_jobs=n_jobs,
+                pad=pad,
+                method=method,
+            )
+            if events is None:
+                return raw
+            events = events.copy()
+            events[:, 0] = np.minimum(
+                np.round(events[:, 0] * sfreq / o_sfreq).astype(int), raw.last_samp
+            )
+            return raw, events
+
         # When no event object is supplied, some basic detection of dropped
         # events is performed to generate a warning. Finding events can fail
         # for a variety of reasons, e.g. if no stim channel is present or it is
@@ -1411,16 +1674,6 @@ class BaseRaw(
 
         offsets = np.concatenate(([0], np.cumsum(self._raw_lengths)))
 
-        # set up stim channel processing
-        if stim_picks is None:
-            stim_picks = pick_types(
-                self.info, meg=False, ref_meg=False, stim=True, exclude=[]
-            )
-        else:
-            stim_picks = _picks_to_idx(
-                self.info, stim_picks, exclude=(), with_ref_meg=False
-            )
-
         kwargs = dict(
             up=sfreq,
             down=o_sfreq,
@@ -1460,7 +1713,8 @@ class BaseRaw(
                     )[0]
                     if ci == 0 and ri == 0:
                         new_data = np.empty(
-                            (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
+                            (len(self.ch_names), new_offsets[-1]),
+                            _get_data_dtype(data_chunk.dtype),
                         )
                     if ci in stim_picks:
                         resamp = _resample_stim_channels(
@@ -1769,6 +2023,12 @@ class BaseRaw(
             ``_meg.fif`` (common MEG data), ``_eeg.fif`` (common EEG data),
             or ``_ieeg.fif`` (common intracranial EEG data). You may also
             append an additional ``.gz`` suffix to enable gzip compression.
+            Using ``.h5`` instead of ``.fif`` (e.g., ``raw.h5``) saves the
+            data in chunked and compressed HDF5 format, which requires
+            ``h5io`` and can be read with :func:`mne.io.read_raw_hdf5`.
+
+            .. versionchanged:: 1.13
+               Support for the HDF5 format.
         %(picks_all)s
         %(tmin_raw)s
         %(tmax_raw)s
@@ -1803,7 +2063,9 @@ class BaseRaw(
             also possible to pass a human-readable string, e.g., 100MB.
 
             .. note:: Due to FIFF file limitations, the maximum split
-                      size is 2GB.
+                      size is 2GB. HDF5 files are not split, so
+                      ``split_size`` and ``split_naming`` must be left at
+                      their defaults when saving to ``.h5``.
         %(split_naming)s
 
             .. versionadded:: 0.17
@@ -1836,8 +2098,9 @@ class BaseRaw(
             "_eeg.fif",
             "_ieeg.fif",
         )
-        endings += tuple([f"{e}.gz" for e in endings])
-        endings_err = (".fif", ".fif.gz")
+        endings_h5 = tuple([f"{e[:-4]}.h5" for e in endings])
+        endings += tuple([f"{e}.gz" for e in endings]) + endings_h5
+        endings_err = (".fif", ".fif.gz", ".h5")
 
         # convert to str, check for overwrite a few lines later
         fname = _check_fname(
@@ -1889,6 +2152,24 @@ class BaseRaw(
         start, stop = self._tmin_tmax_to_start_stop(tmin, tmax)
         buffer_size = self._get_buffer_size(buffer_size_sec)
 
+        if fname.suffix == ".h5":
+            from .hdf5.hdf5 import _check_hdf5_split, _write_raw_hdf5
+
+            _check_hdf5_split(split_size, split_naming)
+            _check_option("fmt", fmt, ("short", "int", "single", "double"))
+            return _write_raw_hdf5(
+                self,
+                fname,
+                info,
+                picks,
+                projector,
+                start,
+                stop,
+                buffer_size,
+                fmt,
+                overwrite,
+            )
+
         # write the raw file
         _validate_type(split_naming, str, "split_naming")
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
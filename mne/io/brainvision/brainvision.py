@@ -15,7 +15,12 @@ import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import _empty_info
-from ..._fiff.utils import _mult_cal_one, _read_segments_file
+from ..._fiff.utils import (
+    _flat_memmap,
+    _mult_cal_memmap,
+    _mult_cal_one,
+    _read_segments_file,
+)
 from ...annotations import Annotations, read_annotations
 from ...channels import make_dig_montage
 from ...defaults import HEAD_SIZE_DEFAULT
@@ -230,6 +235,13 @@ def _read_segments_c(raw, data, idx, fi, start, stop, cals, mult):
     dtype = _fmt_dtype_dict[fmt]
     n_bytes = _fmt_byte_dict[fmt]
     n_channels = raw._raw_extras[fi]["orig_nchan"]
+    mm = _flat_memmap(raw.filenames[fi])
+    if mm is not None and n_channels * n_samples * n_bytes <= mm.size:
+        # only the requested channels (and samples) are read from disk
+        view = np.ndarray((n_channels, n_samples), dtype=dtype, buffer=mm)
+        _mult_cal_memmap(data, view[:, start:stop], idx, cals, mult)
+        return
+    del mm
     block = np.zeros((n_channels, stop - start))
     with open(raw.filenames[fi], "rb", buffering=0) as fid:
         ids = np.arange(idx.start, idx.stop) if isinstance(idx, slice) else idx
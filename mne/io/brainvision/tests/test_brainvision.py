@@ -607,6 +607,25 @@ def test_brainvision_vectorized_data():
     assert_allclose(raw._data[:, :2], first_two_samples_all_chs)
 
 
+@pytest.mark.parametrize("fname", [vhdr_path, vhdr_old_path])
+def test_brainvision_memmap(fname, monkeypatch):
+    """Test that memory-mapped reads match regular ones."""
+    with _record_warnings():
+        raw = read_raw_brainvision(fname)
+    raw.set_eeg_reference(projection=True)
+    raw_proj = raw.copy().apply_proj()
+    picks = [3, 0, 7]
+    want = [raw.get_data(picks, 10, 200), raw.get_data(), raw_proj.get_data()]
+    monkeypatch.setattr(
+        "mne.io.brainvision.brainvision._flat_memmap", lambda fname: None
+    )
+    monkeypatch.setattr("mne._fiff.utils._flat_memmap", lambda fname: None)
+    got = [raw.get_data(picks, 10, 200), raw.get_data(), raw_proj.get_data()]
+    assert_array_equal(want[0], got[0])
+    assert_array_equal(want[1], got[1])
+    assert_allclose(want[2], got[2], rtol=1e-12, atol=1e-20)
+
+
 def test_coodinates_extraction():
     """Test reading of [Coordinates] section if present."""
     # vhdr 2 has a Coordinates section
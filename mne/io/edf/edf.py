@@ -18,7 +18,7 @@ from ..._fiff.meas_info import _empty_info, _unique_channel_names
 from ..._fiff.utils import _blk_read_lims, _mult_cal_one
 from ...annotations import Annotations
 from ...filter import resample
-from ...fixes import read_from_file_or_buffer
+from ...fixes import _reshape_view, read_from_file_or_buffer
 from ...utils import (
     _check_fname,
     _file_like,
@@ -594,10 +594,7 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     # BDF
     if subtype == "bdf":
         ch_data = read_from_file_or_buffer(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        ch_data = _decode_int24(ch_data.reshape(-1, 3))
 
     # GDF data and EDF data
     else:
@@ -606,6 +603,26 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     return ch_data
 
 
+def _decode_int24(ch_bytes):
+    """Decode little-endian 24-bit integers from an array of shape (..., 3)."""
+    # sign-extend via the most significant byte, then add the lower two
+    ch_data = ch_bytes[..., 2].astype(np.int8).astype(INT32)
+    ch_data <<= 16
+    ch_data |= ch_bytes[..., 1].astype(INT32) << 8
+    ch_data |= ch_bytes[..., 0]
+    return ch_data
+
+
+def _get_decode_span(data_sel, tal_idx, n_samps, buf_len):
+    """Get the span of channels to decode all at once, or None if not possible."""
+    if not len(data_sel):
+        return None
+    span = np.arange(data_sel.min(), data_sel.max() + 1)
+    if np.isin(span, tal_idx).any() or (n_samps[span] != buf_len).any():
+        return None
+    return span
+
+
 def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals, mult):
     """Read a chunk of raw data."""
     n_samps = raw_extras["n_samps"]
@@ -628,6 +645,15 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     # actually one of the requested channels
     idx_arr = np.arange(idx.start, idx.stop) if isinstance(idx, slice) else idx
 
+    # If the requested channels (and all channels in between) have one sample
+    # per sample of the output (the common case), all channels of many blocks
+    # can be decoded at once
+    data_sel = read_sel[: len(idx_arr)]
+    span = _get_decode_span(data_sel, tal_idx, n_samps, buf_len)
+    vectorized = span is not None
+    if vectorized:
+        read_sel = read_sel[len(idx_arr) :]  # only the TAL channels remain
+
     # We could read this one EDF block at a time, which would be this:
     ch_offsets = np.cumsum(np.concatenate([[0], n_samps]), dtype=np.int64)
     block_start_idx, r_lims, _ = _blk_read_lims(start, stop, buf_len)
@@ -640,24 +666,82 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
         # Extract data
         start_offset = data_offset + block_start_idx * ch_offsets[-1] * dtype_byte
 
-        # first read everything into the `ones` array. For channels with
-        # lower sampling frequency, there will be zeros left at the end of the
-        # row. Ignore TAL/annotations channel and only store `orig_sel`
-        ones = np.zeros((len(orig_sel), data.shape[-1]), dtype=data.dtype)
-        # save how many samples have already been read per channel
-        n_smp_read = [0 for _ in range(len(orig_sel))]
+        if vectorized:
+            sel_span = slice(ch_offsets[span[0]], ch_offsets[span[-1] + 1])
+            span_idx = data_sel - span[0]
+            all_in_span = np.array_equal(span_idx, np.arange(len(span)))
+            scale = np.array(cal)[idx_arr, np.newaxis, np.newaxis]
+            shift = np.array(offsets)[idx_arr, np.newaxis, np.newaxis]
+            gain = np.array(gains)[idx_arr, np.newaxis, np.newaxis]
+            is_stim = np.isin(idx_arr, stim_channel_idxs)
+            if mult is None:  # also apply the calibrations
+                stim_cals = cals[is_stim, :, np.newaxis]
+                gain[~is_stim] *= cals[~is_stim, :, np.newaxis]
+            # without projection, decode directly into the output
+            ones = data
+            if mult is not None:
+                ones = np.empty((len(idx_arr), data.shape[1]), data.dtype)
+            n_smp_read = 0
+        else:
+            # first read everything into the `ones` array. For channels with
+            # lower sampling frequency, there will be zeros left at the end of
+            # the row. Ignore TAL/annotations channel and only store `orig_sel`
+            ones = np.zeros((len(orig_sel), data.shape[-1]), dtype=data.dtype)
+            # save how many samples have already been read per channel
+            n_smp_read = [0 for _ in range(len(orig_sel))]
 
         # read data in chunks
         for ai in range(0, len(r_lims), n_per):
             block_offset = ai * ch_offsets[-1] * dtype_byte
             n_read = min(len(r_lims) - ai, n_per)
             fid.seek(start_offset + block_offset, 0)
-            # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...)
-            many_chunk = _read_ch(
-                fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
-            ).reshape(n_read, -1)
             r_sidx = r_lims[ai][0]
             r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
+            if vectorized:
+                # Read as (n_chunks_read, ch0_ch1_ch2_ch3...) without decoding
+                count = ch_offsets[-1] * n_read
+                count *= dtype_byte if subtype == "bdf" else 1
+                many_chunk = read_from_file_or_buffer(fid, dtype=dtype, count=count)
+                many_chunk = many_chunk.reshape(n_read, -1)
+                if subtype == "bdf":
+                    ch_data = many_chunk[:, sel_span.start * 3 : sel_span.stop * 3]
+                    ch_data = ch_data.reshape(n_read, len(span), buf_len, 3)
+                    if not all_in_span:
+                        ch_data = ch_data[:, span_idx]
+                    ch_data = _decode_int24(ch_data)
+                else:
+                    ch_data = many_chunk[:, sel_span]
+                    ch_data = ch_data.reshape(n_read, len(span), buf_len)
+                    if not all_in_span:
+                        ch_data = ch_data[:, span_idx]
+                # (n_chunks_read, n_sel, buf_len) -> (n_sel, n_chunks_read, buf_len)
+                ch_data = ch_data.transpose(1, 0, 2)
+                n_smp = r_eidx - r_sidx
+                this_ones = ones[:, n_smp_read : n_smp_read + n_smp]
+                if n_smp == n_read * buf_len:  # whole blocks, write in place
+                    out = _reshape_view(this_ones, ch_data.shape)
+                else:
+                    out = np.empty(ch_data.shape, ones.dtype)
+                np.multiply(ch_data, scale, out=out)
+                out += shift
+                out *= gain
+                if is_stim.any():
+                    out[is_stim] = np.bitwise_and(out[is_stim].astype(int), 2**17 - 1)
+                    if mult is None:
+                        out[is_stim] *= stim_cals
+                if n_smp != n_read * buf_len:
+                    this_ones[:] = out.reshape(len(idx_arr), -1)[:, r_sidx:r_eidx]
+                n_smp_read += n_smp
+                if len(read_sel) == 0:
+                    continue
+                if subtype == "bdf":  # TAL is not used for BDF, but be safe
+                    many_chunk = _decode_int24(many_chunk.reshape(-1, 3))
+                    many_chunk = many_chunk.reshape(n_read, -1)
+            else:
+                # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...)
+                many_chunk = _read_ch(
+                    fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
+                ).reshape(n_read, -1)
 
             # loop over selected channels, ci=channel selection
             for ii, ci in enumerate(read_sel):
@@ -693,9 +777,13 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
                 ones[orig_idx, smp_read : smp_read + len(one_i)] = one_i
                 n_smp_read[orig_idx] += len(one_i)
 
+        if vectorized:
+            assert n_smp_read == data.shape[-1]
+            if mult is not None:
+                _mult_cal_one(data, ones, slice(None), None, mult)
         # resample channels with lower sample frequency
         # skip if no data was requested, ie. only annotations were read
-        if any(n_smp_read) > 0:
+        elif any(n_smp_read) > 0:
             # expected number of samples, equals maximum sfreq
             smp_exp = data.shape[-1]
 
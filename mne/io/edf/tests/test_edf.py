@@ -24,6 +24,7 @@ from mne.annotations import _ndarray_ch_names, events_from_annotations, read_ann
 from mne.datasets import testing
 from mne.io import edf, read_raw_bdf, read_raw_edf, read_raw_fif, read_raw_gdf
 from mne.io.edf.edf import (
+    _decode_int24,
     _edf_str,
     _parse_prefilter_string,
     _prefilter_float,
@@ -192,6 +193,94 @@ def test_bdf_data():
     assert (raw_py.info["chs"][63]["loc"]).any()
 
 
+def _decode_int24_legacy(ch_bytes):
+    """Decode 24-bit integers as the per-channel reader used to."""
+    ch_data = ch_bytes.reshape(-1, 3).astype(np.int32)
+    ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
+    ch_data[ch_data >= (1 << 23)] -= 1 << 24
+    return ch_data
+
+
+def _write_bdf(fname, data, sfreq, n_per_record):
+    """Write 24-bit integer data (the last channel being Status) to a BDF file."""
+    n_chan, n_times = data.shape
+    n_records = n_times // n_per_record
+
+    def _field(val, n):
+        return str(val).ljust(n)[:n].encode("ascii")
+
+    header = b"\xffBIOSEMI" + _field("X X X X", 80) + _field("Startdate", 80)
+    header += _field("01.01.01", 8) + _field("00.00.00", 8)
+    header += _field(256 * (n_chan + 1), 8) + _field("24BIT", 44)
+    header += _field(n_records, 8) + _field(n_per_record / sfreq, 8)
+    header += _field(n_chan, 4)
+    names = [f"EEG{ii}" for ii in range(n_chan - 1)] + ["Status"]
+    for key, n in [
+        (names, 16),
+        ("", 80),
+        (["uV"] * (n_chan - 1) + ["Boolean"], 8),
+        (-262144, 8),
+        (262143, 8),
+        (-(2**23), 8),
+        (2**23 - 1, 8),
+        ("", 80),
+        (n_per_record, 8),
+        ("", 32),
+    ]:
+        for ci in range(n_chan):
+            header += _field(key[ci] if isinstance(key, list) else key, n)
+    data = data.astype("<i4").view(np.uint8).reshape(n_chan, n_times, 4)[..., :3]
+    data = data.reshape(n_chan, n_records, n_per_record * 3).transpose(1, 0, 2)
+    with open(fname, "wb") as fid:
+        fid.write(header)
+        fid.write(data.tobytes())
+
+
+@pytest.mark.parametrize("fname", [edf_path, bdf_path, "synthetic.bdf"])
+def test_read_blocks_picks(fname, tmp_path, monkeypatch):
+    """Test reading blocks of all or some channels at once."""
+    if fname == "synthetic.bdf":  # several records, and all 24-bit values
+        rng = np.random.default_rng(0)
+        data = rng.integers(-(2**23), 2**23, (6, 700), dtype=np.int32)
+        data[:, :2] = [-(2**23), 2**23 - 1]
+        fname = tmp_path / fname
+        _write_bdf(fname, data, 100.0, 70)
+    reader = read_raw_bdf if fname.suffix == ".bdf" else read_raw_edf
+    raw = reader(fname)
+    n_times = raw.n_times
+    n_per_record = raw._raw_extras[0]["n_samps"].max()
+    reads = [
+        (None, 0, None),
+        ([5, 1, 2], 17, n_times - 13),  # not a contiguous span of channels
+        ([len(raw.ch_names) - 1], 1, 2),
+        (np.arange(3, 5), n_times // 3, n_times // 2),
+        # partial first and last records
+        ([0, 2], n_per_record // 2, n_times - n_per_record // 3),
+    ]
+    if n_times > 3 * n_per_record:
+        reads.append((None, n_per_record + 3, 3 * n_per_record - 5))
+
+    def _read_all(raw):
+        return [raw.get_data(picks, start, stop) for picks, start, stop in reads]
+
+    # the previous per-channel reader and 24-bit decoding
+    with monkeypatch.context() as m:
+        m.setattr(edf.edf, "_get_decode_span", lambda *args: None)
+        m.setattr(edf.edf, "_decode_int24", _decode_int24_legacy)
+        wants = _read_all(reader(fname))
+        want = reader(fname, preload=True).get_data()
+    for got, this_want in zip(_read_all(raw), wants):
+        assert_array_equal(got, this_want)
+    assert_array_equal(reader(fname, preload=True).get_data(), want)
+    # 24-bit decoding
+    rng = np.random.default_rng(0)
+    vals = rng.integers(-(2**23), 2**23, 1000, dtype=np.int32)
+    vals[:2] = [-(2**23), 2**23 - 1]
+    ch_bytes = vals.view(np.uint8).reshape(-1, 4)[:, :3]
+    assert_array_equal(_decode_int24(ch_bytes), vals)
+    assert_array_equal(_decode_int24_legacy(ch_bytes), vals)
+
+
 @testing.requires_testing_data
 def test_bdf_crop_save_stim_channel(tmp_path):
     """Test EDF with various sampling rates."""
@@ -10,7 +10,12 @@ import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
-from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
+from ..._fiff.open import (
+    _fiff_cache_dir_scope,
+    _fiff_get_fid,
+    _get_next_fname,
+    fiff_open,
+)
 from ..._fiff.tag import _call_dict, read_tag
 from ..._fiff.tree import dir_tree_find
 from ..._fiff.utils import _mult_cal_one
@@ -100,24 +105,25 @@ class Raw(BaseRaw):
         raws = []
         do_check_ext = not _file_like(fname)
         next_fname = fname
-        while next_fname is not None:
-            raw, next_fname, buffer_size_sec = self._read_raw_file(
-                next_fname, allow_maxshield, preload, do_check_ext
-            )
-            do_check_ext = False
-            raws.append(raw)
-            if next_fname is not None:
-                if not op.exists(next_fname):
-                    msg = (
-                        f"Split raw file detected but next file {next_fname} "
-                        "does not exist. Ensure all files were transferred "
-                        "properly and that split and original files were not "
-                        "manually renamed on disk (split files should be "
-                        "renamed by loading and re-saving with MNE-Python to "
-                        "preserve proper filename linkage)."
-                    )
-                    _on_missing(on_split_missing, msg, name="on_split_missing")
-                    break
+        with _fiff_cache_dir_scope():
+            while next_fname is not None:
+                raw, next_fname, buffer_size_sec = self._read_raw_file(
+                    next_fname, allow_maxshield, preload, do_check_ext
+                )
+                do_check_ext = False
+                raws.append(raw)
+                if next_fname is not None:
+                    if not op.exists(next_fname):
+                        msg = (
+                            f"Split raw file detected but next file {next_fname} "
+                            "does not exist. Ensure all files were transferred "
+                            "properly and that split and original files were not "
+                            "manually renamed on disk (split files should be "
+                            "renamed by loading and re-saving with MNE-Python to "
+                            "preserve proper filename linkage)."
+                        )
+                        _on_missing(on_split_missing, msg, name="on_split_missing")
+                        break
         # If using a file-like object, we need to be careful about serialization and
         # types.
         #
@@ -312,6 +318,8 @@ class Raw(BaseRaw):
                                 first=first_samp,
                                 nsamp=nskip * nsamp,
                                 last=first_samp + nskip * nsamp - 1,
+                                pos=-1,
+                                type=0,
                             )
                         )
                         first_samp += nskip * nsamp
@@ -324,6 +332,9 @@ class Raw(BaseRaw):
                             first=first_samp,
                             last=first_samp + nsamp - 1,
                             nsamp=nsamp,
+                            # position of the data (past the tag header)
+                            pos=ent.pos + 16,
+                            type=ent.type,
                         )
                     )
                     first_samp += nsamp
@@ -338,7 +349,7 @@ class Raw(BaseRaw):
         raw_extras = {key: [r[key] for r in raw_extras] for key in raw_extras[0]}
         for key in raw_extras:
             if key != "ent":  # dict or None
-                raw_extras[key] = np.array(raw_extras[key], int)
+                raw_extras[key] = np.array(raw_extras[key], np.int64)
         if not np.array_equal(raw_extras["last"][:-1], raw_extras["first"][1:] - 1):
             raise RuntimeError("FIF file appears to be broken")
         bounds = np.cumsum(
@@ -399,14 +410,23 @@ class Raw(BaseRaw):
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
+        extra = self._raw_extras[fi]
+        bounds = extra["bounds"]
+        use = np.where((stop > bounds[:-1]) & (start < bounds[1:]))[0]
+        # Fast path: decode all buffers through a memory map of the file
+        if "pos" in extra:
+            mm = _fiff_memmap(extra["filename"])
+            if mm is not None and _read_buffers_memmap(
+                mm, extra, use, data, idx, start, stop, cals, mult
+            ):
+                return
+            del mm
         n_bad = 0
-        with _fiff_get_fid(self._raw_extras[fi]["filename"]) as fid:
-            bounds = self._raw_extras[fi]["bounds"]
-            ents = self._raw_extras[fi]["ent"]
-            nchan = self._raw_extras[fi]["orig_nchan"]
-            use = (stop > bounds[:-1]) & (start < bounds[1:])
+        with _fiff_get_fid(extra["filename"]) as fid:
+            ents = extra["ent"]
+            nchan = extra["orig_nchan"]
             offset = 0
-            for ei in np.where(use)[0]:
+            for ei in use:
                 first = bounds[ei]
                 last = bounds[ei + 1]
                 nsamp = last - first
@@ -490,6 +510,144 @@ class Raw(BaseRaw):
         return self._acqparser
 
 
+# On-disk dtypes of the data buffers we can read
+_buffer_dtype_dict = {
+    FIFF.FIFFT_DAU_PACK16: ">i2",
+    FIFF.FIFFT_SHORT: ">i2",
+    FIFF.FIFFT_FLOAT: ">f4",
+    FIFF.FIFFT_DOUBLE: ">f8",
+    FIFF.FIFFT_INT: ">i4",
+    FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+    FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+}
+
+
+def _fiff_memmap(fname):
+    """Memory-map a FIF file for reading, returning None if not possible."""
+    if not isinstance(fname, Path) or fname.suffixes[-1:] == [".gz"]:
+        return None  # file-like or compressed
+    try:
+        return np.memmap(fname, dtype=np.uint8, mode="r")
+    except (OSError, ValueError):  # e.g., empty file or no mmap support
+        return None
+
+
+def _buffer_runs(use, pos, types, bounds):
+    """Group consecutive buffers that can be decoded with a single strided view."""
+    runs = list()
+    for ei in use.tolist():
+        nsamp = int(bounds[ei + 1] - bounds[ei])
+        if pos[ei] < 0:  # skip, nothing to read
+            runs.append([ei, ei, None, 0])
+            continue
+        if runs:
+            last = runs[-1]
+            first_ei, last_ei, stride = last[0], last[1], last[3]
+            if (
+                last[2] is not None
+                and last_ei == ei - 1
+                and types[ei] == types[first_ei]
+                and nsamp == bounds[first_ei + 1] - bounds[first_ei]
+                and pos[ei] > pos[last_ei]
+                and (stride == 0 or pos[ei] - pos[last_ei] == stride)
+            ):
+                last[1] = ei
+                last[3] = int(pos[ei] - pos[last_ei])
+                continue
+        runs.append([ei, ei, _buffer_dtype_dict.get(int(types[ei])), 0])
+    return runs
+
+
+def _read_buffers_memmap(mm, extra, use, data, idx, start, stop, cals, mult):
+    """Read data buffers from a memory-mapped FIF file.
+
+    Runs of buffers with the same type, number of samples, and spacing in the
+    file are exposed as a single 3D strided view of shape
+    ``(n_buffers, n_samp, n_chan)``, so the requested channels and samples for
+    all of them are decoded in one step instead of one tag at a time.
+
+    Returns False (without having modified ``data``) if the file cannot be
+    read this way, e.g. because it is truncated.
+    """
+    bounds, pos, types = extra["bounds"], extra["pos"], extra["type"]
+    nchan = extra["orig_nchan"]
+    runs = _buffer_runs(use, pos, types, bounds)
+    # Validate before reading anything so that the fallback starts cleanly
+    for first_ei, last_ei, dtype, _ in runs:
+        if dtype is None:
+            if pos[first_ei] >= 0:
+                return False  # unknown type
+            continue
+        nbytes = int(bounds[first_ei + 1] - bounds[first_ei]) * nchan
+        nbytes *= np.dtype(dtype).itemsize
+        if pos[last_ei] + nbytes > mm.size:
+            return False  # truncated file
+    for first_ei, last_ei, dtype, stride in runs:
+        first, last = bounds[first_ei], bounds[last_ei + 1]
+        this_start = max(start, first) - start
+        this_stop = min(stop, last) - start
+        if dtype is None:
+            continue  # just use zeros for gaps
+        dtype = np.dtype(dtype)
+        nsamp = int(bounds[first_ei + 1] - first)
+        row = nchan * dtype.itemsize
+        n_buf = last_ei - first_ei + 1
+        view = np.ndarray(
+            (n_buf, nsamp, nchan),
+            dtype=dtype,
+            buffer=mm,
+            offset=int(pos[first_ei]),
+            strides=(stride if stride else nsamp * row, row, dtype.itemsize),
+        )
+        _decode_buffers(
+            view,
+            data[:, this_start:this_stop],
+            this_start + start - first,
+            this_stop + start - first,
+            idx,
+            cals,
+            mult,
+        )
+    return True
+
+
+def _decode_buffers(view, data, samp_start, samp_stop, idx, cals, mult):
+    """Decode samples from a (n_buffers, n_samp, n_chan) view into data."""
+    nsamp = view.shape[1]
+    buf_start, rem_start = divmod(samp_start, nsamp)
+    buf_stop, rem_stop = divmod(samp_stop, nsamp)
+    if mult is not None:
+        # need all channels at once for the matrix product
+        one = view[buf_start : buf_stop + bool(rem_stop)][..., idx]
+        one = one.reshape(-1, one.shape[-1])[rem_start : rem_start + data.shape[1]]
+        _mult_cal_one(data, one.T, slice(None), cals, mult)
+        return
+    # Otherwise cast directly from the file dtype into the output, which
+    # avoids intermediate copies; partial first and last buffers are handled
+    # separately from the full ones in between.
+    col = 0
+    if rem_start:
+        n_first = (nsamp if buf_stop > buf_start else rem_stop) - rem_start
+        data[:, :n_first] = view[buf_start, rem_start : rem_start + n_first][:, idx].T
+        col += n_first
+        buf_start += 1
+    if buf_stop > buf_start:
+        n_full = (buf_stop - buf_start) * nsamp
+        try:
+            out = _reshape_view(
+                data[:, col : col + n_full], (len(data), buf_stop - buf_start, nsamp)
+            )
+        except (AttributeError, ValueError):  # unusual memory layout
+            one = view[buf_start:buf_stop][..., idx].reshape(-1, len(data))
+            data[:, col : col + n_full] = one.T
+        else:
+            out[:] = view[buf_start:buf_stop][..., idx].transpose(2, 0, 1)
+        col += n_full
+    if col < data.shape[1]:
+        data[:, col:] = view[buf_stop, : data.shape[1] - col][:, idx].T
+    data *= cals
+
+
 def _check_entry(first, nent):
     """Sanity check entries."""
     if first >= nent:
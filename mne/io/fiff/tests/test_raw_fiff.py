@@ -2138,6 +2138,96 @@ def test_bad_acq(fname):
             assert tag == ent
 
 
+@pytest.mark.parametrize("fmt", ("short", "int", "single", "double"))
+def test_read_buffers_memmap(tmp_path, fmt, monkeypatch):
+    """Test that memory-mapped buffer reads match tag-by-tag reads."""
+    rng = np.random.default_rng(0)
+    info = create_info(
+        ["MEG 001", "MEG 002", "EEG 001", "STI 014"],
+        100.0,
+        ["mag", "grad", "eeg", "stim"],
+    )
+    data = rng.standard_normal((4, 1234)) * [[1e-13], [1e-12], [1e-5], [1]]
+    raw = RawArray(data, info)
+    raw.add_proj(compute_proj_raw(raw, n_grad=0, n_mag=0, n_eeg=1))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.33)
+    raw = concatenate_raws([read_raw_fif(fname), read_raw_fif(fname)])
+    for extra in raw._raw_extras:
+        assert_array_equal(extra["pos"], [ent.pos + 16 for ent in extra["ent"]])
+    raw_proj = raw.copy().apply_proj()  # uses the compensation/projection path
+    windows = [(0, 1), (0, 33), (10, 20), (30, 70), (33, 99), (5, 1234)]
+    windows += [(1200, 1300), (0, raw.n_times)]
+    picks = ([0, 2], [2, 0, 3], None)
+
+    def _get_all():
+        return [
+            inst.get_data(pick, start, stop)
+            for inst in (raw, raw_proj)
+            for start, stop in windows
+            for pick in picks
+        ]
+
+    got = _get_all()
+    monkeypatch.setattr("mne.io.fiff.raw._fiff_memmap", lambda fname: None)
+    want = _get_all()
+    for this_got, this_want in zip(got, want):
+        assert_array_equal(this_got, this_want)
+    assert_array_equal(got[-1][:, :1234], raw_proj.load_data()._data[:, :1234])
+
+    # truncated files fall back to reading tags (and warn about missing data)
+    monkeypatch.undo()
+    truncated = tmp_path / "truncated_raw.fif"
+    with open(fname, "rb") as fid:
+        truncated.write_bytes(fid.read(raw._raw_extras[0]["pos"][-1] + 4))
+    with _record_warnings():
+        raw_trunc = read_raw_fif(truncated)
+    assert_array_equal(raw_trunc.get_data(stop=33), raw.get_data(stop=33))
+
+
+@pytest.mark.parametrize("n_jobs", (1, 3))
+def test_read_split_concurrent(tmp_path, monkeypatch, n_jobs):
+    """Test concurrent and prefetching reads from multiple files."""
+    from mne.io._read_scheduler import _read_stats
+
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((5, 100000))
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, create_info(5, 1000.0, "eeg")).save(
+        fname, split_size="2MB", fmt="double"
+    )
+    raw = concatenate_raws([read_raw_fif(fname), read_raw_fif(fname)])
+    assert len(raw.filenames) > 4
+    want = np.concatenate([data, data], axis=1)
+    monkeypatch.setenv("MNE_READ_N_JOBS", str(n_jobs))
+    monkeypatch.setenv("MNE_READ_PREFETCH", "true")
+    with catch_logging(verbose="debug") as log:
+        assert_array_equal(raw.get_data(), want)
+    log = log.getvalue()
+    assert f"from {len(raw.filenames)} file(s) using {n_jobs} thread(s)" in log
+    assert "MB/s" in log
+    # sequential reads get prefetched
+    n_hits = _read_stats["prefetch_hits"]
+    step = 3000
+    for start in range(0, raw.n_times, step):
+        got = raw.get_data([0, 3], start, start + step)
+        assert_array_equal(got, want[[0, 3], start : start + step])
+    assert _read_stats["prefetch_hits"] - n_hits == raw.n_times // step - 1
+    # changing what is read discards the prefetched data
+    raw.get_data(start=0, stop=step)
+    raw.get_data(start=step, stop=2 * step)
+    raw.pick([1, 2])
+    assert_array_equal(
+        raw.get_data(start=2 * step, stop=3 * step), want[1:3, 2 * step : 3 * step]
+    )
+    # the settings are looked up once per instance
+    monkeypatch.setenv("MNE_READ_N_JOBS", "foo")
+    assert_array_equal(raw.get_data([0], stop=10), want[[1], :10])
+    raw = read_raw_fif(fname)
+    with pytest.raises(ValueError, match="must be an integer"):
+        raw.get_data()
+
+
 @testing.requires_testing_data
 @pytest.mark.skipif(
     platform.system() not in ("Linux", "Darwin"), reason="Needs proper symlinking"
@@ -0,0 +1,7 @@
+"""Chunked and compressed HDF5 storage of raw and epochs data."""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+from .hdf5 import read_raw_hdf5
@@ -0,0 +1,481 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ..._fiff.constants import (
+    _ch_coil_type_named,
+    _ch_kind_named,
+    _ch_unit_mul_named,
+    _ch_unit_named,
+    _coord_frame_named,
+)
+from ..._fiff.meas_info import Info, _writing_info_hdf5
+from ..._fiff.pick import _picks_to_idx, pick_info
+from ..._fiff.utils import _mult_cal_one
+from ..._fiff.write import _get_split_size
+from ...annotations import Annotations
+from ...epochs import BaseEpochs, _pack_reject_params
+from ...utils import (
+    _check_fname,
+    _dt_to_stamp,
+    _import_h5io_funcs,
+    _prepare_read_metadata,
+    _prepare_write_metadata,
+    _stamp_to_dt,
+    check_fname,
+    fill_doc,
+    logger,
+    verbose,
+)
+from ..base import BaseRaw
+
+_TITLE = "mnepython"
+_DATA = "data"
+# Target size of the chunks of the data (before compression) in bytes, each
+# chunk is compressed separately and read only if needed
+_CHUNK_BYTES = 1_000_000
+_COMPRESSION = dict(compression="gzip", compression_opts=1, shuffle=True)
+_RAW_ENDINGS = (
+    "raw.h5",
+    "raw_sss.h5",
+    "raw_tsss.h5",
+    "_meg.h5",
+    "_eeg.h5",
+    "_ieeg.h5",
+)
+_EPOCHS_ENDINGS = ("-epo.h5", "_epo.h5")
+_fmt_dtype_dict = dict(short="<i2", int="<i4", single="<f4", double="<f8")
+_fmt_complex_dtype_dict = dict(single="<c8", double="<c16")
+
+
+def _get_dtype(fmt, data):
+    if np.iscomplexobj(data):
+        if fmt not in _fmt_complex_dtype_dict:
+            raise ValueError(
+                'only "single" and "double" supported for writing complex data'
+            )
+        return np.dtype(_fmt_complex_dtype_dict[fmt])
+    return np.dtype(_fmt_dtype_dict[fmt])
+
+
+def _chunk_shape(shape, dtype, n_times):
+    """Get chunks spanning n_times samples of as many channels as reasonable."""
+    n_times = int(np.clip(n_times, 1, max(shape[-1], 1)))
+    n_chan = _CHUNK_BYTES // (n_times * dtype.itemsize)
+    n_chan = int(np.clip(n_chan, 1, max(shape[-2], 1)))
+    return (1,) * (len(shape) - 2) + (n_chan, n_times)
+
+
+def _create_hdf5(fname, state, shape, dtype, n_times, overwrite):
+    """Write the metadata and create the chunked and compressed data set."""
+    _, write_hdf5 = _import_h5io_funcs()
+    import h5py
+
+    with _writing_info_hdf5(state["info"]):
+        write_hdf5(fname, state, overwrite=overwrite, title=_TITLE, slash="replace")
+    fid = h5py.File(fname, "a")
+    chunks = _chunk_shape(shape, dtype, n_times)
+    logger.debug(f"    Writing data of shape {shape} in chunks of shape {chunks}")
+    fid.create_dataset(_DATA, shape=shape, dtype=dtype, chunks=chunks, **_COMPRESSION)
+    return fid
+
+
+def _read_hdf5_state(fname, kind):
+    read_hdf5, _ = _import_h5io_funcs()
+    state = read_hdf5(fname, title=_TITLE, slash="replace")
+    if not isinstance(state, dict) or state.get("kind") != kind:
+        raise ValueError(f"The file {fname} does not contain {kind} data")
+    info = state["info"] = Info(**state["info"])
+    # use named constants like when reading FIF files
+    for ch in info["chs"]:
+        ch["kind"] = _ch_kind_named.get(ch["kind"], ch["kind"])
+        ch["coil_type"] = _ch_coil_type_named.get(ch["coil_type"], ch["coil_type"])
+        ch["unit"] = _ch_unit_named.get(ch["unit"], ch["unit"])
+        ch["unit_mul"] = _ch_unit_mul_named.get(ch["unit_mul"], ch["unit_mul"])
+        ch["coord_frame"] = _coord_frame_named.get(ch["coord_frame"], ch["coord_frame"])
+    return state
+
+
+def _annotations_to_hdf5(annotations):
+    if annotations is None:
+        return None
+    orig_time = annotations.orig_time
+    if orig_time is not None:
+        orig_time = np.array(_dt_to_stamp(orig_time), np.int64)
+    return dict(
+        onset=annotations.onset,
+        duration=annotations.duration,
+        description=[str(d) for d in annotations.description],
+        orig_time=orig_time,
+        ch_names=json.dumps(annotations.ch_names.tolist()),
+        extras=json.dumps(
+            [None if extra is None else extra.data for extra in annotations.extras]
+        ),
+    )
+
+
+def _annotations_from_hdf5(state):
+    if state is None:
+        return None
+    orig_time = state["orig_time"]
+    if orig_time is not None:
+        orig_time = _stamp_to_dt(tuple(int(t) for t in orig_time))
+    return Annotations(
+        onset=state["onset"],
+        duration=state["duration"],
+        description=state["description"],
+        orig_time=orig_time,
+        ch_names=[tuple(ch) for ch in json.loads(state["ch_names"])],
+        extras=json.loads(state["extras"]),
+    )
+
+
+def _check_hdf5_split(split_size, split_naming):
+    """Check that no file splitting was requested, HDF5 files are never split."""
+    if split_size != _get_split_size("2GB") or split_naming != "neuromag":
+        raise ValueError(
+            "split_size and split_naming cannot be changed when saving in HDF5 "
+            "format, which always writes a single file"
+        )
+
+
+def _write_raw_hdf5(
+    raw, fname, info, picks, projector, start, stop, buffer_size, fmt, overwrite
+):
+    """Write raw data in chunks of buffer_size samples to an HDF5 file."""
+    picks = _picks_to_idx(info, picks, "all", ())
+    info = pick_info(info, sel=picks, copy=True)
+    if fmt in ("single", "double"):
+        for ch in info["chs"]:
+            ch["range"] = 1.0
+    cals = np.array([ch["cal"] * ch["range"] for ch in info["chs"]], float)
+    state = dict(
+        kind="raw",
+        info=info,
+        first_samp=int(raw.first_samp + start),
+        buffer_size=int(buffer_size),
+        fmt=fmt,
+        annotations=_annotations_to_hdf5(raw.annotations),
+    )
+    fid = None
+    try:
+        for first in range(start, stop, buffer_size):
+            last = min(first + buffer_size, stop)
+            data, _ = raw[picks, first:last]
+            if projector is not None:
+                data = np.dot(projector, data)
+            if fid is None:
+                dtype = _get_dtype(fmt, data)
+                shape = (len(picks), stop - start)
+                fid = _create_hdf5(fname, state, shape, dtype, buffer_size, overwrite)
+            logger.debug(f"Writing HDF5 {first:6d} ... {last:6d} ...")
+            data /= cals[:, np.newaxis]
+            fid[_DATA][:, first - start : last - start] = data.astype(dtype)
+    finally:
+        if fid is not None:
+            fid.close()
+    return [Path(fname)]
+
+
+def _write_epochs_hdf5(epochs, fname, fmt, overwrite):
+    """Write epochs to an HDF5 file, one epoch (or less) per chunk."""
+    info = epochs.info
+    first = int(round(epochs.tmin * info["sfreq"]))  # round just to be safe
+    cals = np.array([ch["cal"] * ch.get("scale", 1.0) for ch in info["chs"]], float)
+    metadata = epochs.metadata
+    if metadata is not None:
+        metadata = _prepare_write_metadata(metadata)
+    state = dict(
+        kind="epochs",
+        info=info,
+        events=epochs.events,
+        event_id=dict(epochs.event_id),
+        first=first,
+        baseline=epochs.baseline,
+        selection=epochs.selection,
+        drop_log=json.dumps(epochs.drop_log),
+        reject_params=json.dumps(_pack_reject_params(epochs)),
+        metadata=metadata,
+        raw_sfreq=epochs._raw_sfreq,
+        annotations=_annotations_to_hdf5(getattr(epochs, "annotations", None)),
+    )
+    n_epochs, n_times = len(epochs), len(epochs.times)
+    # Get the data in batches to limit memory usage for non-preloaded epochs
+    n_batch = max(int(100e6 // max(info["nchan"] * n_times * 8, 1)), 1)
+    shape = (n_epochs, info["nchan"], n_times)
+    data = epochs[0].get_data(copy=False) if n_epochs else np.empty(0)
+    dtype = _get_dtype(fmt, data)
+    with _create_hdf5(fname, state, shape, dtype, n_times, overwrite) as fid:
+        for e_start in range(0, n_epochs, n_batch):
+            e_stop = min(e_start + n_batch, n_epochs)
+            data = epochs.get_data(item=slice(e_start, e_stop), copy=True)
+            data /= cals[:, np.newaxis]
+            fid[_DATA][e_start:e_stop] = data.astype(dtype)
+    return [Path(fname)]
+
+
+@fill_doc
+def read_raw_hdf5(fname, preload=False, verbose=None) -> "RawHDF5":
+    """Read raw data saved in chunked and compressed HDF5 format.
+
+    Parameters
+    ----------
+    fname : path-like
+        The raw file to load, which should end with ``raw.h5`` (see
+        :meth:`mne.io.Raw.save`).
+    %(preload)s
+    %(verbose)s
+
+    Returns
+    -------
+    raw : instance of RawHDF5
+        A Raw object containing the data.
+        See :class:`mne.io.Raw` for documentation of attributes and methods.
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attributes and methods of RawHDF5.
+
+    Notes
+    -----
+    The data are stored in separately compressed chunks of several channels
+    and (by default) the buffer size of the saved instance, so that when the
+    data are not preloaded, reading a subset of channels and samples only
+    reads and decompresses the chunks that contain them.
+
+    .. versionadded:: 1.13
+    """
+    return RawHDF5(fname, preload, verbose)
+
+
+@fill_doc
+class RawHDF5(BaseRaw):
+    """Raw data in chunked and compressed HDF5 format.
+
+    Parameters
+    ----------
+    fname : path-like
+        The raw file to load, which should end with ``raw.h5``.
+    %(preload)s
+    %(verbose)s
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attributes and methods.
+    """
+
+    @verbose
+    def __init__(self, fname, preload=False, verbose=None):
+        import h5py
+
+        fname = _check_fname(fname, "read", True, "fname")
+        check_fname(fname, "raw", _RAW_ENDINGS)
+        logger.info(f"Opening raw data file {fname}...")
+        state = _read_hdf5_state(fname, "raw")
+        info = state["info"]
+        with h5py.File(fname, "r") as fid:
+            n_times = fid[_DATA].shape[1]
+        first_samp = int(state["first_samp"])
+        super().__init__(
+            info,
+            preload,
+            first_samps=(first_samp,),
+            last_samps=(first_samp + n_times - 1,),
+            filenames=[fname],
+            orig_format=state["fmt"],
+            raw_extras=[dict(first_samp=first_samp)],
+            buffer_size_sec=state["buffer_size"] / info["sfreq"],
+            verbose=verbose,
+        )
+        annotations = _annotations_from_hdf5(state["annotations"])
+        if info["meas_date"] is None:
+            # without a meas date, the onsets are relative to the first
+            # available sample when setting annotations (like for FIF)
+            annotations.onset -= first_samp / info["sfreq"]
+        self.set_annotations(annotations, emit_warning=False)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Read a chunk of raw data."""
+        import h5py
+
+        extra = self._raw_extras[fi]
+        rows = np.arange(extra["orig_nchan"])[idx]
+        start, stop = start - extra["first_samp"], stop - extra["first_samp"]
+        with h5py.File(self.filenames[fi], "r") as fid:
+            dset = fid[_DATA]
+            # Only the chunks containing the requested channels are read
+            if len(rows) == 0:
+                return
+            r_start, r_stop = rows.min(), rows.max() + 1
+            if len(rows) < (r_stop - r_start) // 2:
+                use = np.unique(rows)
+                block = dset[use, start:stop]
+                rows = np.searchsorted(use, rows)
+            else:
+                block = dset[r_start:r_stop, start:stop]
+                rows = rows - r_start
+        _mult_cal_one(data, block, rows, cals, mult)
+
+
+class _HDF5Container:
+    """Helper to read epochs from an HDF5 file."""
+
+    def __init__(self, fname, event_samps, cals):
+        import h5py
+
+        self.fid = h5py.File(fname, "r")
+        self.event_samps = event_samps
+        self.cals = cals
+        self.proj = False
+
+    def __del__(self):  # noqa: D105
+        self.fid.close()
+
+
+@fill_doc
+class EpochsHDF5(BaseEpochs):
+    """Epochs in chunked and compressed HDF5 format.
+
+    Parameters
+    ----------
+    fname : path-like
+        The epochs to load, which should end with ``-epo.h5``.
+    %(proj_epochs)s
+    preload : bool
+        If True, read all epochs from disk immediately. If False, epochs will
+        be read on demand.
+    %(verbose)s
+
+    See Also
+    --------
+    mne.read_epochs
+    """
+
+    @verbose
+    def __init__(self, fname, proj=True, preload=True, verbose=None):
+        import h5py
+
+        fname = _check_fname(fname=fname, must_exist=True, overwrite="read")
+        check_fname(fname, "epochs", _EPOCHS_ENDINGS)
+        logger.info(f"Reading {fname} ...")
+        state = _read_hdf5_state(fname, "epochs")
+        info = state["info"]
+        events = np.array(state["events"], np.int64).reshape(-1, 3)
+        event_id = {key: int(val) for key, val in state["event_id"].items()}
+        cals = np.array(
+            [[ch["cal"] * ch.get("scale", 1.0)] for ch in info["chs"]], np.float64
+        )
+        data = raw = None
+        with h5py.File(fname, "r") as fid:
+            dset = fid[_DATA]
+            n_times = dset.shape[2]
+            if preload:
+                data = dset[:]
+                data = data.astype(
+                    np.complex128 if np.iscomplexobj(data) else np.float64
+                )
+                data *= cals
+            else:
+                raw = _HDF5Container(fname, events[:, 0].copy(), cals)
+        if len(np.unique(events[:, 0])) != len(events):
+            raise RuntimeError("Event time samples were not unique")
+        first = int(state["first"])
+        drop_log = tuple(tuple(x) for x in json.loads(state["drop_log"]))
+        metadata = state["metadata"]
+        if metadata is not None:
+            metadata = _prepare_read_metadata(metadata)
+        baseline = state["baseline"]
+        if baseline is not None:
+            baseline = tuple(baseline)
+        super().__init__(
+            info,
+            data,
+            events,
+            event_id,
+            first / info["sfreq"],
+            (first + n_times - 1) / info["sfreq"],
+            baseline=None,
+            raw=raw,
+            proj=proj,
+            preload_at_end=False,
+            on_missing="ignore",
+            selection=np.array(state["selection"], int),
+            drop_log=drop_log,
+            filename=fname,
+            metadata=metadata,
+            verbose=verbose,
+            raw_sfreq=state["raw_sfreq"],
+            annotations=_annotations_from_hdf5(state["annotations"]),
+            **json.loads(state["reject_params"]),
+        )
+        # the data were baseline-corrected (if requested) before saving
+        self.baseline = baseline
+        self._do_baseline = False
+        self._bad_dropped = True
+
+    @verbose
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        """Load one epoch from disk."""
+        return self._get_epochs_from_raw([idx])[0]
+
+    def _get_epochs_from_raw(self, idxs):
+        """Load several epochs from disk with a single read."""
+        return self._get_epochs_subset_from_raw(idxs, None, slice(None))
+
+    def _get_epochs_batch_from_raw(self, idxs):
+        """Load several epochs from disk as one array."""
+        return self._get_epochs_from_raw(idxs)
+
+    def _get_epochs_subset_from_raw(self, idxs, picks, time_sl):
+        """Load some channels and samples of several epochs with a single read.
+
+        Only the chunks containing the requested channels of the requested
+        epochs are read and decompressed.
+        """
+        raw = self._raw
+        event_samps = self.events[np.atleast_1d(idxs), 0]
+        order = np.argsort(raw.event_samps)
+        pos = np.searchsorted(raw.event_samps, event_samps, sorter=order)
+        pos = order[np.minimum(pos, len(order) - 1)]
+        if not np.array_equal(raw.event_samps[pos], event_samps):
+            raise RuntimeError(
+                "Correct epoch could not be found, please contact mne-python developers"
+            )
+        # h5py needs increasing indices, and at most one index array per read
+        use, rows = np.unique(pos, return_inverse=True)
+        sel = _hdf5_sel(use)
+        ch_rows = ch_sel = slice(None)
+        cals = raw.cals
+        if picks is not None:
+            cals = cals[picks]
+            use_ch, ch_rows = np.unique(picks, return_inverse=True)
+            c_start, c_stop = use_ch[0], use_ch[-1] + 1
+            if isinstance(sel, slice) and len(use_ch) < (c_stop - c_start) // 2:
+                ch_sel = use_ch
+            else:
+                ch_sel = slice(c_start, c_stop)
+                ch_rows = use_ch[ch_rows] - c_start
+        data = raw.fid[_DATA][sel, ch_sel, time_sl]
+        if not np.array_equal(rows, np.arange(len(use))):
+            data = data[rows]
+        if not isinstance(ch_rows, slice) and not np.array_equal(
+            ch_rows, np.arange(data.shape[1])
+        ):
+            data = data[:, ch_rows]
+        data = data.astype(
+            np.complex128 if np.iscomplexobj(data) else np.float64, copy=False
+        )
+        data *= cals
+        return data
+
+
+def _hdf5_sel(idx):
+    """Get a slice for increasing indices if they are contiguous."""
+    if len(idx) and idx[-1] - idx[0] + 1 == len(idx):
+        return slice(idx[0], idx[-1] + 1)
+    return idx
@@ -0,0 +1,160 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from mne import (
+    Annotations,
+    Epochs,
+    create_info,
+    find_events,
+    make_fixed_length_events,
+    read_epochs,
+)
+from mne.io import RawArray, read_raw, read_raw_fif, read_raw_hdf5
+from mne.io.hdf5 import hdf5
+from mne.io.tests.test_raw import _test_raw_reader
+
+pytest.importorskip("h5io")
+
+
+def _make_raw():
+    rng = np.random.default_rng(0)
+    info = create_info(
+        ["EEG1", "EEG2", "MEG1", "STI"], 250.0, ["eeg"] * 2 + ["mag", "stim"]
+    )
+    data = rng.standard_normal((4, 5000)) * 1e-6
+    data[3] = 0
+    data[3, 100::500] = [1, 2] * 5
+    raw = RawArray(data, info, first_samp=13)
+    raw.set_annotations(
+        Annotations([1, 3], [0.5, 1], ["x", "BAD_y"], ch_names=[(), ("EEG1",)])
+    )
+    return raw
+
+
+@pytest.mark.parametrize("fmt", ["single", "double", "short"])
+def test_raw_hdf5(tmp_path, fmt):
+    """Test saving and reading raw data in HDF5 format."""
+    raw = _make_raw()
+    raw.save(tmp_path / "test_raw.fif", fmt=fmt)
+    raw.save(tmp_path / "test_raw.h5", fmt=fmt, buffer_size_sec=1.0)
+    raw_fif = read_raw_fif(tmp_path / "test_raw.fif")
+    raw_h5 = read_raw(tmp_path / "test_raw.h5")
+    assert "RawHDF5" in repr(raw_h5)
+    assert raw_h5.first_samp == raw.first_samp
+    assert raw_h5.orig_format == fmt
+    assert raw_h5.buffer_size_sec == 1.0
+    assert raw_h5.annotations.ch_names[1] == ("EEG1",)
+    assert_allclose(raw_h5.annotations.onset, raw_fif.annotations.onset)
+    # same values as FIF, also when reading only some channels and samples
+    assert_array_equal(raw_h5.get_data(), raw_fif.get_data())
+    for picks in ([2, 0], [3, 0], [1]):
+        assert_array_equal(
+            raw_h5.get_data(picks, 123, 3210), raw_fif.get_data(picks, 123, 3210)
+        )
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        raw.save(tmp_path / "test_raw.h5")
+    for kwargs in (dict(split_size="1GB"), dict(split_naming="bids")):
+        with pytest.raises(ValueError, match="cannot be changed .* HDF5"):
+            raw.save(tmp_path / "test_split_raw.h5", **kwargs)
+    assert not (tmp_path / "test_split_raw.h5").exists()
+    # picks, tmin and tmax
+    raw.save(tmp_path / "test_crop_raw.h5", picks=[2, 0], tmin=1, tmax=5)
+    raw_crop = read_raw_hdf5(tmp_path / "test_crop_raw.h5")
+    assert raw_crop.ch_names == ["MEG1", "EEG1"]
+    assert raw_crop.first_samp == raw.first_samp + 250
+    assert_allclose(
+        raw_crop.get_data(),
+        raw.copy().pick([2, 0]).crop(1, 5).get_data(),
+        rtol=1e-6 if fmt == "single" else 1e-1,
+        atol=1e-20,
+    )
+    if fmt == "single":
+        _test_raw_reader(read_raw_hdf5, fname=tmp_path / "test_raw.h5")
+
+
+def test_epochs_hdf5(tmp_path):
+    """Test saving and reading epochs in HDF5 format."""
+    raw = _make_raw()
+    events = find_events(raw)
+    epochs = Epochs(raw, events, dict(a=1, b=2), -0.2, 0.5, preload=False)
+    epochs.drop([2], reason="test")
+    epochs.save(tmp_path / "test-epo.fif")
+    epochs.save(tmp_path / "test-epo.h5")
+    epochs_fif = read_epochs(tmp_path / "test-epo.fif")
+    for preload in (True, False):
+        epochs_h5 = read_epochs(tmp_path / "test-epo.h5", preload=preload)
+        assert "EpochsHDF5" in repr(epochs_h5)
+        assert epochs_h5.preload == preload
+        assert epochs_h5.event_id == epochs.event_id
+        assert epochs_h5.baseline == epochs.baseline
+        assert epochs_h5.drop_log == epochs.drop_log
+        assert_array_equal(epochs_h5.events, epochs.events)
+        assert_array_equal(epochs_h5.selection, epochs.selection)
+        assert_array_equal(epochs_h5.get_data(), epochs_fif.get_data())
+        assert_array_equal(
+            epochs_h5["b"].get_data([1], tmin=0), epochs_fif["b"].get_data([1], tmin=0)
+        )
+        assert_array_equal(
+            epochs_h5.get_data(item=[4, 1]), epochs_fif.get_data(item=[4, 1])
+        )
+    with pytest.raises(ValueError, match="cannot be changed .* HDF5"):
+        epochs.save(tmp_path / "test_split-epo.h5", split_size="1GB")
+    # re-saving non-preloaded epochs
+    epochs_h5.save(tmp_path / "test2-epo.h5")
+    assert_array_equal(
+        read_epochs(tmp_path / "test2-epo.h5").get_data(), epochs_fif.get_data()
+    )
+
+
+def test_epochs_hdf5_subsets(tmp_path, monkeypatch):
+    """Test reading subsets of channels, samples, and epochs from HDF5."""
+    monkeypatch.setattr(hdf5, "_CHUNK_BYTES", 4 * 101 * 4)  # 4 channels per chunk
+    rng = np.random.default_rng(0)
+    info = create_info(20, 250.0, "eeg")
+    with info._unlock():
+        info["lowpass"] = 40.0
+    raw = RawArray(rng.standard_normal((20, 5000)) * 1e-6, info)
+    events = make_fixed_length_events(raw, duration=0.5)
+    epochs = Epochs(raw, events, tmin=-0.1, tmax=0.3, baseline=None)
+    epochs.save(tmp_path / "test-epo.h5")
+    want = read_epochs(tmp_path / "test-epo.h5", preload=True)
+    epochs_h5 = read_epochs(tmp_path / "test-epo.h5", preload=False)
+    reads = list()
+    get_subset = epochs_h5._get_epochs_subset_from_raw
+
+    def _get_subset(idxs, picks, time_sl):
+        reads.append((idxs, picks, time_sl))
+        return get_subset(idxs, picks, time_sl)
+
+    monkeypatch.setattr(epochs_h5, "_get_epochs_subset_from_raw", _get_subset)
+    for kwargs in (
+        dict(),
+        dict(picks=[17, 2, 5]),  # sparse channels
+        dict(picks=[6, 3, 4], item=[9, 2, 2]),  # fancy epochs
+        dict(picks=[0, 19], item=[1, 5]),
+        dict(tmin=0.0, tmax=0.2, item=slice(3, 8)),
+    ):
+        assert_array_equal(epochs_h5.get_data(**kwargs), want.get_data(**kwargs))
+        assert len(reads) == 1
+        picks = kwargs.get("picks", np.arange(20))
+        assert_array_equal(reads.pop()[1], picks)
+    # decimation is done when reading
+    epochs_h5.decimate(2)
+    want.decimate(2)
+    assert_array_equal(epochs_h5.get_data(tmin=0.1), want.get_data(tmin=0.1))
+    assert reads.pop()[2] == slice(49, 101, 2)
+    # baseline correction needs all samples
+    epochs_h5 = read_epochs(tmp_path / "test-epo.h5", preload=False)
+    monkeypatch.setattr(epochs_h5, "_get_epochs_subset_from_raw", _get_subset)
+    epochs_h5.apply_baseline((None, 0))
+    want = read_epochs(tmp_path / "test-epo.h5").apply_baseline((None, 0))
+    assert_allclose(
+        epochs_h5.get_data(picks=[3], tmin=0.1), want.get_data([3], tmin=0.1)
+    )
+    assert len(reads) == 1  # whole epochs
+    assert reads[0][1:] == (None, slice(None))
@@ -355,9 +355,9 @@ def _test_raw_reader(
     for filename in filenames:
         assert filename.is_file()
     # Test saving with not correct extension
-    out_fname_h5 = op.join(tempdir, "test_raw.h5")
-    with pytest.raises(OSError, match="raw must end with .fif or .fif.gz"):
-        raw.save(out_fname_h5)
+    out_fname_txt = op.join(tempdir, "test_raw.txt")
+    with pytest.raises(OSError, match="raw must end with .fif, .fif.gz or .h5"):
+        raw.save(out_fname_txt)
 
     raw3 = read_raw_fif(out_fname, allow_maxshield="yes")
     assert_named_constants(raw3.info)
@@ -855,6 +855,39 @@ def test_load_data_memmap(tmp_path):
     assert_array_equal(raw._data[:, 0], np.arange(1, 9))
 
 
+def test_load_data_dtype(tmp_path, monkeypatch):
+    """Test loading raw data in single precision."""
+    raw = _read_raw_arange(preload=False)
+    with pytest.raises(ValueError, match="dtype must be None"):
+        raw.copy().load_data(dtype="int16")
+    raw_64 = raw.copy().load_data()
+    assert raw_64._data.dtype == np.float64
+    raw_32 = raw.copy().load_data(dtype="float32")
+    assert raw_32._data.dtype == np.float32
+    assert_array_equal(raw_32._data, raw_64._data)
+    memmap_fname = tmp_path / "raw-load-data-memmap.dat"
+    raw_mm = raw.copy().load_data(memmap=memmap_fname, dtype="float32")
+    assert isinstance(raw_mm._data, np.memmap)
+    assert raw_mm._data.dtype == np.float32
+    # already loaded data are converted
+    raw_64.load_data(dtype="float32")
+    assert raw_64._data.dtype == np.float32
+    # global default
+    monkeypatch.setenv("MNE_DATA_DTYPE", "float32")
+    raw_32 = raw.copy().load_data()
+    assert raw_32._data.dtype == np.float32
+    assert raw.copy().load_data(dtype="float64")._data.dtype == np.float64
+    # processing keeps single precision
+    monkeypatch.delenv("MNE_DATA_DTYPE")
+    raw_64 = raw.copy().load_data()
+    for method in ("fir", "iir"):
+        filt_32 = raw_32.copy().filter(None, 100.0, method=method)
+        assert filt_32._data.dtype == np.float32
+        filt_64 = raw_64.copy().filter(None, 100.0, method=method)
+        assert_allclose(filt_32._data, filt_64._data, rtol=1e-5, atol=1e-5)
+    assert raw_32.copy().resample(500.0)._data.dtype == np.float32
+
+
 def test_test_raw_reader():
     """Test _test_raw_reader."""
     _test_raw_reader(_read_raw_arange, test_scaling=False, test_rank="less")
@@ -1058,6 +1091,135 @@ def test_get_data_tmin_tmax():
         raw.get_data(tmax=[1, 2])
 
 
+@pytest.mark.parametrize("preload", (True, False))
+def test_iter_chunks(tmp_path, monkeypatch, preload):
+    """Test iterating over raw data in chunks."""
+    from mne.io._read_scheduler import _read_stats
+
+    rng = np.random.default_rng(0)
+    info = create_info(4, 100.0, "eeg")
+    raw = RawArray(rng.standard_normal((4, 1050)), info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt="double")
+    raw = read_raw_fif(fname, preload=preload)
+    want, times = read_raw_fif(fname).get_data(return_times=True)
+    # no overlap
+    chunks = list(raw.iter_chunks(2.0))
+    assert [c.shape[1] for c in chunks] == [200] * 5 + [50]
+    assert_array_equal(np.concatenate(chunks, axis=1), want)
+    # overlap, picks, times, and limits
+    chunks = list(
+        raw.iter_chunks(1.0, overlap=0.25, picks=[3, 1], return_times=True, tmin=1)
+    )
+    assert [c[0].shape[1] for c in chunks] == [100] * 12 + [50]
+    for ci, (data, this_times) in enumerate(chunks):
+        start = 100 + 75 * ci
+        assert_array_equal(data, want[[3, 1], start : start + 100])
+        assert_array_equal(this_times, times[start : start + 100])
+    chunks = list(raw.iter_chunks(5.0, overlap=4.99, tmin=0.5, tmax=0.6))
+    assert len(chunks) == 1
+    assert_array_equal(chunks[0], want[:, 50:60])
+    # prefetching of overlapping chunks (looked up at the first read)
+    monkeypatch.setenv("MNE_READ_PREFETCH", "true")
+    raw = read_raw_fif(fname, preload=preload)
+    n_hits = _read_stats["prefetch_hits"]
+    chunks = list(raw.iter_chunks(1.0, overlap=0.5))
+    assert_array_equal(chunks[-1], want[:, 950:])
+    if not preload:
+        assert _read_stats["prefetch_hits"] - n_hits == len(chunks) - 2
+    # annotations
+    raw.set_annotations(Annotations([1.5, 4.0], [1.0, 2.0], "bad"))
+    chunks = list(raw.iter_chunks(2.0, reject_by_annotation="omit"))
+    assert [c.shape[1] for c in chunks] == [150, 150, 200, 200, 50]
+    chunks = list(raw.iter_chunks(2.0, reject_by_annotation="NaN"))
+    assert [c.shape[1] for c in chunks] == [200] * 5 + [50]
+    assert np.isnan(chunks[0][:, 150:]).all()
+    assert not np.isnan(chunks[0][:, :150]).any()
+    with pytest.raises(ValueError, match="smaller than duration"):
+        next(raw.iter_chunks(1.0, 1.0))
+    with pytest.raises(ValueError, match="at least one sample"):
+        next(raw.iter_chunks(0.001))
+    with pytest.raises(TypeError, match="duration must be"):
+        next(raw.iter_chunks("1"))
+
+
+def test_filter_resample_out_fname(tmp_path, monkeypatch):
+    """Test out-of-core (notch) filtering and resampling to a new file."""
+    monkeypatch.setattr("mne.io._chunked._CHUNK_SEC", 0.5)
+    rng = np.random.default_rng(0)
+    info = create_info(["a", "b", "STI"], 1000.0, ["eeg", "eeg", "stim"])
+    raws = list()
+    for ri, (n_times, first_samp) in enumerate([(7001, 13), (5003, 0)]):
+        data = rng.standard_normal((3, n_times)) * 1e-5
+        data[2] = 0
+        data[2, rng.integers(0, n_times, 20)] = rng.integers(1, 5, 20)
+        raw = RawArray(data, info.copy(), first_samp=first_samp)
+        raw.save(tmp_path / f"test_{ri}_raw.fif", fmt="double")
+        raws.append(read_raw_fif(tmp_path / f"test_{ri}_raw.fif"))
+    raw = concatenate_raws(raws)  # includes an edge annotation
+    out_fname = tmp_path / "test_out_raw.fif"
+    want_fname = tmp_path / "test_want_raw.fif"
+
+    def _saved(raw):
+        raw.save(want_fname, overwrite=True)
+        return read_raw_fif(want_fname)
+
+    for kwargs in (
+        dict(l_freq=5.0, h_freq=40.0),
+        dict(l_freq=None, h_freq=30.0, phase="minimum", picks=[0], pad="edge"),
+    ):
+        want = _saved(raw.copy().load_data().filter(**kwargs))
+        got = raw.filter(**kwargs, out_fname=out_fname, overwrite=True)
+        assert not got.preload and not raw.preload
+        assert got.info["lowpass"] == want.info["lowpass"]
+        assert_allclose(got.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+    for kwargs in (
+        dict(freqs=[60.0, 120.0], trans_bandwidth=4.0),
+        dict(freqs=60.0, method="spectrum_fit", filter_length="0.3s", picks=[1]),
+        dict(freqs=None, method="spectrum_fit", filter_length="1s", p_value=0.5),
+        dict(freqs=[60.0], method="spectrum_fit"),  # one window per segment
+    ):
+        want = _saved(raw.copy().load_data().notch_filter(**kwargs))
+        got = raw.notch_filter(**kwargs, out_fname=out_fname, overwrite=True)
+        assert not got.preload and not raw.preload
+        assert_allclose(got.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+    for sfreq in (250.0, 333.0):
+        events = np.array([[100, 0, 1], [11000, 0, 2]])
+        want, want_events = (
+            raw.copy().load_data().resample(sfreq, method="polyphase", events=events)
+        )
+        got, got_events = raw.resample(
+            sfreq,
+            method="polyphase",
+            events=events,
+            out_fname=out_fname,
+            overwrite=True,
+        )
+        assert got.info["sfreq"] == sfreq
+        assert got.first_samp == want.first_samp
+        assert_array_equal(got_events, want_events)
+        assert_allclose(got.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        raw.filter(1.0, None, out_fname=out_fname)
+    with pytest.raises(ValueError, match="must differ from the file"):
+        raw.filter(1.0, None, out_fname=raw.filenames[0], overwrite=True)
+    with pytest.raises(ValueError, match='method="fir"'):
+        raw.filter(1.0, None, method="iir", out_fname=out_fname, overwrite=True)
+    with pytest.raises(ValueError, match='method="fir" or "spectrum_fit"'):
+        raw.notch_filter(60.0, method="iir", out_fname=out_fname, overwrite=True)
+    for out in (None, out_fname):  # same padding checks with or without
+        with pytest.raises(ValueError, match="Invalid value for the 'pad'"):
+            raw.copy().load_data().filter(
+                1.0, None, pad="foo", out_fname=out, overwrite=True
+            )
+    with pytest.raises(ValueError, match='method="polyphase"'):
+        raw.resample(100.0, out_fname=out_fname, overwrite=True)
+    with pytest.raises(ValueError, match="depends on the entire signal"):
+        raw.resample(
+            100.0, method="polyphase", pad="mean", out_fname=out_fname, overwrite=True
+        )
+
+
 def test_resamp_noop():
     """Tests resampling doesn't affect data if sfreq is identical."""
     raw = read_raw_fif(raw_fname)
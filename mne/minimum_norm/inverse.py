@@ -756,9 +756,8 @@ def prepare_inverse_operator(
 def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
     """Assemble the kernel.
 
-    Simple matrix multiplication followed by combination of the current
-    components. This does all the data transformations to compute the weights
-    for the eigenleads.
+    Simple matrix multiplication of the factors computed by
+    ``_assemble_kernel_factors``.
 
     Parameters
     ----------
@@ -791,6 +790,57 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
         The direction in cartesian coordicates of the direction of the source
         dipoles.
     """  # noqa: E501
+    eigen_leads, trans, noise_norm, vertno, source_nn = _assemble_kernel_factors(
+        inv, label, method, pick_ori, use_cps
+    )
+    K = np.dot(eigen_leads, trans)
+    return K, noise_norm, vertno, source_nn
+
+
+@verbose
+def _assemble_kernel_factors(inv, label, method, pick_ori, use_cps=True, verbose=None):
+    """Assemble the factors of the kernel.
+
+    This does all the data transformations to compute the weights for the
+    eigenleads. The kernel is ``np.dot(eigen_leads, trans)``, but keeping it
+    factored allows projecting the data onto the (at most n_channels)
+    eigenfields before expanding it to the sources.
+
+    Parameters
+    ----------
+    inv : instance of InverseOperator
+        The inverse operator to use. This object contains the matrices that
+        will be multiplied to assemble the kernel.
+    label : Label | None
+        Restricts the source estimates to a given label. If None,
+        source estimates will be computed for the entire source space.
+    method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+        Use minimum norm, dSPM, sLORETA, or eLORETA.
+    pick_ori : None | "normal" | "vector"
+        Which orientation to pick (only matters in the case of 'normal').
+    %(use_cps_restricted)s
+
+    Returns
+    -------
+    eigen_leads : array, shape (n_vertices, n_comp) | (3 * n_vertices, n_comp)
+        The weighted eigenleads, which map the eigenfield components to the
+        sources.
+    trans : array, shape (n_comp, n_channels)
+        The projection of the data onto the n_comp <= n_channels regularized
+        eigenfields. Components beyond the rank of the noise covariance are
+        omitted, as they do not contribute.
+    noise_norm : array, shape (n_vertices, n_samples) | (3 * n_vertices, n_samples)
+        Normalization to apply to the source estimate in order to obtain dSPM
+        or sLORETA solutions.
+    vertices : list of length 2
+        Vertex numbers for lh and rh hemispheres that correspond to the
+        vertices in the source estimate. When the label parameter has been
+        set, these correspond to the vertices in the label. Otherwise, all
+        vertex numbers are returned.
+    source_nn : array, shape (3 * n_vertices, 3)
+        The direction in cartesian coordicates of the direction of the source
+        dipoles.
+    """  # noqa: E501
     eigen_leads = inv["eigen_leads"]["data"]
     source_cov = inv["source_cov"]["data"]
     if method in ("dSPM", "sLORETA"):
@@ -852,14 +902,23 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
                 "when working with loose orientations."
             )
 
-    trans = np.dot(inv["eigen_fields"]["data"], np.dot(inv["whitener"], inv["proj"]))
-    trans *= inv["reginv"][:, None]
+    # components with a zero regularized inverse (beyond the rank of the
+    # noise covariance) do not contribute
+    use = inv["reginv"] != 0
+    trans = np.dot(
+        inv["eigen_fields"]["data"][use], np.dot(inv["whitener"], inv["proj"])
+    )
+    trans *= inv["reginv"][use, None]
+
+    if pick_ori == "normal":
+        eigen_leads = eigen_leads[2::3]
+        source_cov = source_cov[2::3]
+    eigen_leads = eigen_leads[:, use]  # makes a copy
 
     #
     #   Transformation into current distributions by weighting the eigenleads
     #   with the weights computed above
     #
-    K = np.dot(eigen_leads, trans)
     if inv["eigen_leads_weighted"]:
         #
         #     R^0.5 has been already factored in
@@ -870,12 +929,9 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
         #     R^0.5 has to be factored in
         #
         logger.info("    Eigenleads need to be weighted ...")
-        K *= np.sqrt(source_cov)[:, np.newaxis]
+        eigen_leads *= np.sqrt(source_cov)[:, np.newaxis]
 
-    if pick_ori == "normal":
-        K = K[2::3]
-
-    return K, noise_norm, vertno, source_nn
+    return eigen_leads, trans, noise_norm, vertno, source_nn
 
 
 def _check_ori(pick_ori, source_ori, src):
@@ -1136,6 +1192,7 @@ def apply_inverse_raw(
     prepared=False,
     method_params=None,
     use_cps=True,
+    factored=False,
     verbose=None,
 ):
     """Apply inverse operator to Raw data.
@@ -1180,6 +1237,19 @@ def apply_inverse_raw(
     %(use_cps_restricted)s
 
         .. versionadded:: 0.20
+    factored : bool
+        If True, the inverse kernel is kept factored: the data are first
+        projected onto the regularized eigenfields of the inverse operator
+        (at most as many as the rank of the noise covariance, which can be
+        much lower than the number of channels, e.g. after Maxwell filtering),
+        and only then expanded to the sources. This avoids forming the
+        ``(n_sources, n_channels)`` kernel and reduces the computations for
+        long recordings. For linear estimates (fixed orientations or
+        ``pick_ori="normal"``), the source time courses are only computed
+        when the data of the returned source estimate are accessed. See Notes
+        for details.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -1193,6 +1263,16 @@ def apply_inverse_raw(
     apply_inverse_epochs : Apply inverse operator to epochs object.
     apply_inverse_tfr_epochs : Apply inverse operator to epochs tfr object.
     apply_inverse_cov : Apply inverse operator to covariance object.
+
+    Notes
+    -----
+    With ``factored=True`` and a linear estimate, the returned source
+    estimate stores the (noise-normalized) eigenleads and the projected data.
+    Methods that only need some of the sources or times, such as
+    :meth:`~mne.SourceEstimate.crop` or
+    :meth:`~mne.SourceEstimate.transform` with ``idx``, then work on the
+    projected data and expand only what they need. The results are the same
+    as with ``factored=False`` up to floating point precision.
     """
     _validate_type(raw, BaseRaw, "raw")
     _check_reference(raw, inverse_operator["info"]["ch_names"])
@@ -1220,16 +1300,30 @@ def apply_inverse_raw(
     if time_func is not None:
         data = time_func(data)
 
-    K, noise_norm, vertno, source_nn = _assemble_kernel(
-        inv, label, method, pick_ori, use_cps
-    )
-
     is_free_ori = (
         inverse_operator["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI
         and pick_ori != "normal"
     )
 
-    if buffer_size is not None and is_free_ori:
+    _validate_type(factored, bool, "factored")
+    if factored:
+        K, trans, noise_norm, vertno, source_nn = _assemble_kernel_factors(
+            inv, label, method, pick_ori, use_cps
+        )
+        logger.info("    Projecting the data onto %d eigenfields...", len(trans))
+        data = np.dot(trans, data)
+    else:
+        K, noise_norm, vertno, source_nn = _assemble_kernel(
+            inv, label, method, pick_ori, use_cps
+        )
+
+    if factored and not is_free_ori:
+        # keep the solution factored, it is expanded when the data are used
+        if noise_norm is not None:
+            K *= noise_norm
+            noise_norm = None
+        sol = (K, data)
+    elif buffer_size is not None and is_free_ori:
         # Process the data in segments to conserve memory
         n_seg = int(np.ceil(data.shape[1] / float(buffer_size)))
         logger.info(
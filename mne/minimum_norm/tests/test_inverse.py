@@ -1213,6 +1213,24 @@ def test_apply_mne_inverse_raw():
             prepared=True,
         )
 
+        # keeping the kernel factored
+        stc3 = apply_inverse_raw(
+            raw,
+            inverse_operator,
+            lambda2,
+            "dSPM",
+            label=label_lh,
+            start=start,
+            stop=stop,
+            nave=1,
+            pick_ori=pick_ori,
+            buffer_size=3,
+            prepared=True,
+            factored=True,
+        )
+        # linear estimates are only expanded when needed
+        assert (stc3._kernel is not None) == (pick_ori == "normal")
+
         if pick_ori is None:
             assert np.all(stc.data > 0)
             assert np.all(stc2.data > 0)
@@ -1222,11 +1240,14 @@ def test_apply_mne_inverse_raw():
         assert_array_almost_equal(stc.times, times)
         assert_array_almost_equal(stc2.times, times)
         assert_array_almost_equal(stc.data, stc2.data)
+        assert_allclose(stc3.data, stc.data, rtol=1e-10, atol=1e-10 * stc.data.max())
 
     with pytest.raises(TypeError, match="must be an instance of BaseRaw"):
         apply_inverse_raw(
             EpochsArray(raw.get_data()[np.newaxis], raw.info), inverse_operator, 1.0
         )
+    with pytest.raises(TypeError, match="factored must be an instance of bool"):
+        apply_inverse_raw(raw, inverse_operator, 1.0, factored="yes")
 
 
 @testing.requires_testing_data
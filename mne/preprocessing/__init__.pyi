@@ -7,6 +7,7 @@ __all__ = [
     "annotate_movement",
     "annotate_muscle_zscore",
     "annotate_nan",
+    "clear_maxwell_cache",
     "compute_average_dev_head_t",
     "compute_bridged_electrodes",
     "compute_current_source_density",
@@ -26,6 +27,7 @@ __all__ = [
     "find_ecg_events",
     "find_eog_events",
     "fix_stim_artifact",
+    "get_maxwell_cache_info",
     "get_score_funcs",
     "ica_find_ecg_events",
     "ica_find_eog_events",
@@ -81,8 +83,10 @@ from .ica import (
 from .infomax_ import infomax
 from .interpolate import equalize_bads, interpolate_bridged_electrodes
 from .maxwell import (
+    clear_maxwell_cache,
     compute_maxwell_basis,
     find_bad_channels_maxwell,
+    get_maxwell_cache_info,
     maxwell_filter,
     maxwell_filter_prepare_emptyroom,
 )
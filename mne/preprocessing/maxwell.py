@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from math import factorial
 from os import path as op
@@ -28,6 +29,7 @@ from ..channels.channels import _get_T1T2_mag_inds, fix_mag_coil_types
 from ..fixes import _reshape_view, _safe_svd, bincount, sph_harm_y
 from ..forward import _concatenate_coils, _create_meg_coils, _prep_meg_channels
 from ..io import BaseRaw, RawArray
+from ..parallel import _check_n_jobs
 from ..surface import _normalize_vectors
 from ..transforms import (
     Transform,
@@ -49,6 +51,7 @@ from ..transforms import (
 from ..utils import (
     _check_option,
     _clean_names,
+    _DiskCache,
     _ensure_int,
     _pl,
     _time_mask,
@@ -238,6 +241,7 @@ def maxwell_filter(
     extended_proj=(),
     st_overlap=True,
     mc_interp="hann",
+    n_jobs=None,
     verbose=None,
 ):
     """Maxwell filter data using multipole moments.
@@ -291,6 +295,12 @@ def maxwell_filter(
 
         .. versionadded:: 1.10
     %(maxwell_mc_interp)s
+    %(n_jobs)s
+        The tSSS windows are processed in this many threads, with at most
+        ``n_jobs`` windows held in memory at once. The output does not depend
+        on ``n_jobs``.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -398,6 +408,23 @@ def maxwell_filter(
     structure of the data is modified, so projectors are discarded (unless
     in ``st_only=True`` mode).
 
+    When the ``MNE_MAXWELL_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), the SSS bases and their regularized
+    pseudoinverses are stored in this directory, keyed on everything they are
+    computed from (sensor definitions, fine calibration, head position,
+    origin, expansion orders, regularization, and good channels). Runs
+    recorded with the same setup then reuse them, which also applies to
+    :func:`~mne.preprocessing.find_bad_channels_maxwell`,
+    :func:`~mne.preprocessing.compute_maxwell_basis`, and
+    :func:`~mne.epochs.average_movements`. With movement compensation, one
+    file is stored for each head position. The least recently used files are
+    removed when the directory grows beyond ``MNE_DISK_CACHE_SIZE`` megabytes
+    (1000 by default), and the cache can be inspected with
+    :func:`~mne.preprocessing.get_maxwell_cache_info` and emptied with
+    :func:`~mne.preprocessing.clear_maxwell_cache`.
+
+    .. versionadded:: 1.13
+
     References
     ----------
     .. footbibliography::
@@ -426,7 +453,8 @@ def maxwell_filter(
         st_overlap=st_overlap,
         mc_interp=mc_interp,
     )
-    raw_sss = _run_maxwell_filter(raw, **params)
+    n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+    raw_sss = _run_maxwell_filter(raw, n_jobs=n_jobs, **params)
     # Update info
     _update_sss_info(raw_sss, **params["update_kwargs"])
     logger.info("[done]")
@@ -658,6 +686,7 @@ def _prep_maxwell_filter(
         bad_condition=bad_condition,
         mag_scale=mag_scale,
         mult=mult,
+        cache_dir=_sss_cache.get_dir(),
     )
     update_kwargs.update(
         nchan=good_mask.sum(), st_only=st_only, recon_trans=recon_trans
@@ -714,6 +743,7 @@ def _run_maxwell_filter(
     st_fixed,
     st_overlap,
     mc,
+    n_jobs=1,
 ):
     # Eventually find_bad_channels_maxwell could be sped up by moving this
     # outside the loop (e.g., in the prep function) but regularization depends
@@ -763,10 +793,11 @@ def _run_maxwell_filter(
         else:
             n_overlap = 0
             window = "boxcar"
+        # The projections are deferred so that _COLA can run them in threads
         if st_fixed and st_correlation is not None:
             fun = partial(_do_tSSS_on_avg_trans, mc=mc)
         else:
-            fun = _do_tSSS
+            fun = _do_tSSS_deferred
         tsss = _COLA(
             partial(
                 fun,
@@ -781,6 +812,7 @@ def _run_maxwell_filter(
             sfreq,
             window,
             name="tSSS-COLA",
+            n_jobs=n_jobs,
         )
 
         # Generate time points to break up data into equal-length windows
@@ -1101,14 +1133,13 @@ def _do_tSSS_on_avg_trans(
     stop,
     sfreq,
 ):
-    # Get the average transformation over the start, stop interval and split data
+    # Get the average transformation over the start, stop interval (this is
+    # stateful so must be done in order), then defer splitting the data
     op_in, op_resid, n_positions = mc.get_avg_op(start=start, stop=stop)
-    orig_in_data = op_in @ orig_data
-    resid = op_resid @ orig_data
-    return _do_tSSS(
+    return _do_tSSS_deferred(
         clean_data,
-        orig_in_data,
-        resid,
+        op_in @ orig_data,
+        op_resid @ orig_data,
         st_correlation=st_correlation,
         n_positions=n_positions,
         tsss_valid=tsss_valid,
@@ -1118,6 +1149,33 @@ def _do_tSSS_on_avg_trans(
     )
 
 
+def _do_tSSS_deferred(
+    clean_data,
+    orig_in_data,
+    resid,
+    st_correlation,
+    n_positions,
+    tsss_valid,
+    *,
+    start,
+    stop,
+    sfreq,
+):
+    """Defer _do_tSSS so that it can be run later (e.g., in a thread)."""
+    return partial(
+        _do_tSSS,
+        clean_data,
+        orig_in_data,
+        resid,
+        st_correlation,
+        n_positions,
+        tsss_valid,
+        start=start,
+        stop=stop,
+        sfreq=sfreq,
+    )
+
+
 def _do_tSSS(
     clean_data,
     orig_in_data,
@@ -1286,8 +1344,59 @@ def _get_decomp(
     t,
     mag_scale,
     mult,
+    cache_dir,
 ):
     """Get a decomposition matrix and pseudoinverse matrices."""
+    kwargs = dict(
+        all_coils=all_coils,
+        cal=cal,
+        regularize=regularize,
+        exp=exp,
+        ignore_ref=ignore_ref,
+        coil_scale=coil_scale,
+        grad_picks=grad_picks,
+        mag_picks=mag_picks,
+        good_mask=good_mask,
+        mag_or_fine=mag_or_fine,
+        mag_scale=mag_scale,
+        mult=mult,
+    )
+    *out, cond = _get_cached_sss(
+        "decomp",
+        partial(_compute_decomp, trans, t=t, **kwargs),
+        trans,
+        kwargs,
+        cache_dir=cache_dir,
+    )
+    if bad_condition != "ignore" and cond >= 1000.0:
+        msg = f"Matrix is badly conditioned: {cond:0.0f} >= 1000"
+        if bad_condition == "error":
+            raise RuntimeError(msg)
+        elif bad_condition == "warning":
+            warn(msg)
+        else:  # condition == 'info'
+            logger.info(msg)
+    return tuple(out)
+
+
+def _compute_decomp(
+    trans,
+    *,
+    all_coils,
+    cal,
+    regularize,
+    exp,
+    ignore_ref,
+    coil_scale,
+    grad_picks,
+    mag_picks,
+    good_mask,
+    mag_or_fine,
+    t,
+    mag_scale,
+    mult,
+):
+    """Compute a decomposition matrix, its pseudoinverse, and its condition."""
     #
     # Fine calibration processing (point-like magnetometers and calib. coeffs)
     #
@@ -1351,21 +1460,100 @@ def _get_decomp(
     #
     pS_decomp, sing = _col_norm_pinv(S_decomp.copy())
     cond = sing[0] / sing[-1]
-    if bad_condition != "ignore" and cond >= 1000.0:
-        msg = f"Matrix is badly conditioned: {cond:0.0f} >= 1000"
-        if bad_condition == "error":
-            raise RuntimeError(msg)
-        elif bad_condition == "warning":
-            warn(msg)
-        else:  # condition == 'info'
-            logger.info(msg)
 
     # Build in our data scaling here
     pS_decomp *= coil_scale[good_mask].T
     S_decomp /= coil_scale[good_mask]
     S_decomp_full /= coil_scale
     assert pS_decomp.shape[1] == S_decomp.shape[0] == good_mask.sum()
-    return S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in
+    return S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in, float(cond)
+
+
+###############################################################################
+# On-disk cache of SSS bases and their pseudoinverses
+
+_sss_cache = _DiskCache("sss", "MNE_MAXWELL_CACHE_DIR", version=2)
+
+
+def _get_cached_sss(kind, func, *args, cache_dir):
+    """Get the output of func() from the on-disk cache, keyed on args.
+
+    ``func`` must return a tuple of arrays and/or scalars.
+    """
+    if cache_dir is None:
+        return tuple(func())
+    try:
+        key = _sss_cache.hash(kind, *args)
+    except TypeError as exc:  # something unusual, don't cache it
+        logger.debug(f"    Not caching SSS {kind}: {exc}")
+        return tuple(func())
+    fname = _sss_cache.fname(cache_dir, f"{kind}-{key}")
+    out = _sss_cache.read(
+        fname, lambda npz: [npz[f"arr_{ii}"] for ii in range(len(npz.files))]
+    )
+    if out is not None:
+        _sss_cache.count("hits")
+        return tuple(o.item() if o.ndim == 0 else o for o in out)
+    out = tuple(func())
+    _sss_cache.count("misses")
+    _sss_cache.write(cache_dir, fname, **{f"arr_{ii}": o for ii, o in enumerate(out)})
+    return out
+
+
+def get_maxwell_cache_info():
+    """Get information about the on-disk cache of SSS bases.
+
+    When the ``MNE_MAXWELL_CACHE_DIR`` configuration value is set (see
+    :func:`mne.set_config`), the SSS bases and their regularized
+    pseudoinverses computed by :func:`~mne.preprocessing.maxwell_filter`
+    (see the Notes there) and related functions are stored in that directory.
+    The least recently used files are removed when the directory grows beyond
+    ``MNE_DISK_CACHE_SIZE`` megabytes (1000 by default).
+
+    Returns
+    -------
+    info : dict
+        A dictionary with keys:
+
+        ``cache_dir``
+            The cache directory (:class:`~pathlib.Path`), or None if caching
+            is disabled.
+        ``n_files``
+            The number of cached bases.
+        ``size``
+            The total size of the cache in bytes.
+        ``hits``, ``misses``
+            The number of bases that were read from the cache and computed
+            (and written to it) in this session, respectively.
+
+    See Also
+    --------
+    clear_maxwell_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    return _sss_cache.info()
+
+
+@verbose
+def clear_maxwell_cache(*, verbose=None):
+    """Remove all entries from the on-disk cache of SSS bases.
+
+    Parameters
+    ----------
+    %(verbose)s
+
+    See Also
+    --------
+    get_maxwell_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _sss_cache.clear()
 
 
 def _get_s_decomp(
@@ -2493,6 +2681,20 @@ def _compute_sphere_activation_in(degrees):
     return a_power, rho_i
 
 
+def _get_cached_trans_sss_basis(exp, all_coils, trans, coil_scale, *, cache_dir):
+    """Compute an SSS basis using the on-disk cache (if enabled)."""
+    func = partial(_trans_sss_basis, exp, all_coils, trans, coil_scale)
+    return _get_cached_sss(
+        "basis",
+        lambda: (func(),),
+        exp,
+        all_coils,
+        trans,
+        coil_scale,
+        cache_dir=cache_dir,
+    )[0]
+
+
 def _trans_sss_basis(exp, all_coils, trans=None, coil_scale=100.0):
     """Compute SSS basis (optionally) using a dev<->head trans."""
     if trans is not None:
@@ -2537,6 +2739,7 @@ def find_bad_channels_maxwell(
     h_freq=40.0,
     extended_proj=(),
     mc_interp="hann",
+    n_jobs=None,
     verbose=None,
 ):
     r"""Find bad channels using Maxwell filtering.
@@ -2591,6 +2794,11 @@ def find_bad_channels_maxwell(
         apply a filter, set this to ``None``.
     %(extended_proj_maxwell)s
     %(maxwell_mc_interp)s
+    %(n_jobs)s
+        Segments of data that use the same channels are evaluated in this many
+        threads (without movement compensation).
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -2769,24 +2977,16 @@ def find_bad_channels_maxwell(
     thresh_flat = np.full((len(ch_names), 1), np.nan)
     thresh_noisy = np.full_like(thresh_flat, fill_value=np.nan)
 
+    # Flat pass, which also determines the channels used in each segment
+    segments = list()
     for si, (start, stop) in enumerate(zip(starts, stops)):
-        n_iter = 0
-        orig_data = raw.get_data(None, start, stop, verbose=False)
-        chunk_raw = RawArray(
-            orig_data,
-            params["info"],
-            first_samp=raw.first_samp + start,
-            copy="data",
-            verbose=False,
-        )
-
-        t = chunk_raw.times[[0, -1]] + start / raw.info["sfreq"]
+        t = np.array([start, stop - 1]) / raw.info["sfreq"]
         logger.info(f"        Interval {si + 1:3d}: {t[0]:8.3f} - {t[-1]:8.3f}")
 
         # Flat pass: SD < 0.01 fT/cm or 0.01 fT for at 30 ms (or 20 samples)
         n = stop - start
         flat_stop = n - (n % flat_step)
-        data = chunk_raw.get_data(good_meg_picks, 0, flat_stop)
+        data = raw.get_data(good_meg_picks, start, start + flat_stop, verbose=False)
         data = _reshape_view(data, (data.shape[0], -1, flat_step))
         delta = np.std(data, axis=-1).min(-1)  # min std across segments
 
@@ -2816,50 +3016,81 @@ def find_bad_channels_maxwell(
                 "properly process all segments."
             )
             break  # no reason to continue
-        # Bad pass
-        chunk_noisy = list()
-        params["st_duration"] = int(round(chunk_raw.times[-1] * raw.info["sfreq"]))
-        for n_iter in range(1, 101):  # iteratively exclude the worst ones
-            assert set(raw.info["bads"]) & set(chunk_noisy) == set()
-            params["good_mask"][:] = [
-                chunk_raw.ch_names[pick]
-                not in raw.info["bads"] + chunk_noisy + chunk_flats
-                for pick in params["meg_picks"]
-            ]
-            chunk_raw._data[:] = orig_data
-            delta = chunk_raw.get_data(these_picks)
-            with use_log_level(_verbose_safe_false()):
-                _run_maxwell_filter(chunk_raw, copy=False, **params)
+        if len(chunk_flats):
+            logger.info(
+                "            Flat (%2d): %s", len(chunk_flats), " ".join(chunk_flats)
+            )
+        segments.append(
+            dict(
+                si=si,
+                start=start,
+                stop=stop,
+                picks=these_picks,
+                exclude=raw.info["bads"] + chunk_flats,
+                noisy=list(),
+            )
+        )
 
-            if n_iter == 1 and len(chunk_flats):
-                logger.info(
-                    "            Flat (%2d): %s",
-                    len(chunk_flats),
-                    " ".join(chunk_flats),
+    # Bad pass: iteratively exclude the worst channel of each segment. The
+    # decompositions only depend on the channels used (and head position), so
+    # they are reused across iterations and segments
+    get_decomp = params["_get_this_decomp_trans"]
+    decomps = dict()
+
+    def _get_this_decomp_trans(trans, *, t):
+        key = _sss_cache.hash(params["good_mask"], trans)
+        if key not in decomps:
+            decomps[key] = get_decomp(trans, t=t)
+        return decomps[key]
+
+    params["_get_this_decomp_trans"] = _get_this_decomp_trans
+    meg_picks = params["meg_picks"]
+    n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+    for n_iter in range(1, 101):
+        # Segments that exclude the same channels are evaluated together
+        groups = dict()
+        for seg in segments:
+            assert set(raw.info["bads"]) & set(seg["noisy"]) == set()
+            exclude = seg["exclude"] + seg["noisy"]
+            good_mask = np.array(
+                [raw.ch_names[pick] not in exclude for pick in meg_picks]
+            )
+            groups.setdefault(good_mask.tobytes(), (good_mask, list()))[1].append(seg)
+        for good_mask, group in groups.values():
+            params["good_mask"][:] = good_mask
+            for seg, delta in _find_bads_deltas(raw, group, params, n_jobs):
+                # p2p
+                these_picks = seg["picks"]
+                range_ = np.ptp(delta, axis=-1)
+                cs_picks = np.searchsorted(meg_picks, these_picks)
+                range_ *= params["coil_scale"][cs_picks, 0]
+                mean, std = np.mean(range_), np.std(range_)
+                # z score
+                z = (range_ - mean) / std
+                idx = np.argmax(z)
+                max_ = z[idx]
+
+                # We may want to return this later if `return_scores=True`.
+                scores_noisy[these_picks, seg["si"]] = z
+                thresh_noisy[these_picks] = limit
+
+                if max_ < limit:
+                    seg["done"] = True
+                    continue
+
+                name = raw.ch_names[these_picks[idx]]
+                logger.debug(
+                    f"            Bad:       {name} {max_:0.1f} "
+                    f"(interval {seg['si'] + 1})"
                 )
-            delta -= chunk_raw.get_data(these_picks)
-            # p2p
-            range_ = np.ptp(delta, axis=-1)
-            cs_picks = np.searchsorted(params["meg_picks"], these_picks)
-            range_ *= params["coil_scale"][cs_picks, 0]
-            mean, std = np.mean(range_), np.std(range_)
-            # z score
-            z = (range_ - mean) / std
-            idx = np.argmax(z)
-            max_ = z[idx]
-
-            # We may want to return this later if `return_scores=True`.
-            scores_noisy[these_picks, si] = z
-            thresh_noisy[these_picks] = limit
-
-            if max_ < limit:
-                break
-
-            name = raw.ch_names[these_picks[idx]]
-            logger.debug(f"            Bad:       {name} {max_:0.1f}")
-            these_picks.pop(idx)
-            chunk_noisy.append(name)
-        noisy_chs.update(chunk_noisy)
+                these_picks.pop(idx)
+                seg["noisy"].append(name)
+        for seg in segments:
+            if seg.get("done") or n_iter == 100:
+                noisy_chs.update(seg["noisy"])
+        segments = [seg for seg in segments if not seg.get("done")]
+        if not segments:
+            break
     noisy_chs = sorted(
         (b for b, c in noisy_chs.items() if c >= min_count),
         key=lambda x: raw.ch_names.index(x),
@@ -2896,6 +3127,72 @@ def find_bad_channels_maxwell(
         return noisy_chs, flat_chs
 
 
+def _find_bads_deltas(raw, segments, params, n_jobs):
+    """Yield the Maxwell filtering residuals of segments with the same picks."""
+    meg_picks, good_mask, mc = params["meg_picks"], params["good_mask"], params["mc"]
+    good_picks = meg_picks[good_mask]
+    if len(mc.pos[1]) > 1:  # movement compensation, process each separately
+        for seg in segments:
+            start, stop = seg["start"], seg["stop"]
+            chunk_raw = RawArray(
+                raw.get_data(None, start, stop, verbose=False),
+                params["info"],
+                first_samp=raw.first_samp + start,
+                copy="data",
+                verbose=False,
+            )
+            params["st_duration"] = stop - start - 1
+            delta = chunk_raw.get_data(good_picks)
+            with use_log_level(_verbose_safe_false()):
+                _run_maxwell_filter(chunk_raw, copy=False, **params)
+            delta -= chunk_raw.get_data(good_picks)
+            yield seg, delta
+        return
+
+    # Otherwise a single operator applies to all samples, so evaluate blocks of
+    # segments at once
+    mc.initialize(
+        params["_get_this_decomp_trans"],
+        params["info"]["dev_head_t"],
+        params["S_recon"],
+    )
+    op_sss = mc.get_decomp_by_offset(mc.pos[1][0])[0][good_mask]
+    ctc = params["ctc"]
+    if ctc is not None:
+        ctc = ctc[good_mask][:, good_mask]
+    lens = np.array([seg["stop"] - seg["start"] for seg in segments])
+    # use at most ~100 MB of data per block
+    n_blocks = max(int(np.ceil(16 * len(good_picks) * lens.sum() / 100e6)), n_jobs)
+    blocks = np.array_split(np.arange(len(segments)), min(n_blocks, len(segments)))
+
+    def _residual(data):
+        data -= op_sss @ (data if ctc is None else ctc.dot(data))
+        return data
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        # read in this thread, and only n_jobs blocks at a time
+        for bi in range(0, len(blocks), n_jobs):
+            these_blocks = blocks[bi : bi + n_jobs]
+            datas = [
+                np.concatenate(
+                    [
+                        raw.get_data(
+                            good_picks,
+                            segments[ii]["start"],
+                            segments[ii]["stop"],
+                            verbose=False,
+                        )
+                        for ii in block
+                    ],
+                    axis=1,
+                )
+                for block in these_blocks
+            ]
+            for block, data in zip(these_blocks, pool.map(_residual, datas)):
+                deltas = np.split(data, np.cumsum(lens[block])[:-1], axis=1)
+                yield from zip([segments[ii] for ii in block], deltas)
+
+
 def _read_cross_talk(cross_talk, ch_names):
     sss_ctc = dict()
     ctc = None
@@ -2,6 +2,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import os
 import pathlib
 import re
 from contextlib import contextmanager
@@ -32,8 +33,10 @@ from mne.io import (
 from mne.preprocessing import (
     annotate_amplitude,
     annotate_movement,
+    clear_maxwell_cache,
     compute_maxwell_basis,
     find_bad_channels_maxwell,
+    get_maxwell_cache_info,
     maxwell_filter_prepare_emptyroom,
 )
 from mne.preprocessing import (
@@ -42,12 +45,14 @@ from mne.preprocessing import (
 from mne.preprocessing.maxwell import (
     _bases_complex_to_real,
     _bases_real_to_complex,
+    _get_cached_sss,
     _get_n_moments,
     _prep_mf_coils,
     _sh_complex_to_real,
     _sh_negate,
     _sh_real_to_complex,
     _sss_basis_basic,
+    _sss_cache,
     _trans_sss_basis,
 )
 from mne.rank import _compute_rank_int, _get_rank_sss, compute_rank
@@ -775,6 +780,21 @@ def test_st_overlap():
     _assert_shielding(raw_tsss, power, 35.6, max_factor=35.7)
 
 
+@pytest.mark.slowtest
+@testing.requires_testing_data
+@pytest.mark.parametrize("st_fixed", (True, False))
+@pytest.mark.filterwarnings("ignore:st_fixed=False is untested.*:RuntimeWarning")
+def test_st_n_jobs(st_fixed):
+    """Test that tSSS windows processed in threads give identical results."""
+    raw = read_crop(raw_fname, (0, 3.0)).load_data()
+    raw.pick("mag")
+    head_pos = read_head_pos(pos_fname)
+    kwargs = dict(int_order=3, st_duration=1, st_fixed=st_fixed, head_pos=head_pos)
+    want = _maxwell_filter_ola(raw, **kwargs).get_data()
+    got = _maxwell_filter_ola(raw, n_jobs=2, **kwargs).get_data()
+    assert_array_equal(got, want)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_spatiotemporal_only():
@@ -1838,9 +1858,17 @@ def test_find_bads_maxwell_flat():
     # See gh-9479
     raw = mne.io.read_raw_fif(raw_small_fname).load_data()
     assert_allclose(raw.times[-1], 23.97, atol=1e-2)
-    noisy, flat = find_bad_channels_maxwell(raw, min_count=1)
+    noisy, flat, scores = find_bad_channels_maxwell(
+        raw, min_count=1, return_scores=True
+    )
     assert noisy == ["MEG 1032", "MEG 2313", "MEG 2443"]
     assert flat == []
+    # segments are evaluated together, which threading should not change
+    noisy_2, flat_2, scores_2 = find_bad_channels_maxwell(
+        raw, min_count=1, return_scores=True, n_jobs=2
+    )
+    assert (noisy_2, flat_2) == (noisy, flat)
+    assert_allclose(scores_2["scores_noisy"], scores["scores_noisy"])
     n = int(round(raw.info["sfreq"] * 10))
     assert (len(raw.times) - n) / raw.info["sfreq"] > 10  # at least 10 s
     with catch_logging() as log:
@@ -1906,6 +1934,83 @@ def test_compute_maxwell_basis(regularize, n, int_order):
     assert_allclose(got, want, atol=1e-16)
 
 
+def test_maxwell_cache(tmp_path, monkeypatch):
+    """Test the on-disk cache of SSS bases."""
+    raw = read_raw_fif(raw_small_fname).crop(0, 1).load_data()
+    raw.del_proj()
+    raw.info["bads"] = ["MEG 2443"]
+    kwargs = dict(regularize="in", origin=(0.0, 0.0, 0.04))
+    want = maxwell_filter(raw, **kwargs).get_data()
+    want_basis = compute_maxwell_basis(raw.info, **kwargs)
+    cache_dir = tmp_path / "sss"
+    monkeypatch.setenv("MNE_MAXWELL_CACHE_DIR", str(cache_dir))
+    stats = _sss_cache.stats.copy()
+    got = maxwell_filter(raw, **kwargs).get_data()
+    assert_array_equal(got, want)
+    n_miss = _sss_cache.stats["misses"] - stats["misses"]
+    assert n_miss > 0
+    assert _sss_cache.stats["hits"] == stats["hits"]
+    assert len(list(cache_dir.glob("*-sss.npz"))) == n_miss
+    # second run reads everything from the cache (and gives the same result)
+    got = maxwell_filter(raw, **kwargs).get_data()
+    assert_array_equal(got, want)
+    assert _sss_cache.stats["hits"] - stats["hits"] == n_miss
+    assert _sss_cache.stats["misses"] - stats["misses"] == n_miss
+    compute_maxwell_basis(raw.info, **kwargs)
+    hits = _sss_cache.stats["hits"]
+    basis = compute_maxwell_basis(raw.info, **kwargs)
+    assert _sss_cache.stats["hits"] == hits + 1
+    for b, w in zip(basis, want_basis):
+        assert_array_equal(b, w)
+    # other parameters (or a corrupted cache) lead to recomputation
+    for fname in cache_dir.glob("*-sss.npz"):
+        fname.write_bytes(b"foo")
+    misses = _sss_cache.stats["misses"]
+    find_bad_channels_maxwell(raw, duration=0.5, **kwargs)
+    assert _sss_cache.stats["misses"] > misses
+    misses = _sss_cache.stats["misses"]
+    maxwell_filter(raw, regularize="in", origin=(0.0, 0.0, 0.05))
+    assert _sss_cache.stats["misses"] > misses
+    info = get_maxwell_cache_info()
+    assert info["cache_dir"] == cache_dir
+    assert info["n_files"] == len(list(cache_dir.glob("*-sss.npz"))) > 0
+    clear_maxwell_cache()
+    assert get_maxwell_cache_info() == dict(
+        cache_dir=cache_dir, n_files=0, size=0, hits=0, misses=0
+    )
+
+
+def test_maxwell_cache_size(tmp_path, monkeypatch):
+    """Test the size limit of the on-disk cache of SSS bases."""
+    out = _get_cached_sss("test", lambda: [np.arange(3.0), 1.5], 0, cache_dir=None)
+    assert isinstance(out, tuple)
+    cache_dir = tmp_path / "sss"
+    for ii in range(3):
+        out = _get_cached_sss(
+            "test", lambda: [np.arange(3.0) + ii, 1.5], ii, cache_dir=cache_dir
+        )
+        assert isinstance(out, tuple)
+        for fname in cache_dir.glob("*-sss.npz"):  # make the order well defined
+            os.utime(fname, (fname.stat().st_mtime - 10,) * 2)
+        if ii == 0:  # room for two files
+            size = 2.5 * fname.stat().st_size
+            monkeypatch.setenv("MNE_DISK_CACHE_SIZE", str(size / 1e6))
+    assert len(list(cache_dir.glob("*-sss.npz"))) == 2
+    # hits return the same type and mark the file as recently used
+    hits = _sss_cache.stats["hits"]
+    out = _get_cached_sss("test", lambda: None, 1, cache_dir=cache_dir)
+    assert _sss_cache.stats["hits"] == hits + 1
+    assert isinstance(out, tuple)
+    assert_array_equal(out[0], np.arange(3.0) + 1)
+    assert out[1] == 1.5
+    _get_cached_sss("test", lambda: (np.zeros(1),), 3, cache_dir=cache_dir)
+    misses = _sss_cache.stats["misses"]  # 2 was evicted, not 1
+    _get_cached_sss("test", lambda: (np.zeros(1),), 1, cache_dir=cache_dir)
+    assert _sss_cache.stats["misses"] == misses
+    _get_cached_sss("test", lambda: (np.zeros(1),), 2, cache_dir=cache_dir)
+    assert _sss_cache.stats["misses"] == misses + 1
+
+
 @testing.requires_testing_data
 @pytest.mark.parametrize("bads", ("from_raw", "union", "keep"))
 def test_prepare_emptyroom_bads(bads):
@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 import re
+import tracemalloc
 from copy import deepcopy
 from os import makedirs
 from pathlib import Path
@@ -32,9 +33,13 @@ from mne.bem import (
     _assert_inside,
     _bem_find_surface,
     _check_surface_size,
+    _fwd_bem_lin_pot_coeff,
+    _fwd_bem_multi_solution,
     _get_ico_map,
     _ico_downsample,
+    _lin_pot_coeff,
     _order_surfaces,
+    _surfaces_to_bem,
     distance_to_bem,
     fit_sphere_to_headshape,
     make_scalp_surfaces,
@@ -326,6 +331,61 @@ def test_bem_solution(tmp_path, cond, fname):
     _compare_bem_solutions(solution_read, solution)
 
 
+def _sphere_bem_surfs(grade):
+    """Make three concentric spheres as BEM surfaces."""
+    surfs = list()
+    for rad in (0.09, 0.085, 0.08):
+        surf = _get_ico_surface(grade)
+        surf["rr"] *= rad
+        surfs.append(surf)
+    ids = [
+        FIFF.FIFFV_BEM_SURF_ID_HEAD,
+        FIFF.FIFFV_BEM_SURF_ID_SKULL,
+        FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+    ]
+    return _surfaces_to_bem(surfs, ids, [0.3, 0.006, 0.3], rescale=False)
+
+
+def test_bem_lin_pot_coeff():
+    """Test blocked computation of BEM coefficients and in-place inversion."""
+    bem = make_bem_solution(_sphere_bem_surfs(2))
+    surfs = bem["surfs"]
+    coeff = _fwd_bem_lin_pot_coeff(surfs)
+    assert_equal(coeff, _fwd_bem_lin_pot_coeff(surfs, n_jobs=2))
+    # compare to one triangle at a time for a pair of surfaces
+    surf1, surf2 = surfs[0], surfs[2]
+    want = np.zeros((surf1["np"], surf2["np"]))
+    for tri, tri_nn, tri_area in zip(surf2["tris"], surf2["tri_nn"], surf2["tri_area"]):
+        want[:, tri] -= _lin_pot_coeff(surf1["rr"], surf2["rr"][tri], tri_nn, tri_area)
+    assert_allclose(coeff[: surf1["np"], -surf2["np"] :], want, rtol=1e-12)
+    # the inversion overwrites the input
+    nps = [surf["np"] for surf in surfs]
+    sol = _fwd_bem_multi_solution(coeff, bem["gamma"], nps)
+    assert np.shares_memory(sol, coeff)
+    assert sol.flags.c_contiguous
+    want = np.eye(len(sol)) - _fwd_bem_lin_pot_coeff(surfs) / (2 * np.pi) * np.repeat(
+        np.repeat(bem["gamma"], nps, axis=0), nps, axis=1
+    )
+    want = np.linalg.inv(want + 1.0 / len(sol))
+    assert_allclose(sol, want, rtol=1e-10, atol=1e-10 * np.abs(want).max())
+
+
+@pytest.mark.slowtest
+def test_bem_solution_memory():
+    """Test the peak memory usage of computing a BEM solution."""
+    surfs = _sphere_bem_surfs(3)
+    tracemalloc.start()
+    try:
+        bem = make_bem_solution(surfs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # the coefficient matrix becomes the solution, plus small temporaries
+    # (e.g., the IP approach block and the tiles of coefficients)
+    assert bem["solution"].shape == (1926, 1926)
+    assert peak < 1.6 * bem["solution"].nbytes
+
+
 def test_fit_sphere_to_headshape():
     """Test fitting a sphere to digitization points."""
     # Create points of various kinds
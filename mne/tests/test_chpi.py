@@ -15,8 +15,12 @@ from mne._fiff.constants import FIFF
 from mne.chpi import (
     _chpi_locs_to_times_dig,
     _compute_good_distances,
+    _fit_chpi_amplitudes,
+    _fit_chpi_amplitudes_batch,
+    _get_chpi_batches,
     _get_hpi_initial_fit,
     _setup_ext_proj,
+    _setup_hpi_amplitude_fitting,
     compute_chpi_amplitudes,
     compute_chpi_locs,
     compute_chpi_snr,
@@ -421,6 +425,46 @@ def test_calculate_chpi_snr():
     assert result["grad_snr"][n_nan:].max() < 40
 
 
+@testing.requires_testing_data
+@pytest.mark.parametrize("snr", (False, True))
+def test_chpi_amplitudes_batch(snr):
+    """Test that batched cHPI fits match the per-window ones."""
+    raw = read_raw_fif(chpi_fif_fname, allow_maxshield="yes").crop(0, 3).load_data()
+    # include handling of NaN (when cHPI was off at the beginning)
+    raw._data[raw.ch_names.index("STI201"), : int(round(raw.info["sfreq"]))] = 0
+    hpi = _setup_hpi_amplitude_fitting(raw.info, "auto")
+    starts = np.arange(0, len(raw.times) - hpi["n_window"], 37)
+    fits = _fit_chpi_amplitudes_batch(raw, starts, hpi, snr)
+    assert len(fits) == len(starts)
+    n_nan = 0
+    for start, fit in zip(starts, fits):
+        time_sl = slice(start, start + hpi["n_window"])
+        want = _fit_chpi_amplitudes(raw, time_sl, hpi, snr)
+        if want is None:
+            assert np.isnan(fit).all()
+            n_nan += 1
+        else:
+            assert_allclose(fit, want, rtol=1e-6)
+    assert 0 < n_nan < len(starts)
+
+
+@pytest.mark.parametrize("step", (1, 37, 1900))
+def test_chpi_batches(step):
+    """Test that cHPI batches are sized by the span of data they read."""
+    n_window, max_samples = 200, 2000
+    starts = np.arange(-100, 5000, step)
+    batches = _get_chpi_batches(starts, n_window, max_samples)
+    assert_array_equal(np.concatenate(batches), np.arange(len(starts)))
+    for idx in batches:
+        span = starts[idx[-1]] - starts[idx[0]] + n_window
+        assert span + len(idx) * n_window <= max_samples or len(idx) == 1
+        if idx[-1] + 1 < len(starts):  # the next window would not fit
+            span = starts[idx[-1] + 1] - starts[idx[0]] + n_window
+            assert span + (len(idx) + 1) * n_window > max_samples
+    if step == 1900:  # each pair of windows is too long
+        assert all(len(idx) == 1 for idx in batches)
+
+
 @testing.requires_testing_data
 @pytest.mark.slowtest
 def test_calculate_chpi_positions_artemis():
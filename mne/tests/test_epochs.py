@@ -26,6 +26,7 @@ from mne import (
     Annotations,
     Epochs,
     combine_evoked,
+    compute_covariance,
     create_info,
     equalize_channels,
     make_fixed_length_epochs,
@@ -1390,6 +1391,108 @@ def test_epochs_io_proj(tmp_path, proj):
     del epochs_copy
 
 
+def test_epochs_fif_batched_read(tmp_path):
+    """Test reading random subsets of non-preloaded epochs in batches."""
+    raw, events, picks = _get_data()
+    epochs = Epochs(raw, events[:20], tmin=-0.2, tmax=0.5, picks=picks)
+    temp_fname = tmp_path / "test-epo.fif"
+    epochs.save(temp_fname, split_size="6MB")
+    epochs_full = read_epochs(temp_fname, preload=True)
+    epochs_read = read_epochs(temp_fname, preload=False)
+    assert len(epochs_read._raw) > 1
+    want = epochs_full.get_data()
+    # unsorted, non-contiguous, spanning split files
+    idx = [17, 3, 4, 5, 0, 11, 12, 1]
+    assert_array_equal(epochs_read[idx].get_data(), want[idx])
+    # duplicates must not share memory
+    out = epochs_read._get_epochs_from_raw([2, 2, 3])
+    assert not np.shares_memory(out[0], out[1])
+    assert_array_equal(out[0], out[1])
+    assert_array_equal(epochs_read._get_epoch_from_raw(3), out[2])
+    assert_array_equal(epochs_read.get_data(), want)
+
+
+@pytest.mark.parametrize("proj", (True, False, "delayed"))
+def test_epochs_from_preloaded_raw_batched(proj):
+    """Test that epochs gathered at once from preloaded Raw match."""
+    raw, events, picks = _get_data()
+    raw_pre = raw.copy().load_data()
+    # one bad annotation, so that some batches need the per-epoch path
+    onset = (events[5, 0] - raw.first_samp) / raw.info["sfreq"]
+    for r in (raw, raw_pre):
+        r.set_annotations(Annotations([onset], [0.1], ["bad_test"]))
+        with r.info._unlock():
+            r.info["lowpass"] = 40.0  # suppress aliasing warnings
+    kwargs = dict(
+        tmin=-0.2,
+        tmax=0.5,
+        picks=picks,
+        proj=proj,
+        reject=reject,
+        flat=flat,
+        reject_tmax=0.3,
+        detrend=1,
+        decim=2,
+    )
+    epochs = Epochs(raw, events, preload=True, **kwargs)
+    epochs_pre = Epochs(raw_pre, events, preload=True, **kwargs)
+    assert len(epochs_pre) < len(events)
+    assert epochs_pre.drop_log == epochs.drop_log
+    assert_array_equal(epochs_pre.selection, epochs.selection)
+    assert_allclose(epochs_pre.get_data(), epochs.get_data(), rtol=1e-10, atol=0)
+    # all at once, including epochs that do not fit in the data
+    raw_pre.set_annotations(None)
+    events_out = np.concatenate([events, [[raw.last_samp, 0, 1]]])
+    epochs_pre = Epochs(raw_pre, events_out, preload=True, **kwargs)
+    assert epochs_pre.drop_log[-1] == ("TOO_SHORT",)
+
+
+def test_drop_bad_preloaded():
+    """Test dropping bad epochs after preloading."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 1000.0, "eeg")
+    data = rng.standard_normal((10, 3, 100)) * 1e-4
+    data[[2, 7], 1] *= 100
+    epochs = EpochsArray(data.copy(), info)
+    epochs.drop_bad(reject=dict(eeg=1e-2))
+    assert_array_equal(epochs.selection, [0, 1, 3, 4, 5, 6, 8, 9])
+    assert epochs.drop_log[2] == ("1",)
+    assert_array_equal(epochs.get_data(), data[epochs.selection])
+    # from preloaded Raw, with a rejection criterion applied later
+    raw, events, picks = _get_data(preload=True)
+    epochs = Epochs(raw, events, picks=picks, preload=True, reject=None)
+    epochs_lazy = Epochs(raw, events, picks=picks, reject=reject, flat=flat)
+    epochs.drop_bad(reject=reject, flat=flat)
+    epochs_lazy.drop_bad()
+    assert epochs.drop_log == epochs_lazy.drop_log
+    assert_allclose(epochs.get_data(), epochs_lazy.get_data(), rtol=1e-10, atol=0)
+
+
+@pytest.mark.parametrize("preload", (False, True))
+def test_epochs_single_precision(monkeypatch, preload):
+    """Test epoching single-precision data."""
+    rng = np.random.RandomState(0)
+    info = create_info(5, 1000.0, "eeg")
+    raw = RawArray(rng.randn(5, 10000) * 1e-5, info)
+    raw.set_eeg_reference(projection=True)
+    events = make_fixed_length_events(raw, duration=0.5)
+    kwargs = dict(tmin=-0.1, tmax=0.3, preload=True)
+    epochs_64 = Epochs(raw, events, **kwargs)
+    if preload:
+        raw_32 = raw.copy().load_data(dtype="float32")
+    else:
+        raw_32 = raw
+        monkeypatch.setenv("MNE_DATA_DTYPE", "float32")
+    epochs_32 = Epochs(raw_32, events, **kwargs)
+    assert epochs_32._data.dtype == np.float32
+    assert_allclose(epochs_32.get_data(), epochs_64.get_data(), rtol=1e-5, atol=1e-11)
+    assert epochs_32.compute_psd().get_data().dtype == np.float32
+    # covariance is estimated in double precision
+    cov_32 = compute_covariance(epochs_32)
+    assert cov_32.data.dtype == np.float64
+    assert_allclose(cov_32.data, compute_covariance(epochs_64).data, rtol=1e-5)
+
+
 @pytest.mark.slowtest
 @pytest.mark.parametrize("preload", (False, True))
 def test_epochs_io_preload(tmp_path, preload):
@@ -4533,6 +4636,34 @@ def test_average_methods():
     assert_array_equal(ev[1].data, np.mean(data[-2:], axis=0))
 
 
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_average_streaming(proj):
+    """Test single-pass averaging of non-preloaded epochs by event type."""
+    raw, events, picks = _get_data()
+    event_id = {"a/1": 1, "a/2": 2, "b/1": 3, "b/2": 4}
+    kwargs = dict(picks=picks, proj=proj, reject=reject, baseline=(None, 0))
+    epochs = Epochs(raw, events, event_id, preload=False, **kwargs)
+    epochs_pre = Epochs(raw, events, event_id, preload=True, **kwargs)
+    for method in ("mean", "std"):
+        evokeds = epochs.average(method=method, by_event_type=True)
+        evokeds_pre = epochs_pre.average(method=method, by_event_type=True)
+        assert len(evokeds) == len(event_id)
+        for ev, ev_pre in zip(evokeds, evokeds_pre):
+            assert ev.comment == ev_pre.comment
+            assert ev.nave == ev_pre.nave
+            assert ev.kind == ev_pre.kind
+            assert_allclose(ev.data, ev_pre.data, rtol=1e-7, atol=1e-20)
+        ev = epochs.average(method=method)
+        ev_pre = epochs_pre.average(method=method)
+        assert ev.nave == ev_pre.nave
+        assert_allclose(ev.data, ev_pre.data, rtol=1e-7, atol=1e-20)
+    # the mean is the same as when summing the epochs
+    data = [e for e in epochs]
+    want = np.sum(data, axis=0) / len(data)
+    assert_array_equal(epochs.average(picks="all").data, want)
+    assert not epochs.preload
+
+
 @pytest.mark.parametrize("relative", (True, False))
 def test_shift_time(relative):
     """Test the timeshift method."""
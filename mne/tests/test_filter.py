@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from copy import deepcopy
+
 import numpy as np
 import pytest
 from numpy.fft import fft, fftfreq
@@ -18,16 +20,19 @@ from scipy.signal import resample as sp_resample
 from mne import Epochs, create_info
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
+    CausalFilter,
     _length_factors,
     _overlap_add_filter,
     _resample_stim_channels,
     _smart_pad,
+    clear_filter_cache,
     construct_iir_filter,
     create_filter,
     design_mne_c_filter,
     detrend,
     estimate_ringing_samples,
     filter_data,
+    get_filter_cache_info,
     notch_filter,
     resample,
 )
@@ -370,6 +375,38 @@ def test_notch_filters(method, filter_length, line_freq, tol):
     assert_almost_equal(new_power, orig_power, tol)
 
 
+@pytest.mark.parametrize("line_freq", [None, line_freqs])
+def test_notch_spectrum_fit_channels(line_freq):
+    """Test that spectrum_fit notch filtering treats channels independently."""
+    rng = np.random.RandomState(0)
+    sfreq = 487.0
+    t = np.arange(int(round(12 * sfreq))) / sfreq
+    x = rng.randn(4, len(t))
+    x += rng.uniform(0.5, 2, (4, 1)) * np.sin(2 * np.pi * 60 * t)
+    x[1] += np.sin(2 * np.pi * 120 * t + 1.0)
+    kwargs = dict(method="spectrum_fit", filter_length="5s")
+    clear_filter_cache()
+    with catch_logging() as log:
+        y = notch_filter(x, sfreq, line_freq, verbose=True, **kwargs)
+    # the DPSS tapers are computed once per window length
+    assert get_filter_cache_info()["misses"] == 2  # regular and last window
+    log = log.getvalue()
+    assert "60.00 :   12 windows" in log
+    if line_freq is None:
+        assert "120.00 :    3 windows" in log  # only in one channel
+    for ii in range(len(x)):
+        assert_allclose(
+            notch_filter(x[ii], sfreq, line_freq, **kwargs), y[ii], atol=1e-12
+        )
+    info = get_filter_cache_info()
+    assert info["misses"] == 2
+    assert info["hits"] == 2 * len(x)
+    assert_allclose(notch_filter(x, sfreq, line_freq, n_jobs=2, **kwargs), y)
+    y_pick = notch_filter(x, sfreq, line_freq, picks=[1, 3], **kwargs)
+    assert_array_equal(y_pick[[0, 2]], x[[0, 2]])
+    assert_allclose(y_pick[[1, 3]], y[[1, 3]], atol=1e-12)
+
+
 @resample_method_parametrize
 def test_resample(method):
     """Test resampling."""
@@ -754,6 +791,65 @@ def test_filters():
     assert len(h) == 8193  # next power of two
 
 
+def test_filter_cache(monkeypatch):
+    """Test the cache of filter designs."""
+    rng = np.random.RandomState(0)
+    sfreq = 1000.0
+    x = rng.randn(2, 5000)
+    kwargs = dict(sfreq=sfreq, l_freq=1.0, h_freq=40.0, fir_design="firwin")
+    clear_filter_cache()
+    assert get_filter_cache_info()["n_entries"] == 0
+    h = create_filter(x, **kwargs)
+    info = get_filter_cache_info()
+    assert info["hits"] == 0
+    assert info["misses"] == 1
+    assert h.flags.writeable
+    h[:] = 0  # does not affect the cached kernel
+    h_2 = create_filter(x, **kwargs)
+    assert h_2 is not h
+    assert get_filter_cache_info()["hits"] == 1
+    assert_array_equal(h_2, create_filter(x, **kwargs))
+    assert np.any(h_2)
+    h = h_2
+    # filtering also caches the kernel FFT
+    y = filter_data(x, **kwargs)
+    n_entries = get_filter_cache_info()["n_entries"]
+    assert n_entries == 2
+    assert_array_equal(filter_data(x, **kwargs), y)
+    assert get_filter_cache_info()["n_entries"] == n_entries
+    # IIR coefficients and ringing estimates
+    iir_params = dict(order=4, ftype="butter")
+    iir = construct_iir_filter(iir_params, 40.0, None, sfreq, "low")
+    hits = get_filter_cache_info()["hits"]
+    iir_2 = construct_iir_filter(iir_params, 40.0, None, sfreq, "low")
+    assert get_filter_cache_info()["hits"] == hits + 2  # coefficients, ringing
+    assert_array_equal(iir_2["sos"], iir["sos"])
+    assert iir_2["sos"].flags.writeable
+    assert iir_2["padlen"] == iir["padlen"]
+    assert "sos" not in iir_params
+    # the size is looked up once, and again after clearing the cache
+    keys = list()
+
+    def _get_config(key, default=None):
+        keys.append(key)
+        return "0" if key == "MNE_FILTER_CACHE_SIZE" else default
+
+    monkeypatch.setattr("mne.filter.get_config", _get_config)
+    filter_data(x, **kwargs)
+    assert keys == []
+    assert get_filter_cache_info()["max_size"] == 128
+    # disabled
+    clear_filter_cache()
+    h_3 = create_filter(x, **kwargs)
+    create_filter(x, **kwargs)
+    assert keys == ["MNE_FILTER_CACHE_SIZE"]
+    assert h_3.flags.writeable
+    assert_array_equal(h_3, h)
+    info = get_filter_cache_info()
+    assert info["max_size"] == 0
+    assert info["n_entries"] == info["hits"] == info["misses"] == 0
+
+
 def test_filter_auto():
     """Test filter auto parameters."""
     # test that our overlap-add filtering doesn't introduce strange
@@ -787,7 +883,7 @@ def test_filter_auto():
     pytest.raises(ValueError, filter_data, x, -sfreq, 1, 10)
     pytest.raises(ValueError, filter_data, x, sfreq, 1, sfreq * 0.75)
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
-        filter_data(x.astype(np.float32), sfreq, None, 10)
+        filter_data(x.astype(np.float16), sfreq, None, 10)
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
         filter_data([1j], 1000.0, None, 40.0)
     with pytest.raises(TypeError, match="instance of ndarray"):
@@ -1107,6 +1203,88 @@ def test_filter_minimum_phase_bug():
     assert not (dB_min_half < -30).all()
 
 
+@pytest.mark.parametrize(
+    "method, phase",
+    [("fir", "zero"), ("fir", "minimum"), ("iir", "zero"), ("iir", "forward")],
+)
+@pytest.mark.parametrize("pad", ("reflect_limited", "edge"))
+def test_filter_blocks(method, phase, pad, monkeypatch):
+    """Test that filtering blocks of channels matches channel by channel."""
+    rng = np.random.RandomState(0)
+    sfreq = 250.0
+    x = rng.randn(5, 2000)
+    kwargs = dict(sfreq=sfreq, l_freq=1.0, h_freq=30.0, method=method, phase=phase)
+    if method == "fir":
+        kwargs["pad"] = pad
+    want = np.array([filter_data(xx, **kwargs) for xx in x])
+    # 2D padding matches 1D padding of each row
+    x_pad = _smart_pad(x, (300, 2500), pad)
+    assert_array_equal(x_pad, [_smart_pad(xx, (300, 2500), pad) for xx in x])
+    for n_jobs in (1, 2):
+        assert_allclose(filter_data(x, n_jobs=n_jobs, **kwargs), want, atol=1e-12)
+    # FIR filtering uses blocks only with n_jobs > 1 and enough data
+    blocks = list()
+    monkeypatch.setattr(
+        "mne.filter._get_filter_blocks",
+        lambda picks, row_nbytes, n_blocks=1: blocks.append(picks) or [picks],
+    )
+    filter_data(x, n_jobs=2, **kwargs)
+    assert len(blocks) == (method == "iir")
+    monkeypatch.setattr("mne.filter._FIR_BLOCK_MIN_SIZE", 0)
+    assert_allclose(filter_data(x, n_jobs=1, **kwargs), want, atol=1e-12)
+    assert len(blocks) == 2 * (method == "iir")
+    assert_allclose(filter_data(x, n_jobs=2, **kwargs), want, atol=1e-12)
+    assert len(blocks) == 2 * (method == "iir") + 1
+    # blocks of one channel each
+    monkeypatch.setattr(
+        "mne.filter._get_filter_blocks",
+        lambda picks, row_nbytes, n_blocks=1: [[p] for p in picks],
+    )
+    assert_allclose(filter_data(x, n_jobs=2, **kwargs), want, atol=1e-12)
+    # picks
+    out = filter_data(x, picks=[1, 3], **kwargs)
+    assert_allclose(out[[1, 3]], want[[1, 3]], atol=1e-12)
+    assert_array_equal(out[[0, 2, 4]], x[[0, 2, 4]])
+
+
+@pytest.mark.parametrize(
+    "method, phase, output",
+    [("fir", "minimum", None), ("iir", "forward", "sos"), ("iir", "forward", "ba")],
+)
+def test_causal_filter(method, phase, output):
+    """Test filtering chunks with a CausalFilter."""
+    rng = np.random.RandomState(0)
+    sfreq = 250.0
+    x = rng.randn(2, 3, 3000)
+    kwargs = dict(sfreq=sfreq, l_freq=1.0, h_freq=30.0, method=method, phase=phase)
+    if method == "fir":
+        kwargs["pad"] = "constant"
+    else:
+        kwargs["iir_params"] = dict(order=4, ftype="butter", output=output)
+    want = filter_data(x, **kwargs)
+    kwargs.pop("pad", None)
+    filt = CausalFilter(create_filter(x, **kwargs))
+    # chunks that are empty, shorter and longer than the filter
+    bounds = [0, 0, 1, 10, 10, 500, 2900, 3000]
+    for _ in range(2):
+        got = [filt.process(x[..., a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        assert got[0].shape == (2, 3, 0)
+        assert_allclose(np.concatenate(got, axis=-1), want, atol=1e-12)
+        assert "3000 samples processed" in repr(filt)
+        filt.reset()
+    # the state depends on the previous chunks
+    filt.process(x[..., :100])
+    y = filt.process(x[..., 100:200])
+    assert not np.allclose(y, deepcopy(filt).reset().process(x[..., 100:200]))
+    with pytest.raises(ValueError, match="like the previous chunks"):
+        filt.process(x[0, :, :10])
+    assert filt.reset().process(x[0, 0]).shape == (3000,)
+    with pytest.raises(ValueError, match="must contain"):
+        CausalFilter(dict(padlen=0))
+    with pytest.raises(ValueError, match="non-empty 1D"):
+        CausalFilter(np.ones((2, 2)))
+
+
 @pytest.mark.parametrize("dc", (0, 100))
 @pytest.mark.parametrize("sfreq", (1000.0, 999.0))
 def test_smart_pad(dc, sfreq):
@@ -4,7 +4,7 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 
 from mne._ola import _COLA, _Interp2, _Storer
 
@@ -126,3 +126,31 @@ def test_cola(ndim):
                             cola.feed(signal[..., n_input : n_input + next_len])
                             n_input += next_len
                         assert_allclose(out, signal / 2.0, atol=1e-7)
+
+
+def test_cola_n_jobs():
+    """Test COLA processing with windows processed in threads."""
+    sfreq = 1000.0
+    rng = np.random.RandomState(0)
+    n_total, n_samples = 1001, 100
+    signal = rng.randn(2, n_total)
+    outs = dict()
+    for n_jobs in (1, 2, 3):
+        calls = list()
+
+        def processor(x, *, start, stop):
+            calls.append((start, stop))
+            return lambda: (x * (start + 1.0),)  # deferred, depends on start
+
+        out = np.zeros_like(signal)
+        cola = _COLA(
+            processor, out, n_total, n_samples, n_samples // 2, sfreq, n_jobs=n_jobs
+        )
+        for n_input in range(0, n_total, 37):
+            cola.feed(signal[:, n_input : n_input + 37])
+        assert cola._pool is None
+        assert len(cola._pending) == 0
+        outs[n_jobs] = (out, calls)
+    for n_jobs in (2, 3):
+        assert outs[n_jobs][1] == outs[1][1]
+        assert_array_equal(outs[n_jobs][0], outs[1][0])
@@ -28,6 +28,7 @@ from ..utils import (
     _check_pandas_index_arguments,
     _check_pandas_installed,
     _check_sphere,
+    _get_data_dtype,
     _time_mask,
     _validate_type,
     fill_doc,
@@ -465,6 +466,11 @@ class BaseSpectrum(ContainsMixin, UpdateChannelsMixin):
             psds, freqs = result
             self._data = psds
             self._weights = None
+        # single-precision data (or MNE_DATA_DTYPE='float32') give
+        # single-precision spectra
+        single = data.dtype in (np.float32, np.complex64)
+        dtype = _get_data_dtype(self._data.dtype, "float32" if single else None)
+        self._data = self._data.astype(dtype, copy=False)
         # assign properties (._data already assigned above)
         self._freqs = freqs
         # this is *expected* shape, it gets asserted later in _check_values()
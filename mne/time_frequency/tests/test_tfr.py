@@ -1184,6 +1184,18 @@ def test_compute_tfr_correct(method, decim):
     assert freqs[np.argmax(tfr.mean(-1))] == f
 
 
+@pytest.mark.parametrize("output", ("complex", "power", "avg_power_itc"))
+def test_compute_tfr_single_precision(output):
+    """Test that single-precision data give single-precision TFRs."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(3, 2, 500)
+    kwargs = dict(freqs=[10.0, 20.0], sfreq=250.0, n_cycles=2.0, output=output)
+    tfr_64 = tfr_array_morlet(data, **kwargs)
+    tfr_32 = tfr_array_morlet(data.astype(np.float32), **kwargs)
+    assert tfr_32.dtype == (np.float32 if output == "power" else np.complex64)
+    assert_allclose(tfr_32, tfr_64, rtol=1e-5, atol=1e-5 * np.abs(tfr_64).max())
+
+
 def test_averaging_epochsTFR():
     """Test that EpochsTFR averaging methods work."""
     # Setup for reading the raw data
@@ -40,6 +40,7 @@ from ..utils import (
     _convert_times,
     _ensure_events,
     _freq_mask,
+    _get_data_dtype,
     _import_h5io_funcs,
     _is_numeric,
     _pl,
@@ -576,6 +577,10 @@ def _compute_tfr(
         # avg_power_itc is stored as power + 1i * itc to keep a
         # simple dimensionality
         dtype = np.complex128
+    # single-precision data (or MNE_DATA_DTYPE='float32') give single-precision
+    # outputs, e.g., complex64 instead of complex128
+    single = epoch_data.dtype in (np.float32, np.complex64)
+    dtype = _get_data_dtype(dtype, "float32" if single else None)
 
     if ("avg_" in output) or ("itc" in output):
         out = np.empty((n_chans, n_freqs, n_times), dtype)
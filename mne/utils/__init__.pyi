@@ -10,6 +10,7 @@ __all__ = [
     "SizeMixin",
     "TimeMixin",
     "_DefaultEventParser",
+    "_DiskCache",
     "_PCA",
     "_ReuseCycle",
     "_TempDir",
@@ -26,6 +27,7 @@ __all__ = [
     "_check_channels_spatial_filter",
     "_check_combine",
     "_check_compensation_grade",
+    "_check_data_dtype",
     "_check_decim",
     "_check_depth",
     "_check_dict_keys",
@@ -75,6 +77,7 @@ __all__ = [
     "_get_argvalues",
     "_get_blas_funcs",
     "_get_call_line",
+    "_get_data_dtype",
     "_get_extra_data_path",
     "_get_inst_data",
     "_get_numpy_libs",
@@ -186,6 +189,7 @@ __all__ = [
     "wrapped_stdout",
 ]
 from ._bunch import Bunch, BunchConst, BunchConstNamed
+from ._disk_cache import _DiskCache
 from ._logging import (
     ClosingStringIO,
     _get_call_line,
@@ -231,6 +235,7 @@ from .check import (
     _check_channels_spatial_filter,
     _check_combine,
     _check_compensation_grade,
+    _check_data_dtype,
     _check_depth,
     _check_dict_keys,
     _check_edfio_installed,
@@ -261,6 +266,7 @@ from .check import (
     _check_time_format,
     _ensure_events,
     _ensure_int,
+    _get_data_dtype,
     _import_h5io_funcs,
     _import_h5py,
     _import_nibabel,
@@ -0,0 +1,191 @@
+"""On-disk caches of intermediate results."""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import hashlib
+import os
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+from ._logging import logger, warn
+from .config import get_config
+
+
+def _hash_cache_inputs(hasher, obj):
+    """Feed an object used to compute a cached result to a hash."""
+    if isinstance(obj, dict):  # includes Transform
+        hasher.update(f"dict{len(obj)}".encode())
+        for key in sorted(obj, key=str):
+            hasher.update(f"{key}=".encode())
+            _hash_cache_inputs(hasher, obj[key])
+    elif isinstance(obj, list | tuple):
+        hasher.update(f"seq{len(obj)}".encode())
+        for o in obj:
+            _hash_cache_inputs(hasher, o)
+    elif isinstance(obj, np.ndarray | np.generic):
+        obj = np.asarray(obj)
+        if obj.dtype.hasobject:
+            raise TypeError("Cannot hash object arrays")
+        hasher.update(f"array{obj.dtype.str}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, bool):
+        hasher.update(f"bool{obj}".encode())
+    elif isinstance(obj, int):  # includes named constants
+        hasher.update(f"int{int(obj)}".encode())
+    elif isinstance(obj, float):
+        hasher.update(f"float{float(obj)!r}".encode())
+    elif obj is None or isinstance(obj, str | slice):
+        hasher.update(f"{type(obj).__name__}{obj!r}".encode())
+    else:
+        raise TypeError(f"Cannot hash {type(obj)}")
+
+
+class _DiskCache:
+    """An on-disk cache of arrays stored in ``.npz`` files.
+
+    The files are written atomically, so that several processes can share a
+    cache directory, and unreadable files are ignored. After each write, the
+    least recently used files are removed so that the cache stays within
+    ``MNE_DISK_CACHE_SIZE`` megabytes.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache, used for the file names and messages.
+    config_key : str
+        The configuration value with the cache directory.
+    version : int
+        Bump when what is cached (or how) changes.
+    """
+
+    def __init__(self, name, config_key, version):
+        self.name = name
+        self.config_key = config_key
+        self.version = version
+        self.suffix = f"-{name}.npz"
+        self.stats = dict(hits=0, misses=0)
+        self._lock = Lock()
+
+    def get_dir(self):
+        """Get the cache directory, or None if caching is disabled."""
+        cache_dir = get_config(self.config_key)
+        return None if cache_dir is None else Path(cache_dir).expanduser()
+
+    def hash(self, *args):
+        """Hash the inputs of a computation (raises TypeError if impossible)."""
+        hasher = hashlib.sha1(f"{self.name}|{self.version}".encode())
+        _hash_cache_inputs(hasher, args)
+        return hasher.hexdigest()
+
+    def fname(self, cache_dir, key):
+        """Get the name of the file of a given key."""
+        return Path(cache_dir) / f"{key}{self.suffix}"
+
+    def glob(self, cache_dir):
+        """Get the files in a directory of the cache (not its subdirectories)."""
+        return sorted(Path(cache_dir).glob(f"*{self.suffix}"))
+
+    def count(self, kind):
+        """Count a hit or a miss."""
+        with self._lock:
+            self.stats[kind] += 1
+
+    def read(self, fname, select=None):
+        """Read the arrays of a file, or None if it is missing or unreadable.
+
+        With ``select``, ``select(npz)`` is returned instead, where ``npz``
+        loads arrays on access, so that only the needed ones are read. It can
+        return None, e.g., if the file does not contain what is needed.
+        """
+        try:
+            with np.load(fname, allow_pickle=False) as npz:
+                if select is None:
+                    out = {key: npz[key] for key in npz.files}
+                else:
+                    out = select(npz)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupted (or concurrently written)
+            logger.debug(f"    Could not read {self.name} cache file {fname}: {exc}")
+            return None
+        if out is None:
+            return None
+        try:  # mark as recently used
+            os.utime(fname)
+        except OSError:
+            pass
+        return out
+
+    def write(self, cache_dir, fname, **arrays):
+        """Write arrays to a file, then remove the least recently used files."""
+        tmp_fname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+        try:
+            fname.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_fname, "wb") as fid:
+                np.savez(fid, **arrays)
+            os.replace(tmp_fname, fname)
+        except OSError as exc:
+            warn(f"Could not write {self.name} cache file {fname}: {exc}")
+            tmp_fname.unlink(missing_ok=True)
+        else:
+            self._prune(cache_dir)
+
+    def _files(self, cache_dir):
+        """Get the modification time and size of all files of the cache."""
+        files = dict()
+        for fname in Path(cache_dir).rglob(f"*{self.suffix}"):
+            try:
+                stat = fname.stat()
+            except OSError:  # removed concurrently
+                continue
+            files[fname] = (stat.st_mtime, stat.st_size)
+        return files
+
+    def _prune(self, cache_dir):
+        """Remove the least recently used files beyond the maximum size."""
+        max_size = float(get_config("MNE_DISK_CACHE_SIZE", "1000")) * 1e6
+        files = self._files(cache_dir)
+        size = sum(s for _, s in files.values())
+        for fname in sorted(files, key=lambda f: files[f][0]):
+            if size <= max_size:
+                break
+            logger.debug(f"    Removing {self.name} cache file {fname.name}")
+            self._remove(cache_dir, fname)
+            size -= files[fname][1]
+
+    def _remove(self, cache_dir, fname):
+        """Remove a file and its subdirectory of the cache (if empty)."""
+        fname.unlink(missing_ok=True)
+        if fname.parent != Path(cache_dir):
+            try:  # only if empty
+                fname.parent.rmdir()
+            except OSError:
+                pass
+
+    def info(self):
+        """Get the cache directory, number and size of files, and statistics."""
+        cache_dir = self.get_dir()
+        files = dict()
+        if cache_dir is not None and cache_dir.is_dir():
+            files = self._files(cache_dir)
+        with self._lock:
+            return dict(
+                cache_dir=cache_dir,
+                n_files=len(files),
+                size=sum(s for _, s in files.values()),
+                **self.stats,
+            )
+
+    def clear(self):
+        """Remove all files of the cache and reset the statistics."""
+        info = self.info()
+        if info["cache_dir"] is not None and info["n_files"]:
+            logger.info(f"Removing {info['n_files']} file(s) from {info['cache_dir']}")
+            for fname in self._files(info["cache_dir"]):
+                self._remove(info["cache_dir"], fname)
+        with self._lock:
+            self.stats.update(hits=0, misses=0)
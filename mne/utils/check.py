@@ -356,6 +356,40 @@ def _check_preload(inst, msg):
             inst._handle_empty("raise", msg)
 
 
+def _check_data_dtype(dtype=None):
+    """Check the precision used to store data (see ``MNE_DATA_DTYPE``)."""
+    from .config import get_config
+
+    if dtype is None:
+        dtype = get_config("MNE_DATA_DTYPE", "float64")
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        dtype = None
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(
+            f"dtype must be None, 'float64', or 'float32', got {repr(dtype)}"
+        )
+    return dtype
+
+
+def _get_data_dtype(like, dtype=None):
+    """Get the dtype to store data of dtype ``like`` with the given precision.
+
+    Real data are stored as float64 or float32, and complex data as
+    complex128 or complex64. Data that are already in single precision stay
+    in single precision.
+    """
+    like = np.dtype(like)
+    single = _check_data_dtype(dtype) == np.float32 or like in (
+        np.float32,
+        np.complex64,
+    )
+    if np.issubdtype(like, np.complexfloating):
+        return np.dtype(np.complex64 if single else np.complex128)
+    return np.dtype(np.float32 if single else np.float64)
+
+
 def _check_compensation_grade(info1, info2, name1, name2="data", ch_names=None):
     """Ensure that objects have same compensation_grade."""
     from .._fiff.compensator import get_current_comp
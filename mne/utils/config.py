@@ -156,6 +156,10 @@ _known_config_types = {
     "MNE_COREG_SUBJECTS_DIR": "str, path to the subjects directory for mne coreg",
     "MNE_CUDA_DEVICE": "int, CUDA device to use for GPU processing",
     "MNE_DATA": "str, default data directory",
+    "MNE_DATA_DTYPE": (
+        "str, precision used to store loaded data, 'float64' (default) or "
+        "'float32' (complex data use complex128 or complex64, respectively)"
+    ),
     "MNE_DATASETS_BRAINSTORM_PATH": "str, path for brainstorm data",
     "MNE_DATASETS_EEGBCI_PATH": "str, path for EEGBCI data",
     "MNE_DATASETS_EPILEPSY_ECOG_PATH": "str, path for epilepsy_ecog data",
@@ -181,16 +185,66 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_DISK_CACHE_SIZE": (
+        "float, maximum size (in MB) of the files kept in each on-disk cache "
+        "directory (MNE_FIELD_MAP_CACHE_DIR, MNE_FORWARD_CACHE_DIR, and "
+        "MNE_MAXWELL_CACHE_DIR), the least recently used ones are removed first "
+        "(default 1000)"
+    ),
+    "MNE_FIELD_MAP_CACHE_DIR": (
+        "str, path to a directory used to cache the lead field dot products "
+        "used to map and interpolate MEG and EEG fields so that they can be "
+        "reused (disabled when unset)"
+    ),
+    "MNE_FIELD_MAP_CACHE_SIZE": (
+        "int, maximum number of lead field dot products used to map and "
+        "interpolate MEG and EEG fields kept in memory so that they can be "
+        "reused (default 10, 0 disables the in-memory cache), looked up when "
+        "the cache is first used and again after it is cleared"
+    ),
+    "MNE_FIFF_CACHE_DIR": (
+        "str, path to a directory used to cache the tag directory and tree of "
+        "FIF files so that they can be reopened faster (disabled when unset)"
+    ),
+    "MNE_FILTER_CACHE_SIZE": (
+        "int, maximum number of filter designs kept in memory so that they can be "
+        "reused (default 128, 0 disables the cache), looked up when the cache is "
+        "first used and again after it is cleared"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
+    "MNE_FORWARD_CACHE_DIR": (
+        "str, path to a directory used to cache the BEM field computation "
+        "matrices and gain matrices of forward solutions so that they can be "
+        "reused (disabled when unset)"
+    ),
+    "MNE_FORWARD_CHUNK_SIZE": (
+        "float, approximate memory budget (in MB) for the temporaries used to "
+        "compute forward solutions in chunks of source points (default 100), "
+        "looked up once per forward solution or dipole fit"
+    ),
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
         "decorated with @verbose. See "
         "https://mne.tools/stable/auto_tutorials/intro/50_configure_mne.html#logging"
     ),
+    "MNE_MAXWELL_CACHE_DIR": (
+        "str, path to a directory used to cache the SSS bases computed during "
+        "Maxwell filtering so that they can be reused (disabled when unset)"
+    ),
     "MNE_MEMMAP_MIN_SIZE": (
         "str, threshold on the minimum size of arrays passed to the workers that "
         "triggers automated memory mapping, e.g., 1M or 0.5G"
     ),
+    "MNE_READ_N_JOBS": (
+        "int, number of threads used to read non-preloaded raw data from "
+        "different files (e.g., split or concatenated files) concurrently, "
+        "looked up when an instance is first read from"
+    ),
+    "MNE_READ_PREFETCH": (
+        "bool, whether to read the next segment of non-preloaded raw data in a "
+        "background thread when segments are read sequentially, looked up when an "
+        "instance is first read from"
+    ),
     "MNE_REPR_HTML": (
         "bool, represent some of our objects with rich HTML in a notebook environment"
     ),
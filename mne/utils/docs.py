@@ -1236,6 +1236,18 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict["dtype_data"] = """
+dtype : str | None
+    The precision used to store the data, ``'float64'`` or ``'float32'``
+    (complex data are stored as ``complex128`` or ``complex64``,
+    respectively). Single precision halves the memory used, at the cost of
+    a relative precision of about ``1e-7``, which is ample for most
+    recordings. Numerically sensitive steps (e.g., covariance estimation)
+    are still computed in double precision. If None (default), the
+    ``MNE_DATA_DTYPE`` configuration value is used (see
+    :func:`mne.set_config`), which defaults to ``'float64'``.
+"""
+
 # %%
 # E
 
@@ -1829,7 +1841,8 @@ fmax : float
 docdict["fname_epochs"] = """
 fname : path-like | file-like
     The epochs to load. If a filename, should end with ``-epo.fif`` or
-    ``-epo.fif.gz``. If a file-like object, preloading must be used.
+    ``-epo.fif.gz`` (or ``-epo.h5`` for :func:`mne.read_epochs`, see
+    :meth:`mne.Epochs.save`). If a file-like object, preloading must be used.
 """
 
 docdict["fname_export_params"] = """
@@ -3010,6 +3023,27 @@ can set the default for your computer via
           of ``mne-qt-browser``.
 """
 
+docdict["notes_filter"] = """\
+``l_freq`` and ``h_freq`` are the frequencies below which and above
+which, respectively, to filter out of the data. Thus the uses are:
+
+    * ``l_freq < h_freq``: band-pass filter
+    * ``l_freq > h_freq``: band-stop filter
+    * ``l_freq is not None and h_freq is None``: high-pass filter
+    * ``l_freq is None and h_freq is not None``: low-pass filter
+
+``self.info['lowpass']`` and ``self.info['highpass']`` are only
+updated with picks=None.
+
+.. note:: If n_jobs > 1, more memory is required as
+          ``len(picks) * n_times`` additional time points need to
+          be temporarily stored in memory.
+
+For more information, see the tutorials
+:ref:`disc-filtering` and :ref:`tut-filter-resample` and
+:func:`mne.filter.create_filter`.
+"""
+
 _notes_plot_psd = """\
 This {} exists to support legacy code; for new code the preferred
 idiom is ``inst.compute_psd().plot()`` (where ``inst`` is an instance
@@ -3239,6 +3273,20 @@ origin : array-like, shape (3,) | str
     options or specifying the origin manually.
 """
 
+docdict["out_fname_raw"] = """
+out_fname : path-like | None
+    If not None, process the data chunk by chunk without loading them into
+    memory, write the result to this FIF file, and return it as a new
+    instance with ``preload=False``. The instance itself is not modified.
+
+    .. versionadded:: 1.13
+overwrite : bool
+    If True (default False), overwrite ``out_fname`` if it exists. Only used
+    when ``out_fname`` is not None.
+
+    .. versionadded:: 1.13
+"""
+
 docdict["out_type_clust"] = """
 out_type : 'mask' | 'indices'
     Output format of clusters within a list.
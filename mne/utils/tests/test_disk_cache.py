@@ -0,0 +1,71 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from mne._fiff.constants import FIFF
+from mne.utils import _DiskCache
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    """Test the on-disk cache of arrays."""
+    cache = _DiskCache("test", "MNE_TEST_CACHE_DIR", version=1)
+    assert cache.get_dir() is None
+    assert cache.info()["cache_dir"] is None
+    monkeypatch.setenv("MNE_TEST_CACHE_DIR", str(tmp_path))
+    assert cache.get_dir() == tmp_path
+    # hashing
+    key = cache.hash(np.arange(3.0), dict(a=1, b=[None, "x"]), slice(2))
+    assert key == cache.hash(np.arange(3.0), dict(b=[None, "x"], a=1), slice(2))
+    assert key != cache.hash(np.arange(3), dict(a=1, b=[None, "x"]), slice(2))
+    assert cache.hash(FIFF.FIFFV_COORD_HEAD) == cache.hash(4)
+    assert cache.hash(1) != cache.hash(1.0) != cache.hash(True)
+    assert key != _DiskCache("test", "", version=2).hash(
+        np.arange(3.0), dict(a=1, b=[None, "x"]), slice(2)
+    )
+    with pytest.raises(TypeError, match="object arrays"):
+        cache.hash(np.array([None]))
+    with pytest.raises(TypeError, match="Cannot hash"):
+        cache.hash(object())
+    # reading and writing
+    fnames = [cache.fname(tmp_path / "sub", str(ii)) for ii in range(3)]
+    assert fnames[0] == tmp_path / "sub" / "0-test.npz"
+    assert cache.read(fnames[0]) is None
+    for ii, fname in enumerate(fnames):
+        cache.write(tmp_path, fname, data=np.full(1000, float(ii)), idx=np.array(ii))
+        os.utime(fname, (ii, ii))
+    assert cache.glob(tmp_path) == []
+    assert cache.glob(tmp_path / "sub") == fnames
+    out = cache.read(fnames[0])
+    assert set(out) == {"data", "idx"}
+    assert_array_equal(out["data"], 0.0)
+    assert cache.read(fnames[1], lambda npz: npz["idx"]) == 1
+    assert cache.read(fnames[1], lambda npz: None) is None
+    fnames[2].write_bytes(b"0" * 10000)
+    assert cache.read(fnames[2]) is None
+    cache.count("hits")
+    cache.count("misses")
+    info = cache.info()
+    assert info["cache_dir"] == tmp_path
+    assert info["n_files"] == 3
+    assert info["hits"] == info["misses"] == 1
+    # the least recently used files are removed beyond the maximum size
+    size = 2 * fnames[0].stat().st_size  # room for 0 and the new one
+    monkeypatch.setenv("MNE_DISK_CACHE_SIZE", str(size / 1e6))
+    for ii, t in enumerate((10, 1, 2)):  # 0 is the most recently used
+        os.utime(fnames[ii], (t, t))
+    new_fname = cache.fname(tmp_path / "new", "3")
+    cache.write(tmp_path, new_fname, data=np.zeros(1000))
+    assert fnames[0].is_file()
+    assert not fnames[1].is_file()
+    assert not fnames[2].is_file()
+    assert new_fname.is_file()
+    # clearing
+    cache.clear()
+    assert cache.info() == dict(cache_dir=tmp_path, n_files=0, size=0, hits=0, misses=0)
+    assert not (tmp_path / "sub").exists()